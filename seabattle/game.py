@@ -1,33 +1,92 @@
 """Module with game class."""
 import logging
 import random
-from typing import Tuple, List, Dict, Any
+from typing import Tuple, List, Dict, Any, Type, Optional, Iterable, Set, Callable
 from uuid import UUID, uuid4
 from seabattle.game_errors.game_errors import StartedGameError, NotStartedGameError, NotYourTurnError
+from seabattle.game_objects.battlefield import BattleField
 from seabattle.game_objects.bot import EasyBot
+from seabattle.game_objects.cell import Cell
 from seabattle.game_objects.player import Player
-from seabattle.helpers.constants import SignObjects
-from seabattle.helpers.convertors import convert_coordinates
+from seabattle.helpers.constants import SignObjects, BoardFormat
+from seabattle.helpers.convertors import convert_coordinates, convert_rows_to_bitmasks, convert_rows_to_coordinates
 from seabattle.helpers.logger import get_logger
 
 
 class Game:
-    """Class with main game logic."""
+    """
+    Class with main game logic. Every change of battlefields increases state version and is stored in change log,
+    so game state can be returned only with cells that were changed since client's version.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
     id: UUID
     logger: logging.Logger
     player: Player
     enemy: EasyBot
     is_game_started: bool
     is_player_move: bool
+    version: int
+    changes: List[Tuple[Tuple[Tuple[int, int], ...], Tuple[Tuple[int, int], ...]]]
+    change_listener: Optional[Callable[["Game", str], None]]
 
-    def __init__(self):
+    def __init__(
+            self,
+            battlefield_class: Type[BattleField] = BattleField,
+            enemy_fleet_coordinates: Optional[List[List[Tuple[int, int]]]] = None,
+            logger: Optional[logging.Logger] = None
+    ):
         self.id = uuid4()
-        self.logger = get_logger(game_id=self.id, name="seabattle_game")
-        self.player = Player(player_name="Player", enemy_name="Enemy", logger=self.logger)
-        self.enemy = EasyBot(player_name="Enemy", enemy_name="Player", logger=self.logger)
+        self.logger = logger if logger is not None else get_logger(game_id=self.id, name="seabattle_game")
+        self.player = Player(player_name="Player", enemy_name="Enemy", logger=self.logger,
+                             battlefield_class=battlefield_class)
+        self.enemy = EasyBot(player_name="Enemy", enemy_name="Player", logger=self.logger,
+                             battlefield_class=battlefield_class, fleet_coordinates=enemy_fleet_coordinates)
+        self.player.set_enemy_battlefield(self.enemy.player_battlefield)
+        self.enemy.set_enemy_battlefield(self.player.player_battlefield)
         self.is_game_started = False
         self.is_player_move = random.choice([True, False])
         self.is_game_over = False
+        self.version = 0
+        self.changes = []
+        # Function, that is called with game and event type ('change' or 'start') after every state change.
+        self.change_listener = None
+
+    def assign_ids(self) -> None:
+        """Method assigns new game and player ids and creates game logger (for games that were created in advance)."""
+        self.id = uuid4()
+        self.player.id = uuid4()
+        self.enemy.id = uuid4()
+        self.logger = get_logger(game_id=self.id, name="seabattle_game")
+        self.player.logger = self.logger
+        self.enemy.logger = self.logger
+
+    def _register_changes(
+            self,
+            player_coordinates: Iterable[Tuple[int, int]] = (),
+            enemy_coordinates: Iterable[Tuple[int, int]] = ()
+    ) -> None:
+        """
+        Method adds changed cells to change log and increases state version.
+        Args:
+            player_coordinates: Coordinates of changed cells on player battlefield.
+            enemy_coordinates: Coordinates of changed cells on enemy battlefield.
+        """
+        self.changes.append((tuple(player_coordinates), tuple(enemy_coordinates)))
+        self.version = len(self.changes)
+        # Listener is checked here instead of _notify() call, as changes are registered for every shot.
+        if self.change_listener is not None:
+            self.change_listener(self, "change")
+
+    def _notify(self, event_type: str) -> None:
+        """
+        Method calls change listener, if it is set.
+        Args:
+            event_type: Type of state change.
+        """
+        if self.change_listener is not None:
+            self.change_listener(self, event_type)
 
     def _is_game_over(self):
         """Method checks if game for player is over based on its battlefield."""
@@ -35,32 +94,81 @@ class Game:
         if self.is_game_over:
             self.logger.info("Game is over.")
 
-    def player_shoot(self, coordinate: Tuple[int, int]) -> dict:
+    def player_shoot(
+            self,
+            coordinate: Tuple[int, int],
+            since_version: Optional[int] = None,
+            board_format: BoardFormat = BoardFormat.CELLS,
+            with_enemy_reply: bool = False
+    ) -> dict:
         """
         Method processes player shoot command.
         Args:
             coordinate: Tuple with coordinate for shooting.
+            since_version: State version, that client already has. If None, full game state is returned.
+            board_format: Format of battlefields in game state.
+            with_enemy_reply: If True and player missed, all consecutive enemy shots are made right after player shot
+                (turn mode). Game state contains ordered list of enemy shots.
 
         Returns:
             Dictionary with current game state information.
         """
+        # pylint: disable=too-many-arguments
         self.logger.info(f"Try to make player shoot with coordinate {coordinate}.")
         if self.is_game_started:
             if self.is_player_move:
-                shooting_results, is_killed = self.enemy.enemy_shooting(coordinate)
-                if shooting_results[coordinate].sign != SignObjects.hit_sign.sign:
-                    self.is_player_move = not self.is_player_move
-
-                self.player.shoot(shooting_results, is_killed)
-                self._is_game_over()
-
-                return self.return_game_state()
+                self._make_player_shot(coordinate)
+                if not with_enemy_reply:
+                    return self.return_game_state(since_version, board_format)
+                enemy_shots = {}
+                while not self.is_player_move and not self.is_game_over:
+                    enemy_coordinate = self._make_enemy_shot()
+                    self.logger.info(f"Use coordinate {enemy_coordinate} for shooting.")
+                    enemy_shots[enemy_coordinate] = self.player.player_battlefield.battlefield[enemy_coordinate]
+                return {
+                    **self.return_game_state(since_version, board_format),
+                    "enemy_shots": convert_coordinates(enemy_shots)
+                }
             raise NotYourTurnError("Right now is not your turn for shooting.")
         raise NotStartedGameError("Game is not started. Cannot shooting.")
 
-    def enemy_shoot(self) -> dict:
+    def _make_player_shot(self, coordinate: Tuple[int, int]) -> None:
+        """
+        Method makes one player shot on enemy battlefield.
+        Args:
+            coordinate: Tuple with coordinate for shooting.
+        """
+        shooting_results, is_killed = self.enemy.enemy_shooting(coordinate)
+        if shooting_results[coordinate].sign != SignObjects.hit_sign.sign:
+            self.is_player_move = not self.is_player_move
+
+        self.player.shoot(shooting_results, is_killed)
+        self._is_game_over()
+        self._register_changes(enemy_coordinates=shooting_results)
+
+    def _make_enemy_shot(self) -> Tuple[int, int]:
+        """
+        Method makes one enemy shot on player battlefield.
+
+        Returns:
+            Coordinate of enemy shot.
+        """
+        coordinate = self.enemy.choose_shooting_coordinate()
+        shooting_results, is_killed = self.player.enemy_shooting(coordinate)
+        if shooting_results[coordinate].sign != SignObjects.hit_sign.sign:
+            self.is_player_move = not self.is_player_move
+
+        self.enemy.shoot(shooting_results, is_killed)
+        self._is_game_over()
+        self._register_changes(player_coordinates=shooting_results)
+        return coordinate
+
+    def enemy_shoot(self, since_version: Optional[int] = None, board_format: BoardFormat = BoardFormat.CELLS) -> dict:
         """
         Method processes enemy shoot command.
+        Args:
+            since_version: State version, that client already has. If None, full game state is returned.
+            board_format: Format of battlefields in game state.
 
         Returns:
             Dictionary with current game state information.
@@ -68,21 +176,47 @@ class Game:
         self.logger.info("Try to make enemy shoot.")
         if self.is_game_started:
             if not self.is_player_move:
-                coordinate = self.enemy.choose_shooting_coordinate()
+                coordinate = self._make_enemy_shot()
                 self.logger.info(f"Use coordinate {coordinate} for shooting.")
-
-                shooting_results, is_killed = self.player.enemy_shooting(coordinate)
-                if shooting_results[coordinate].sign != SignObjects.hit_sign.sign:
-                    self.is_player_move = not self.is_player_move
-
-                self.enemy.shoot(shooting_results, is_killed)
-                self._is_game_over()
-
-                return self.return_game_state()
+                return self.return_game_state(since_version, board_format)
 
             raise NotYourTurnError("Right now is not your turn for shooting.")
         raise NotStartedGameError("Game is not started. Cannot shooting.")
 
+    def auto_play(
+            self,
+            max_moves: Optional[int] = None,
+            since_version: Optional[int] = None,
+            board_format: BoardFormat = BoardFormat.CELLS
+    ) -> dict:
+        """
+        Method plays the game for both sides with bot targeting until the game is over or number of moves is reached.
+        Move is one shot of any side.
+        Args:
+            max_moves: Maximum number of moves. If None, the game is played to completion.
+            since_version: State version, that client already has. If None, full game state is returned.
+            board_format: Format of battlefields in game state.
+
+        Returns:
+            Dictionary with current game state information and move log (ordered list of tuples with name of
+            shooting side, x, y and sign after the shot).
+        """
+        self.logger.info(f"Try to auto play the game for {max_moves if max_moves is not None else 'all'} moves.")
+        if not self.is_game_started:
+            raise NotStartedGameError("Game is not started. Cannot shooting.")
+        move_log: List[Tuple[str, int, int, str]] = []
+        while not self.is_game_over and (max_moves is None or len(move_log) < max_moves):
+            if self.is_player_move:
+                coordinate = self.player.choose_shooting_coordinate()
+                self._make_player_shot(coordinate)
+                shooter, battlefield = self.player, self.enemy.player_battlefield
+            else:
+                coordinate = self._make_enemy_shot()
+                shooter, battlefield = self.enemy, self.player.player_battlefield
+            move_log.append((shooter.player_battlefield.name, *coordinate, battlefield.battlefield[coordinate].sign))
+        self.logger.info(f"Auto play is finished after {len(move_log)} moves.")
+        return {**self.return_game_state(since_version, board_format), "move_log": move_log}
+
     def player_set_ship(
             self, coordinates: List[Tuple[int, int]]
     ) -> Dict[str, List[Dict[str, str]] | Dict[str, int]]:
@@ -97,6 +231,7 @@ class Game:
         self.logger.info(f"Try to add ship with coordinates {coordinates}")
         if not self.is_game_started:
             ship_coordinates = self.player.set_ship_coordinates(coordinates)
+            self._register_changes(player_coordinates=ship_coordinates)
             self.logger.info(f"Ship with coordinates {coordinates} was added.")
             return {
                 "player_ship_cells": convert_coordinates(ship_coordinates),
@@ -104,9 +239,57 @@ class Game:
             }
         raise StartedGameError("Cannot set a ship after game started")
 
-    def start_game(self) -> dict:
+    def player_set_fleet(
+            self, fleet_coordinates: List[List[Tuple[int, int]]]
+    ) -> Dict[str, List[Dict[str, str]] | Dict[str, int]]:
+        """
+        Method processes player set fleet command (all ships are added or none).
+        Args:
+            fleet_coordinates: List with coordinates for every ship.
+
+        Returns:
+            Dictionary with player ships information (coordinates and ship sign).
+        """
+        self.logger.info(f"Try to add fleet with coordinates {fleet_coordinates}")
+        if not self.is_game_started:
+            ship_coordinates = self.player.set_fleet_coordinates(fleet_coordinates)
+            self._register_changes(player_coordinates=ship_coordinates)
+            self.logger.info(f"Fleet with coordinates {fleet_coordinates} was added.")
+            return {
+                "player_ship_cells": convert_coordinates(ship_coordinates),
+                "player_fleet": self.player.player_battlefield.get_fleet_structure()
+            }
+        raise StartedGameError("Cannot set a ship after game started")
+
+    def player_auto_place_fleet(
+            self, fleet_coordinates: Optional[List[List[Tuple[int, int]]]] = None
+    ) -> Dict[str, List[Dict[str, str]] | Dict[str, int]]:
+        """
+        Method processes player auto place fleet command: all ships, that are not added yet, are placed the same way
+        as bot fleet.
+        Args:
+            fleet_coordinates: List with coordinates for every ship (pre-generated layout). If None, random
+                coordinates are generated.
+
+        Returns:
+            Dictionary with player ships information (coordinates and ship sign).
+        """
+        self.logger.info("Try to auto place player fleet.")
+        if not self.is_game_started:
+            ship_coordinates = self.player.auto_place_fleet(fleet_coordinates)
+            self._register_changes(player_coordinates=ship_coordinates)
+            self.logger.info("Player fleet was auto placed.")
+            return {
+                "player_ship_cells": convert_coordinates(ship_coordinates),
+                "player_fleet": self.player.player_battlefield.get_fleet_structure()
+            }
+        raise StartedGameError("Cannot set a ship after game started")
+
+    def start_game(self, board_format: BoardFormat = BoardFormat.CELLS) -> dict:
         """
         Method starts a game after player's command if there is all needed ships.
+        Args:
+            board_format: Format of battlefields in game state.
 
         Returns:
             Dictionary with current game state information.
@@ -117,15 +300,84 @@ class Game:
         if self.player.is_all_ships_added() and self.enemy.is_all_ships_added():
             self.logger.info("The game is started.")
             self.is_game_started = True
-            return self.return_game_state()
+            self._notify("start")
+            return self.return_game_state(board_format=board_format)
         raise NotStartedGameError("There are not all ships added. Cannot start a game.")
 
-    def return_game_state(self) -> Dict[str, Any]:
+    def _get_changed_cells(self, since_version: int) -> Tuple[Dict[Tuple[int, int], Cell], Dict[Tuple[int, int], Cell]]:
+        """
+        Method collects cells, that were changed after specified state version.
+        Args:
+            since_version: State version, that client already has.
+
+        Returns:
+            tuple: Dictionaries with changed cells of player and enemy battlefields.
+        """
+        player_coordinates: Set[Tuple[int, int]] = set()
+        enemy_coordinates: Set[Tuple[int, int]] = set()
+        for player_changes, enemy_changes in self.changes[since_version:]:
+            player_coordinates.update(player_changes)
+            enemy_coordinates.update(enemy_changes)
+        # Keep the same cells order as in full game state.
+        return (
+            {coordinate: self.player.player_battlefield.battlefield[coordinate]
+             for coordinate in sorted(player_coordinates, key=lambda coordinate: (coordinate[1], coordinate[0]))},
+            {coordinate: self.player.enemy_battlefield.battlefield[coordinate]
+             for coordinate in sorted(enemy_coordinates, key=lambda coordinate: (coordinate[1], coordinate[0]))}
+        )
+
+    def _get_boards(self, since_version: Optional[int], board_format: BoardFormat) -> Tuple[bool, Dict[str, Any]]:
+        """
+        Method converts player and enemy battlefields into specified format.
+        Args:
+            since_version: State version, that client already has (used only for cells format).
+            board_format: Format of battlefields.
+
+        Returns:
+            tuple: Boolean mark if only changed cells are returned, and dictionary with converted battlefields.
+        """
+        player_battlefield, enemy_battlefield = self.player.player_battlefield, self.player.enemy_battlefield
+        # Only cells format contains changed cells, compact formats are small enough to always contain the whole
+        # battlefields.
+        if board_format is BoardFormat.CELLS and since_version is not None and 0 <= since_version <= self.version:
+            player_cells, enemy_cells = self._get_changed_cells(since_version)
+            return True, {
+                "player_battle_field_cells": convert_coordinates(player_cells),
+                "enemy_battle_field_cells": convert_coordinates(enemy_cells),
+            }
+
+        # Whole battlefields are converted from rows with signs, so cell objects aren't created for every cell.
+        player_rows, enemy_rows = player_battlefield.get_rows(), enemy_battlefield.get_rows()
+        if board_format is BoardFormat.ROWS:
+            return False, {"player_battle_field_rows": player_rows, "enemy_battle_field_rows": enemy_rows}
+        if board_format is BoardFormat.BITMASK:
+            return False, {
+                "player_battle_field_masks": convert_rows_to_bitmasks(player_rows),
+                "enemy_battle_field_masks": convert_rows_to_bitmasks(enemy_rows),
+            }
+        return False, {
+            "player_battle_field_cells": convert_rows_to_coordinates(
+                player_rows, player_battlefield.width, player_battlefield.height
+            ),
+            "enemy_battle_field_cells": convert_rows_to_coordinates(
+                enemy_rows, enemy_battlefield.width, enemy_battlefield.height
+            ),
+        }
+
+    def return_game_state(
+            self, since_version: Optional[int] = None, board_format: BoardFormat = BoardFormat.CELLS
+    ) -> Dict[str, Any]:
         """
         Method collects current game state information.
+        Args:
+            since_version: State version, that client already has. If it is set, only cells that were changed after
+                this version are returned, else (or if version is unknown) all cells are returned.
+            board_format: Format of battlefields.
+
         Returns:
             Dictionary with current game state information.
         """
+        is_delta, boards = self._get_boards(since_version, board_format)
         winner = ""
         if self.player.is_game_over:
             winner = self.enemy.player_battlefield.name
@@ -136,9 +388,10 @@ class Game:
             "player_id": self.player.id,
             "is_player_move": self.is_player_move,
             "is_game_over": self.is_game_over,
-            "player_battle_field_cells": convert_coordinates(self.player.player_battlefield.get_battlefield()),
+            "state_version": self.version,
+            "is_delta": is_delta,
+            **boards,
             "player_fleet": self.player.player_battlefield.get_fleet_structure(),
-            "enemy_battle_field_cells": convert_coordinates(self.player.enemy_battlefield.get_battlefield()),
             "enemy_fleet": self.enemy.player_battlefield.get_fleet_structure(),
             "winner": winner
         }
@@ -11,3 +11,11 @@ class NoGameApiError(ApiError):
 
 class NoGamePlayerApiError(ApiError):
     """Raises if request contains player id that doesn't exist in game from storage."""
+
+
+class IdempotencyKeyApiError(ApiError):
+    """Raises if request contains idempotency key, that was already used for other request."""
+
+
+class GameBusyApiError(ApiError):
+    """Raises if game is locked by other request for longer than lock timeout."""
@@ -3,7 +3,8 @@ from typing import Tuple, List, Dict
 
 from seabattle.game_objects.cell import Cell
 from seabattle.game_objects.ship import Ship
-from seabattle.helpers.constants import SignObjects, AREA_AROUND, SHIP_NAMES, DEFAULT_BATTLEFIELD_END_COORD
+from seabattle.helpers.board_lookup import get_board_lookup
+from seabattle.helpers.constants import SignObjects, SHIP_NAMES, DEFAULT_BATTLEFIELD_END_COORD
 from seabattle.game_errors.battlefield_errors import BlockedAreaError, BlockedAreaAroundError, ShotCellEarlierError, \
     AreaOutsideBattleFieldError, CellNotExistError, ExtraShipInFleetError
 
@@ -24,9 +25,12 @@ class BattleField:
         self.name = name
         self.width = width
         self.height = height
-        self.battlefield = {(x, y): Cell(x=x, y=y) for y in range(self.height + 1) for x in range(self.width + 1)}
+        self.lookup = get_board_lookup(width, height)
+        self.battlefield = self._create_battlefield()
         self.__new_ships: list = self.create_initial_ships()
         self.ships: dict = {}
+        self.alive_ship_cells = 0
+        self.fleet_structure = {ship_name: 0 for ship_name in SHIP_NAMES.values()}
         self.is_game_over = False
         self.__is_visible = is_visible
 
@@ -38,6 +42,15 @@ class BattleField:
             return representation.replace(SignObjects.ship_sign.sign, SignObjects.empty_sign.sign)
         return representation
 
+    def _create_battlefield(self) -> Dict[Tuple[int, int], Cell]:
+        """
+        Method creates storage for battlefield cells (including border cells).
+
+        Returns:
+            Dictionary with tuple coordinates as keys and cells as values.
+        """
+        return {coordinate: Cell(*coordinate) for coordinate in self.lookup.coordinates}
+
     @staticmethod
     def create_initial_ships() -> list:
         """Method creates list of initial ships lengths."""
@@ -46,6 +59,17 @@ class BattleField:
             new_ships.extend([i for _ in range(0, ind + 1)])
         return new_ships
 
+    def is_on_board(self, coordinate: Tuple[int, int]) -> bool:
+        """
+        Method checks if coordinate belongs to the battlefield (including border cells).
+        Args:
+            coordinate: Cell coordinate.
+
+        Returns:
+            True if coordinate belongs to the battlefield, else False.
+        """
+        return 0 <= coordinate[0] <= self.width and 0 <= coordinate[1] <= self.height
+
     def _check_cell_coordinates(self, coordinates: List[Tuple[int, int]]) -> bool:
         """
         Method checks if cell with coordinate is inside the battlefield and not on border (lines with index 0 and -1).
@@ -76,22 +100,60 @@ class BattleField:
 
         Returns: True if empty, else False.
         """
-        return sum(sum(self.battlefield[(x + x_, y + y_)].sign == SignObjects.empty_sign.sign
-                       for x_, y_ in AREA_AROUND)
-                   for x, y in coordinates
-                   ) == len(coordinates) * len(AREA_AROUND)
+        return all(self.battlefield[neighbour].sign == SignObjects.empty_sign.sign
+                   for coordinate in coordinates for neighbour in self.lookup.around[coordinate])
+
+    def mark_missed_cells(self, coordinates: List[Tuple[int, int]]) -> None:
+        """
+        Method sets miss sign for all empty cells with specified coordinates.
+        Args:
+            coordinates: List of coordinates.
+        """
+        for coordinate in coordinates:
+            if self.battlefield[coordinate].sign == SignObjects.empty_sign.sign:
+                self.battlefield[coordinate].sign = SignObjects.miss_sign.sign
 
     def _game_is_over(self) -> None:
-        """Method checks if battlefield has ship signs."""
-        self.is_game_over = not sum(sign.sign == SignObjects.ship_sign.sign for sign in self.battlefield.values())
+        """Method checks if battlefield has ship cells that were not hit."""
+        self.is_game_over = not self.alive_ship_cells
 
     def _exclude_new_ship_from_list(self, number_of_cells: int) -> None:
         self.__new_ships.remove(number_of_cells)
 
+    def _register_ship(self, ship: Ship) -> None:
+        """
+        Method adds created ship to the battlefield fleet.
+        Args:
+            ship: Ship object.
+        """
+        self.ships.update({ship.id: ship})
+        self.alive_ship_cells += len(ship.ship)
+        self.fleet_structure[ship.name] += 1
+
+    def _register_hit(self, ship_id) -> bool:
+        """
+        Method updates fleet counters after hit in the ship.
+        Args:
+            ship_id: ID of the ship that was hit.
+
+        Returns:
+            True, if the ship was sunk.
+        """
+        self.alive_ship_cells -= 1
+        ship = self.ships[ship_id]
+        if ship.register_hit():
+            return False
+        self.fleet_structure[ship.name] -= 1
+        return True
+
     def is_all_ships_added(self) -> bool:
         """Method checks if all ships were added to the battlefield."""
         return not self.__new_ships
 
+    def get_new_ships(self) -> List[int]:
+        """Method returns lengths of ships, that are not added to the battlefield yet."""
+        return list(self.__new_ships)
+
     def set_ship_coordinates(self, coordinates: List[Tuple[int, int]]) -> Dict[Tuple[int, int], Cell]:
         """
         Method sets ship signs with specified coordinates.
@@ -111,15 +173,64 @@ class BattleField:
             raise BlockedAreaAroundError(f"Area around coordinates: {coordinates} is not empty")
 
         ship_len = len(coordinates)
-        if ship_len in self.__new_ships:
-            ship = Ship({coordinate: self.battlefield[coordinate] for coordinate in coordinates})
-            self._exclude_new_ship_from_list(ship_len)
-        else:
+        if ship_len not in self.__new_ships:
             raise ExtraShipInFleetError(f"Couldn't add ship with such size: {ship_len}")
+        return self._add_ship(coordinates)
 
-        self.ships.update({ship.id: ship})
+    def _add_ship(self, coordinates: List[Tuple[int, int]]) -> Dict[Tuple[int, int], Cell]:
+        """
+        Method creates ship with checked coordinates and adds it to the fleet.
+        Args:
+            coordinates: List of coordinates.
+
+        Returns:
+            Dictionary with coordinates as keys and cell as values.
+        """
+        ship = Ship({coordinate: self.battlefield[coordinate] for coordinate in coordinates}, len(self.ships))
+        self._exclude_new_ship_from_list(len(coordinates))
+        self._register_ship(ship)
         return ship.ship
 
+    def _check_fleet_coordinates(self, fleet_coordinates: List[List[Tuple[int, int]]]) -> None:
+        """
+        Method checks the whole fleet layout in one pass before any ship is added: every ship should be inside
+        the battlefield, have correct shape and size, and shouldn't touch ships on the battlefield or other new ships.
+        Args:
+            fleet_coordinates: List with coordinates for every ship.
+        """
+        new_ships = list(self.__new_ships)
+        occupied = {coordinate for ship in self.ships.values() for coordinate in ship.ship}
+        blocked = self.lookup.get_ship_halo(occupied)
+        for coordinates in fleet_coordinates:
+            if not self._check_cell_coordinates(coordinates):
+                raise AreaOutsideBattleFieldError(f"Area with coordinates: {coordinates} is outside the battlefield."
+                                                  f"Should be inside x - 1:{self.width - 1}, y - 1:{self.height - 1}")
+            Ship.check_coordinates(coordinates)
+            if not occupied.isdisjoint(coordinates):
+                raise BlockedAreaError(f"Area with coordinates: {coordinates} is not empty.")
+            if not blocked.isdisjoint(coordinates):
+                raise BlockedAreaAroundError(f"Area around coordinates: {coordinates} is not empty")
+            if len(coordinates) not in new_ships:
+                raise ExtraShipInFleetError(f"Couldn't add ship with such size: {len(coordinates)}")
+            new_ships.remove(len(coordinates))
+            occupied.update(coordinates)
+            blocked.update(self.lookup.get_ship_halo(coordinates))
+
+    def set_fleet_coordinates(self, fleet_coordinates: List[List[Tuple[int, int]]]) -> Dict[Tuple[int, int], Cell]:
+        """
+        Method sets several ships at once. The whole layout is checked first, so all ships are added or none.
+        Args:
+            fleet_coordinates: List with coordinates for every ship.
+
+        Returns:
+            Dictionary with coordinates as keys and cell as values (cells of all added ships).
+        """
+        self._check_fleet_coordinates(fleet_coordinates)
+        ship_cells: Dict[Tuple[int, int], Cell] = {}
+        for coordinates in fleet_coordinates:
+            ship_cells.update(self._add_ship(coordinates))
+        return ship_cells
+
     def shoot(self, coordinate: Tuple[int, int]) -> Tuple[dict[Tuple[int, int], Cell], bool]:
         """
         Method contains logic for shooting and changing marks on battlefield.
@@ -128,27 +239,26 @@ class BattleField:
         Returns:
             str: Updated cells after shooting for coordinate and bool value if the ship was killed.
         """
-        x, y = coordinate
-        if self.battlefield.get(coordinate) is None:
+        cell = self.battlefield.get(coordinate)
+        if cell is None:
             raise CellNotExistError(f"Cell with coordinate {coordinate} is not exist.")
-        if not self._check_cell_coordinates([coordinate]):
+        if not (0 < coordinate[0] < self.width and 0 < coordinate[1] < self.height):
             raise AreaOutsideBattleFieldError(f"Area with coordinates: {coordinate} is outside the battlefield."
                                               f"Should be inside x - 1:{self.width - 1}, y - 1:{self.height - 1}")
-        if self.battlefield[(x, y)].sign == SignObjects.empty_sign.sign:
-            self.battlefield[(x, y)].sign = SignObjects.miss_sign.sign
-        elif self.battlefield[(x, y)].sign == SignObjects.ship_sign.sign:
-            self.battlefield[(x, y)].sign = SignObjects.hit_sign.sign
+        if cell.sign == SignObjects.empty_sign.sign:
+            cell.sign = SignObjects.miss_sign.sign
+        elif cell.sign == SignObjects.ship_sign.sign:
+            cell.sign = SignObjects.hit_sign.sign
         else:
             raise ShotCellEarlierError(f"Cell with coordinate {coordinate} was shot already.")
 
         # Get ship id and check if ship is still alive.
-        ship_id = self.battlefield[(x, y)].ship_id
         is_killed = False
-        if ship_id is not None:
-            is_killed = not self.ships[ship_id].is_ship_alive()
-
-        self._game_is_over()
-        return {coordinate: self.battlefield[coordinate]}, is_killed
+        if cell.ship_id is not None:
+            is_killed = self._register_hit(cell.ship_id)
+            # The same as _game_is_over(), only hit can change it.
+            self.is_game_over = not self.alive_ship_cells
+        return {coordinate: cell}, is_killed
 
     def get_fleet_structure(self) -> Dict[str, int]:
         """
@@ -157,11 +267,7 @@ class BattleField:
         Returns:
             Dictionary with ship name as key and number of such ships that still alive.
         """
-        fleet_structure = {ship_name: 0 for ship_name in SHIP_NAMES.values()}
-        for ship in self.ships.values():
-            fleet_structure[SHIP_NAMES[len(ship.ship)]] += ship.is_alive
-
-        return fleet_structure
+        return dict(self.fleet_structure)
 
     def get_battlefield(self) -> Dict[Tuple[int, int], Cell]:
         """
@@ -170,5 +276,15 @@ class BattleField:
         Returns:
             Dictionary with tuple coordinates as key and cell as value.
         """
-        return {coord: cell for coord, cell in self.battlefield.items()
-                if (1 <= coord[0] < self.width and 1 <= coord[1] < self.height)}
+        battlefield = self.battlefield
+        return {coordinate: battlefield[coordinate] for coordinate in self.lookup.inner_coordinates}
+
+    def get_rows(self) -> str:
+        """
+        Method collects signs of cells, that end user should see, into row-major string.
+
+        Returns:
+            String with (width - 1) * (height - 1) signs, row by row.
+        """
+        battlefield = self.battlefield
+        return "".join(battlefield[coordinate].sign for coordinate in self.lookup.inner_coordinates)
@@ -0,0 +1,196 @@
+"""Module for creation battlefield that keeps its state in integer bitmasks."""
+from typing import Tuple, List, Dict
+
+from seabattle.game_objects.battlefield import BattleField
+from seabattle.game_objects.cell import Cell
+from seabattle.game_objects.cell_view import CellView, create_cell_views
+from seabattle.helpers.constants import SignObjects
+from seabattle.game_errors.battlefield_errors import ShotCellEarlierError, AreaOutsideBattleFieldError, \
+    CellNotExistError
+
+
+class BitBoardBattleField(BattleField):
+    """
+    Class contains battlefield, that stores ship, hit and miss layers as integer bitmasks.
+    Cell index is y * (width + 1) + x, border cells are included.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, *args, **kwargs):
+        self._ship_mask = 0
+        self._hit_mask = 0
+        self._miss_mask = 0
+        self.cell_ships: dict = {}
+        self.is_game_over = False
+        super().__init__(*args, **kwargs)
+        self._inner_mask, self._halo_masks = self.lookup.inner_mask, self.lookup.halo_masks
+        self._cell_bits = self.lookup.cell_bits
+
+    def _create_battlefield(self) -> Dict[Tuple[int, int], CellView]:  # type: ignore[override]
+        """
+        Method creates cell views for bitboard layers.
+
+        Returns:
+            Dictionary with tuple coordinates as keys and cell views as values.
+        """
+        return create_cell_views(self)
+
+    def get_cell_key(self, coordinate: Tuple[int, int]) -> int:
+        """
+        Method converts coordinate into cell bit, that is used as a key by cell views.
+        Args:
+            coordinate: Cell coordinate.
+
+        Returns:
+            Cell bit.
+        """
+        # Views are created in parent constructor, before shortcuts to lookup tables are set.
+        return self.lookup.cell_bits[coordinate]
+
+    def get_index(self, coordinate: Tuple[int, int]) -> int:
+        """
+        Method converts coordinate into bit index.
+        Args:
+            coordinate: Cell coordinate.
+
+        Returns:
+            Bit index of the cell.
+        """
+        return self.lookup.get_index(coordinate)
+
+    def _get_mask(self, coordinates: List[Tuple[int, int]]) -> int:
+        """
+        Method converts list of coordinates into bitmask.
+        Args:
+            coordinates: List of coordinates.
+
+        Returns:
+            Bitmask with bits for all coordinates.
+        """
+        mask, cell_bits = 0, self._cell_bits
+        for coordinate in coordinates:
+            mask |= cell_bits[coordinate]
+        return mask
+
+    def get_sign(self, bit: int) -> str:
+        """
+        Method defines cell sign based on bitboard layers.
+        Args:
+            bit: Cell bit.
+
+        Returns:
+            Cell sign.
+        """
+        if self._hit_mask & bit:
+            return SignObjects.hit_sign.sign
+        if self._miss_mask & bit:
+            return SignObjects.miss_sign.sign
+        if self._ship_mask & bit:
+            return SignObjects.ship_sign.sign
+        return SignObjects.empty_sign.sign
+
+    def set_sign(self, bit: int, sign: str) -> None:
+        """
+        Method updates bitboard layers with new cell sign. Hit cells always stay in ship layer.
+        Args:
+            bit: Cell bit.
+            sign: New cell sign.
+        """
+        self._hit_mask &= ~bit
+        self._miss_mask &= ~bit
+        if sign == SignObjects.hit_sign.sign:
+            self._hit_mask |= bit
+            self._ship_mask |= bit
+        elif sign == SignObjects.ship_sign.sign:
+            self._ship_mask |= bit
+        else:
+            self._ship_mask &= ~bit
+            if sign == SignObjects.miss_sign.sign:
+                self._miss_mask |= bit
+
+    def _check_empty_area(self, coordinates: List[Tuple[int, int]]) -> bool:
+        """
+        Method checks if area with coordinates is empty.
+        Args:
+            coordinates: List of coordinates.
+
+        Returns: True if empty, else False.
+        """
+        return not self._get_mask(coordinates) & (self._ship_mask | self._miss_mask)
+
+    def _check_empty_area_around(self, coordinates: List[Tuple[int, int]]):
+        """
+        Method checks if area around (one cell around) coordinates is empty.
+        Args:
+            coordinates: List of coordinates.
+
+        Returns: True if empty, else False.
+        """
+        halo_mask = 0
+        for coordinate in coordinates:
+            halo_mask |= self._halo_masks[self.get_index(coordinate)]
+        return not halo_mask & (self._ship_mask | self._miss_mask)
+
+    def mark_missed_cells(self, coordinates: List[Tuple[int, int]]) -> None:
+        """
+        Method sets miss sign for all empty cells with specified coordinates.
+        Args:
+            coordinates: List of coordinates.
+        """
+        self._miss_mask |= self._get_mask(coordinates) & ~(self._ship_mask | self._miss_mask)
+
+    def shoot(self, coordinate: Tuple[int, int]) -> Tuple[dict[Tuple[int, int], Cell], bool]:
+        """
+        Method contains logic for shooting and changing marks on battlefield.
+        Args:
+            coordinate: Coordinate for shooting.
+        Returns:
+            str: Updated cells after shooting for coordinate and bool value if the ship was killed.
+        """
+        if not self.is_on_board(coordinate):
+            raise CellNotExistError(f"Cell with coordinate {coordinate} is not exist.")
+        bit = self._cell_bits[coordinate]
+        if not self._inner_mask & bit:
+            raise AreaOutsideBattleFieldError(f"Area with coordinates: {coordinate} is outside the battlefield."
+                                              f"Should be inside x - 1:{self.width - 1}, y - 1:{self.height - 1}")
+        if (self._hit_mask | self._miss_mask) & bit:
+            raise ShotCellEarlierError(f"Cell with coordinate {coordinate} was shot already.")
+
+        is_killed = False
+        if self._ship_mask & bit:
+            self._hit_mask |= bit
+            is_killed = self._register_hit(self.cell_ships[bit])
+            # The same as _game_is_over(), only hit can change it.
+            self.is_game_over = not self.alive_ship_cells
+        else:
+            self._miss_mask |= bit
+
+        return {coordinate: self.battlefield[coordinate]}, is_killed
+
+    def get_battlefield(self) -> Dict[Tuple[int, int], Cell]:
+        """
+        Method filters battlefield coordinates (returns only cells that end user should see).
+
+        Returns:
+            Dictionary with tuple coordinates as keys and cell views as values.
+        """
+        battlefield = self.battlefield
+        return {coordinate: battlefield[coordinate] for coordinate in self.lookup.inner_coordinates}
+
+    def get_rows(self) -> str:
+        """
+        Method collects signs of cells, that end user should see, into row-major string directly from bitboard
+        layers (the same as get_sign() for every cell, inlined as it is called for every game state).
+
+        Returns:
+            String with (width - 1) * (height - 1) signs, row by row.
+        """
+        hit_mask, miss_mask, ship_mask = self._hit_mask, self._miss_mask, self._ship_mask
+        hit_sign, miss_sign = SignObjects.hit_sign.sign, SignObjects.miss_sign.sign
+        ship_sign, empty_sign = SignObjects.ship_sign.sign, SignObjects.empty_sign.sign
+        return "".join(
+            hit_sign if hit_mask & bit else miss_sign if miss_mask & bit else ship_sign if ship_mask & bit
+            else empty_sign
+            for bit in self.lookup.inner_bits
+        )
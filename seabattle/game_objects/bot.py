@@ -1,57 +1,34 @@
 """Module contains bot objects."""
 import logging
-import random
-from copy import deepcopy
-from typing import Tuple, List, Dict, Optional
+from typing import Optional, Type, List, Tuple
+from seabattle.game_objects.battlefield import BattleField
 from seabattle.game_objects.player import Player
-from seabattle.helpers.constants import AREA_AROUND
 
 
 class EasyBot(Player):
     """Class contains logic for the simplest bot."""
 
-    def __init__(self, player_name: str, enemy_name: str, logger: Optional[logging.Logger] = None):
-        super().__init__(player_name, enemy_name, logger)
-        self._fill_bot_battlefield()
+    def __init__(
+            self,
+            player_name: str,
+            enemy_name: str,
+            logger: Optional[logging.Logger] = None,
+            battlefield_class: Type[BattleField] = BattleField,
+            fleet_coordinates: Optional[List[List[Tuple[int, int]]]] = None
+    ):
 
-    @staticmethod
-    def _create_bot_ship_coordinates(ship_len: int, empty_cells: Dict[Tuple[int, int], int]) -> List[Tuple[int, int]]:
-        """
-        Method creates list of possible coordinates for ship with specified length according to correctly available
-        cells.
-        Args:
-            ship_len: Length of ship.
-            empty_cells: Dictionary with coordinates of empty cells for bot battlefield.
+        # pylint: disable=too-many-arguments
 
-        Returns:
-            list: The random coordinates for ship from list of all possible coordinates.
-        """
-        list_of_coordinates = []
-        for x, y in empty_cells.keys():
-            for dimension in [(1, 0), (0, 1)]:
-                is_coordinates_empty = [empty_cells.get((x + i * dimension[0], y + i * dimension[1]))
-                                        for i in range(ship_len)]
-                if None not in is_coordinates_empty:
-                    list_of_coordinates.append([(x + i * dimension[0], y + i * dimension[1]) for i in range(ship_len)])
-        return random.choice(list_of_coordinates)
+        super().__init__(player_name, enemy_name, logger, battlefield_class)
+        self._fill_bot_battlefield(fleet_coordinates)
 
-    @staticmethod
-    def _clear_not_empty_coordinates(coordinates: List[Tuple[int, int]], empty_cells: dict):
+    def _fill_bot_battlefield(self, fleet_coordinates: Optional[List[List[Tuple[int, int]]]] = None):
         """
-        Method clears not empty cells from the dictionary with empty cells.
+        Method creates the full flotilla of ships for bot battlefield.
         Args:
-            coordinates: Ship coordinates.
-            empty_cells: Dictionary with coordinates of empty cells for bot battlefield.
+            fleet_coordinates: List with coordinates for every ship (pre-generated layout). If None, random
+                coordinates are generated.
         """
-        for x, y in coordinates:
-            _ = [empty_cells.pop((x + x_, y + y_), None) for x_, y_ in [(0, 0)] + AREA_AROUND]
-
-    def _fill_bot_battlefield(self):
-        """Method creates the full flotilla of ships for bot battlefield with random coordinates."""
         self.logger.info("Start adding ships for bot flotilla.")
-        empty_cells = {key: 1 for key in self.coordinates_for_shooting}
-        for ship_len in deepcopy(self.player_battlefield.create_initial_ships()):
-            coordinates = self._create_bot_ship_coordinates(ship_len, empty_cells)
-            self.player_battlefield.set_ship_coordinates(coordinates)
-            self._clear_not_empty_coordinates(coordinates, empty_cells)
+        self.auto_place_fleet(fleet_coordinates)
         self.logger.info("End adding ships for bot flotilla.")
@@ -1,18 +1,17 @@
 """"Module for creation cell objects."""
 from dataclasses import dataclass
 from typing import Optional
-from uuid import UUID
 
 from seabattle.helpers.constants import SignObjects
 
 
-@dataclass
+@dataclass(slots=True)
 class Cell:
     """Class contains cell object and its methods."""
     x: int
     y: int
     sign: str
-    ship_id: Optional[UUID]
+    ship_id: Optional[int]
 
     def __init__(self, x: int, y: int, sign: str = SignObjects.empty_sign.sign):
         self.x = x
@@ -0,0 +1,58 @@
+"""Module for creation cell views over battlefields that don't keep cell objects."""
+from typing import Any, Dict, Tuple
+
+from seabattle.game_objects.cell import Cell
+
+
+class CellView(Cell):
+    """
+    Class contains cell view, that reads and writes its sign and ship id from the battlefield storage.
+    Battlefield should implement get_cell_key, get_sign, set_sign methods and cell_ships attribute.
+    """
+
+    __slots__ = ("_battlefield", "_key")
+
+    # pylint: disable=super-init-not-called
+
+    def __init__(self, battlefield: Any, x: int, y: int):
+        self._battlefield = battlefield
+        self._key = battlefield.get_cell_key((x, y))
+        self.x = x
+        self.y = y
+
+    def __eq__(self, other):
+        if not isinstance(other, Cell):
+            return NotImplemented
+        return (self.x, self.y, self.sign, self.ship_id) == (other.x, other.y, other.sign, other.ship_id)
+
+    @property  # type: ignore[override]
+    def sign(self) -> str:
+        """Method returns cell sign from battlefield storage."""
+        return self._battlefield.get_sign(self._key)
+
+    @sign.setter
+    def sign(self, sign: str) -> None:
+        self._battlefield.set_sign(self._key, sign)
+
+    @property  # type: ignore[override]
+    def ship_id(self):
+        """Method returns id of the ship, that occupies the cell."""
+        return self._battlefield.cell_ships.get(self._key)
+
+    @ship_id.setter
+    def ship_id(self, ship_id) -> None:
+        self._battlefield.cell_ships[self._key] = ship_id
+
+
+def create_cell_views(battlefield: Any) -> Dict[Tuple[int, int], CellView]:
+    """
+    Method creates cell views for all coordinates of the battlefield (including border cells). View doesn't keep cell
+    state, so views are created once with the battlefield, and cells are looked up in plain dictionary as cells of
+    dict battlefield.
+    Args:
+        battlefield: Battlefield object.
+
+    Returns:
+        Dictionary with tuple coordinates as keys and cell views as values.
+    """
+    return {coordinate: CellView(battlefield, *coordinate) for coordinate in battlefield.lookup.coordinates}
@@ -0,0 +1,89 @@
+"""Module for creation enemy view over opponent's battlefield."""
+from collections.abc import Mapping
+from typing import Tuple, Dict, Iterator
+
+from seabattle.game_objects.battlefield import BattleField
+from seabattle.game_objects.cell import Cell
+from seabattle.helpers.constants import SignObjects
+
+
+def mask_cell(cell: Cell) -> Cell:
+    """
+    Method creates copy of the cell, that player can see on enemy battlefield (ships that weren't hit are hidden).
+    Args:
+        cell: Cell from opponent's battlefield.
+
+    Returns:
+        New cell without ship id.
+    """
+    if cell.sign == SignObjects.ship_sign.sign:
+        return Cell(x=cell.x, y=cell.y)
+    return Cell(x=cell.x, y=cell.y, sign=cell.sign)
+
+
+class MaskedCells(Mapping):
+    """Class contains read-only mapping of coordinates to masked cells of opponent's battlefield."""
+
+    def __init__(self, battlefield: BattleField):
+        self._battlefield = battlefield
+
+    def __getitem__(self, coordinate: Tuple[int, int]) -> Cell:
+        return mask_cell(self._battlefield.battlefield[coordinate])
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return iter(self._battlefield.battlefield)
+
+    def __len__(self) -> int:
+        return len(self._battlefield.battlefield)
+
+
+class EnemyView:
+    """
+    Class contains read-only projection of opponent's battlefield, that player sees as enemy battlefield.
+    Cells are read from opponent's battlefield on every access, so view doesn't keep its own state.
+    """
+
+    def __init__(self, battlefield: BattleField):
+        self.source = battlefield
+        self.battlefield = MaskedCells(battlefield)
+
+    def __repr__(self):
+        return repr(self.source).replace(SignObjects.ship_sign.sign, SignObjects.empty_sign.sign)
+
+    @property
+    def name(self) -> str:
+        """Method returns name of opponent's battlefield."""
+        return self.source.name
+
+    @property
+    def width(self) -> int:
+        """Method returns width of opponent's battlefield."""
+        return self.source.width
+
+    @property
+    def height(self) -> int:
+        """Method returns height of opponent's battlefield."""
+        return self.source.height
+
+    def get_battlefield(self) -> Dict[Tuple[int, int], Cell]:
+        """
+        Method filters battlefield coordinates (returns only cells that end user should see).
+
+        Returns:
+            Dictionary with tuple coordinates as key and masked cell as value.
+        """
+        # The same as mask_cell() for every cell, inlined as the whole battlefield is masked for every game state.
+        ship_sign, empty_sign = SignObjects.ship_sign.sign, SignObjects.empty_sign.sign
+        return {
+            coordinate: Cell(cell.x, cell.y, empty_sign if (sign := cell.sign) == ship_sign else sign)
+            for coordinate, cell in self.source.get_battlefield().items()
+        }
+
+    def get_rows(self) -> str:
+        """
+        Method collects signs of cells, that end user should see, into row-major string.
+
+        Returns:
+            String with signs, row by row (ships that weren't hit are hidden).
+        """
+        return self.source.get_rows().replace(SignObjects.ship_sign.sign, SignObjects.empty_sign.sign)
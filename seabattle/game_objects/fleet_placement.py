@@ -0,0 +1,136 @@
+"""Module contains engine for random fleet placement."""
+from collections import Counter
+from functools import lru_cache
+from typing import Tuple, List, Dict, Iterable, Set
+
+from seabattle.helpers.board_lookup import get_board_lookup
+from seabattle.helpers.indexed_set import IndexedSet
+
+Coordinate = Tuple[int, int]
+
+
+class PlacementTables:
+    """
+    Class contains precomputed tables for the board size: all ship placements for every ship length,
+    and placements that cover every cell.
+    """
+
+    def __init__(self, width: int, height: int, ship_lens: Tuple[int, ...]):
+        self.lookup = get_board_lookup(width, height)
+        self.placements: Dict[int, List[Tuple[Coordinate, ...]]] = {}
+        self.cell_placements: Dict[Coordinate, List[Tuple[int, int]]] = {
+            coordinate: [] for coordinate in sorted(self.lookup.inner_coordinates)
+        }
+        for ship_len in ship_lens:
+            placements = []
+            for x, y in self.cell_placements:
+                for dimension in ([(1, 0), (0, 1)] if ship_len > 1 else [(1, 0)]):
+                    placement = tuple((x + i * dimension[0], y + i * dimension[1]) for i in range(ship_len))
+                    if all(coordinate in self.cell_placements for coordinate in placement):
+                        placements.append(placement)
+            self.placements[ship_len] = placements
+            for placement_id, placement in enumerate(placements):
+                for coordinate in placement:
+                    self.cell_placements[coordinate].append((ship_len, placement_id))
+        self.alive_placements = {
+            ship_len: IndexedSet(range(len(placements))) for ship_len, placements in self.placements.items()
+        }
+
+
+@lru_cache(maxsize=None)
+def get_placement_tables(width: int, height: int, ship_lens: Tuple[int, ...]) -> PlacementTables:
+    """
+    Method creates placement tables for the board size (only once for every size and set of ships).
+    Args:
+        width: Battlefield width (index of the right border column).
+        height: Battlefield height (index of the bottom border row).
+        ship_lens: Unique ship lengths.
+
+    Returns:
+        PlacementTables object.
+    """
+    return PlacementTables(width, height, ship_lens)
+
+
+class FleetPlacement:
+    """
+    Class contains random fleet placement on the board. Every ship is chosen uniformly from placements that are
+    still valid, and placements blocked by the new ship are invalidated incrementally.
+    Placements are tracked only for ship lengths that still have ships to place.
+    """
+
+    def __init__(self, width: int, height: int, ship_lens: Iterable[int]):
+        self.ships_to_place = Counter(ship_lens)
+        self.tables = get_placement_tables(width, height, tuple(sorted(self.ships_to_place)))
+        self.alive_placements = {
+            ship_len: placements.copy() for ship_len, placements in self.tables.alive_placements.items()
+        }
+        self.blocked_cells: Set[Coordinate] = set()
+
+    def block(self, coordinates: List[Coordinate]) -> None:
+        """
+        Method blocks ship cells and cells around it, and invalidates placements that use these cells.
+        Args:
+            coordinates: Ship coordinates.
+        """
+        for ship_coordinate in coordinates:
+            for coordinate in self.tables.lookup.halo[ship_coordinate]:
+                if coordinate in self.blocked_cells:
+                    continue
+                self.blocked_cells.add(coordinate)
+                for ship_len, placement_id in self.tables.cell_placements.get(coordinate, []):
+                    if ship_len in self.alive_placements:
+                        self.alive_placements[ship_len].discard(placement_id)
+
+    def place_ship(self, ship_len: int) -> List[Coordinate]:
+        """
+        Method chooses random valid coordinates for the ship and blocks them.
+        Args:
+            ship_len: Length of ship.
+
+        Returns:
+            list: Ship coordinates.
+        """
+        coordinates = list(self.tables.placements[ship_len][self.alive_placements[ship_len].choice()])
+        self.ships_to_place[ship_len] -= 1
+        if not self.ships_to_place[ship_len]:
+            # There are no more ships with such length, so its placements shouldn't be updated anymore.
+            self.alive_placements.pop(ship_len)
+        self.block(coordinates)
+        return coordinates
+
+
+def create_fleet_coordinates(
+        width: int,
+        height: int,
+        ship_lens: List[int],
+        attempts: int = 100,
+        placed_coordinates: Iterable[List[Coordinate]] = ()
+) -> List[List[Coordinate]]:
+    """
+    Method creates coordinates for the whole fleet. Starts again if there is no place for some ship.
+    Args:
+        width: Battlefield width (index of the right border column).
+        height: Battlefield height (index of the bottom border row).
+        ship_lens: Lengths of ships in order of placement.
+        attempts: Number of attempts. The last one raises IndexError if there is no place for some ship.
+        placed_coordinates: Coordinates of ships, that are already on the battlefield (new ships are placed
+            around them).
+
+    Returns:
+        list: List with coordinates for every ship.
+    """
+    placed_coordinates = list(placed_coordinates)
+
+    def place_fleet() -> List[List[Coordinate]]:
+        placement = FleetPlacement(width, height, ship_lens)
+        for coordinates in placed_coordinates:
+            placement.block(coordinates)
+        return [placement.place_ship(ship_len) for ship_len in ship_lens]
+
+    for _ in range(attempts - 1):
+        try:
+            return place_fleet()
+        except IndexError:
+            continue
+    return place_fleet()
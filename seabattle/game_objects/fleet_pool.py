@@ -0,0 +1,44 @@
+"""Module contains pool of pre-generated fleet layouts for bots."""
+import logging
+from typing import List, Tuple, Optional
+
+from seabattle.game_objects.battlefield import BattleField
+from seabattle.game_objects.fleet_placement import create_fleet_coordinates
+from seabattle.helpers.constants import DEFAULT_BATTLEFIELD_END_COORD
+from seabattle.helpers.object_pool import ObjectPool
+
+FleetCoordinates = List[List[Tuple[int, int]]]
+
+
+class FleetPool(ObjectPool):
+    """
+    Class contains bounded pool of valid fleet layouts, that is refilled by background worker after every taken
+    layout. If pool is empty, layout is generated synchronously.
+    """
+
+    def __init__(
+            self,
+            size: int,
+            refill_rate: float = 0,
+            width: int = DEFAULT_BATTLEFIELD_END_COORD,
+            height: int = DEFAULT_BATTLEFIELD_END_COORD,
+            stats_log_interval: int = 0,
+            logger: Optional[logging.Logger] = None
+    ):
+
+        # pylint: disable=too-many-arguments
+
+        self.width = width
+        self.height = height
+        self.ship_lens = BattleField.create_initial_ships()
+        super().__init__(
+            factory=self._create_fleet,
+            size=size,
+            refill_rate=refill_rate,
+            stats_log_interval=stats_log_interval,
+            logger=logger
+        )
+
+    def _create_fleet(self) -> FleetCoordinates:
+        """Method generates new fleet layout."""
+        return create_fleet_coordinates(self.width, self.height, self.ship_lens)
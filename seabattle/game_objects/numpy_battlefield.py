@@ -0,0 +1,195 @@
+"""Module for creation battlefield that keeps its state in NumPy array."""
+from typing import Tuple, List, Dict
+
+import numpy as np
+
+from seabattle.game_objects.battlefield import BattleField
+from seabattle.game_objects.cell import Cell
+from seabattle.game_objects.cell_view import CellView, create_cell_views
+from seabattle.helpers.constants import SignObjects, AREA_AROUND, DEFAULT_BATTLEFIELD_END_COORD
+from seabattle.game_errors.battlefield_errors import ShotCellEarlierError, AreaOutsideBattleFieldError, \
+    CellNotExistError
+
+SIGNS = [SignObjects.empty_sign, SignObjects.ship_sign, SignObjects.miss_sign, SignObjects.hit_sign]
+SIGN_VALUES = {sign.sign: sign.value for sign in SIGNS}
+VALUE_SIGNS = {sign.value: sign.sign for sign in SIGNS}
+
+# Hit sign value (1000) doesn't fit int8, so the smallest dtype for sign values is used.
+CELL_DTYPE = np.int16
+
+# Sign character code for every sign value, so signs of all cells are converted into string with one indexing.
+SIGN_CODES = np.zeros(max(SIGN_VALUES.values()) + 1, dtype=np.uint8)
+SIGN_CODES[[sign.value for sign in SIGNS]] = [ord(sign.sign) for sign in SIGNS]
+
+AROUND_X = np.array([x_add for x_add, _ in AREA_AROUND])
+AROUND_Y = np.array([y_add for _, y_add in AREA_AROUND])
+
+
+class NumPyBattleField(BattleField):
+    """
+    Class contains battlefield, that stores cell signs values (SignObjects.*.value) in NumPy array.
+    Array is indexed as [y, x], border cells are included.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            width: int = DEFAULT_BATTLEFIELD_END_COORD,
+            height: int = DEFAULT_BATTLEFIELD_END_COORD,
+            is_visible: bool = True
+    ):
+        self.cells = np.full((height + 1, width + 1), SignObjects.empty_sign.value, dtype=CELL_DTYPE)
+        self.cell_ships: dict = {}
+        self.is_game_over = False
+        super().__init__(name, width, height, is_visible)
+
+    def _create_battlefield(self) -> Dict[Tuple[int, int], CellView]:  # type: ignore[override]
+        """
+        Method creates cell views for the array with cell sign values.
+
+        Returns:
+            Dictionary with tuple coordinates as keys and cell views as values.
+        """
+        return create_cell_views(self)
+
+    @staticmethod
+    def get_cell_key(coordinate: Tuple[int, int]) -> Tuple[int, int]:
+        """
+        Method converts coordinate into array index, that is used as a key by cell views.
+        Args:
+            coordinate: Cell coordinate.
+
+        Returns:
+            Array index of the cell.
+        """
+        return coordinate[1], coordinate[0]
+
+    def get_sign(self, key: Tuple[int, int]) -> str:
+        """
+        Method defines cell sign based on the array value.
+        Args:
+            key: Array index of the cell.
+
+        Returns:
+            Cell sign.
+        """
+        # item() returns Python int without creation of NumPy scalar.
+        return VALUE_SIGNS[self.cells.item(key)]
+
+    def set_sign(self, key: Tuple[int, int], sign: str) -> None:
+        """
+        Method updates array with new cell sign.
+        Args:
+            key: Array index of the cell.
+            sign: New cell sign.
+        """
+        self.cells[key] = SIGN_VALUES[sign]
+
+    @staticmethod
+    def _get_indexes(coordinates: List[Tuple[int, int]]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Method converts list of coordinates into arrays of y and x indexes.
+        Args:
+            coordinates: List of coordinates.
+
+        Returns:
+            tuple: Arrays with y and x indexes.
+        """
+        indexes = np.array(coordinates, dtype=np.intp).reshape(-1, 2)
+        return indexes[:, 1], indexes[:, 0]
+
+    def _check_empty_area(self, coordinates: List[Tuple[int, int]]) -> bool:
+        """
+        Method checks if area with coordinates is empty.
+        Args:
+            coordinates: List of coordinates.
+
+        Returns: True if empty, else False.
+        """
+        return not self.cells[self._get_indexes(coordinates)].any()
+
+    def _check_empty_area_around(self, coordinates: List[Tuple[int, int]]):
+        """
+        Method checks if area around (one cell around) coordinates is empty.
+        Args:
+            coordinates: List of coordinates.
+
+        Returns: True if empty, else False.
+        """
+        y_indexes, x_indexes = self._get_indexes(coordinates)
+        return not self.cells[y_indexes[:, None] + AROUND_Y, x_indexes[:, None] + AROUND_X].any()
+
+    def mark_missed_cells(self, coordinates: List[Tuple[int, int]]) -> None:
+        """
+        Method sets miss sign for all empty cells with specified coordinates.
+        Args:
+            coordinates: List of coordinates.
+        """
+        # Coordinates are cells around one ship, so reading of single cells is cheaper, than creation of index arrays.
+        cells, empty_value, miss_value = self.cells, SignObjects.empty_sign.value, SignObjects.miss_sign.value
+        for x, y in coordinates:
+            if cells.item(y, x) == empty_value:
+                cells[y, x] = miss_value
+
+    def shoot(self, coordinate: Tuple[int, int]) -> Tuple[dict[Tuple[int, int], Cell], bool]:
+        """
+        Method contains logic for shooting and changing marks on battlefield.
+        Args:
+            coordinate: Coordinate for shooting.
+        Returns:
+            str: Updated cells after shooting for coordinate and bool value if the ship was killed.
+        """
+        if not self.is_on_board(coordinate):
+            raise CellNotExistError(f"Cell with coordinate {coordinate} is not exist.")
+        if not (0 < coordinate[0] < self.width and 0 < coordinate[1] < self.height):
+            raise AreaOutsideBattleFieldError(f"Area with coordinates: {coordinate} is outside the battlefield."
+                                              f"Should be inside x - 1:{self.width - 1}, y - 1:{self.height - 1}")
+        key = self.get_cell_key(coordinate)
+        value = self.cells.item(key)
+        is_killed = False
+        if value == SignObjects.empty_sign.value:
+            self.cells[key] = SignObjects.miss_sign.value
+        elif value == SignObjects.ship_sign.value:
+            self.cells[key] = SignObjects.hit_sign.value
+            is_killed = self._register_hit(self.cell_ships[key])
+            # The same as _game_is_over(), only hit can change it.
+            self.is_game_over = not self.alive_ship_cells
+        else:
+            raise ShotCellEarlierError(f"Cell with coordinate {coordinate} was shot already.")
+
+        return {coordinate: self.battlefield[coordinate]}, is_killed
+
+    def get_battlefield(self) -> Dict[Tuple[int, int], Cell]:
+        """
+        Method filters battlefield coordinates (returns only cells that end user should see). Signs are read from
+        the array at once, so cells are a snapshot of the battlefield (changes of cells aren't saved).
+
+        Returns:
+            Dictionary with tuple coordinates as keys and cells as values.
+        """
+        coordinates, signs = self.lookup.inner_coordinates, self.get_rows()
+        battlefield = {coordinate: Cell(*coordinate, sign) for coordinate, sign in zip(coordinates, signs)}
+        # Only ship cells have ship ids.
+        for (y, x), ship_id in self.cell_ships.items():
+            cell = battlefield.get((x, y))
+            if cell is not None:
+                cell.ship_id = ship_id
+        return battlefield
+
+    def get_rows(self) -> str:
+        """
+        Method converts signs of cells, that end user should see, into row-major string with array operations.
+
+        Returns:
+            String with (width - 1) * (height - 1) signs, row by row.
+        """
+        return SIGN_CODES[self.get_signs()].tobytes().decode("ascii")
+
+    def get_signs(self) -> np.ndarray:
+        """
+        Method returns array of sign values for cells that end user should see (without border cells).
+
+        Returns:
+            Array view with sign values, indexed as [y - 1, x - 1].
+        """
+        return self.cells[1:self.height, 1:self.width]
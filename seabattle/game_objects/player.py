@@ -1,12 +1,15 @@
 """Module contains player class."""
 import logging
 import random
-from typing import Tuple, List, Set, Dict, Optional
+from typing import Tuple, List, Set, Dict, Iterable, Optional, Type
 from uuid import uuid4, UUID
 
 from seabattle.game_objects.battlefield import BattleField
 from seabattle.game_objects.cell import Cell
-from seabattle.helpers.constants import SignObjects, DIAG_AROUND, AREA_AROUND, HORIZONTAL_AROUND, VERTICAL_AROUND
+from seabattle.game_objects.enemy_view import EnemyView
+from seabattle.game_objects.fleet_placement import create_fleet_coordinates
+from seabattle.helpers.constants import SignObjects
+from seabattle.helpers.indexed_set import IndexedSet
 from seabattle.helpers.logger import get_logger
 
 
@@ -18,26 +21,30 @@ class Player:
     id: UUID
     logger: logging.Logger
     player_battlefield: BattleField
-    enemy_battlefield: BattleField
     is_game_over: bool
-    coordinates_for_shooting: list
+    coordinates_for_shooting: IndexedSet
     top_target_coordinates: list
     demaged_ships_coordinates: list
     is_horizontal: Optional[bool]
 
-    def __init__(self, player_name: str, enemy_name: str, logger: Optional[logging.Logger] = None):
+    def __init__(
+            self,
+            player_name: str,
+            enemy_name: str,
+            logger: Optional[logging.Logger] = None,
+            battlefield_class: Type[BattleField] = BattleField
+    ):
         self.id = uuid4()
         if logger is None:
             self.logger = get_logger(self.id, name="seabattle_player")
         else:
             self.logger = logger
-        self.player_battlefield = BattleField(name=player_name)
-        self.enemy_battlefield = BattleField(name=enemy_name, is_visible=False)
+        self.player_battlefield = battlefield_class(name=player_name)
+        self.enemy_name = enemy_name
+        self.battlefield_class = battlefield_class
+        self._enemy_battlefield: Optional[EnemyView] = None
         self.is_game_over = self.player_battlefield.is_game_over
-        self.coordinates_for_shooting = [
-            (x, y) for x in range(1, self.player_battlefield.width)
-            for y in range(1, self.player_battlefield.height)
-        ]
+        self.coordinates_for_shooting = IndexedSet(self.player_battlefield.lookup.inner_coordinates)
         self.top_target_coordinates = []
         self.demaged_ships_coordinates = []
 
@@ -47,6 +54,27 @@ class Player:
                f"------------{self.enemy_battlefield.name}'s battlefield---------\n" \
                f"{repr(self.enemy_battlefield)}"
 
+    @property
+    def enemy_battlefield(self) -> EnemyView:
+        """
+        Method returns view of opponent's battlefield. If player isn't linked with opponent, view over empty
+        battlefield is created.
+
+        Returns:
+            EnemyView object.
+        """
+        if self._enemy_battlefield is None:
+            self._enemy_battlefield = EnemyView(self.battlefield_class(name=self.enemy_name, is_visible=False))
+        return self._enemy_battlefield
+
+    def set_enemy_battlefield(self, battlefield: BattleField) -> None:
+        """
+        Method links player with opponent's battlefield, that player sees through enemy view.
+        Args:
+            battlefield: Opponent's battlefield.
+        """
+        self._enemy_battlefield = EnemyView(battlefield)
+
     def _is_game_over(self):
         """Method checks if game for player is over based on its battlefield."""
         self.is_game_over = self.player_battlefield.is_game_over
@@ -60,18 +88,17 @@ class Player:
 
     def shoot(self, shooting_results: Dict[Tuple[int, int], Cell], is_killed: bool):
         """
-        Method runs shoot command on enemy battlefield.
+        Method processes results of shooting on enemy battlefield (enemy view reads them from opponent's battlefield).
         Args:
             shooting_results: Dictionary with coordinates as keys and sings of shooting result on enemy battlefield
                 as values.
             is_killed: Bool mark, that informs if the ship is sunk.
         """
         for coordinate, shooting_result in shooting_results.items():
-            self.enemy_battlefield.battlefield[coordinate].sign = shooting_result.sign
             if shooting_result.sign == SignObjects.hit_sign.sign:
                 self.demaged_ships_coordinates.append(coordinate)
                 self.define_top_target_coordinates(coordinate, is_killed)
-        self.clear_coordinates_for_shooting(list(shooting_results.keys()))
+        self.clear_coordinates_for_shooting(shooting_results.keys())
 
     def enemy_shooting(self, coordinate: Tuple[int, int]) -> Tuple[Dict[Tuple[int, int], Cell], bool]:
         """
@@ -84,7 +111,8 @@ class Player:
         shooting_results, is_killed = self.player_battlefield.shoot(coordinate)
         if shooting_results[coordinate].sign == SignObjects.hit_sign.sign:
             shooting_results = self.set_sings_for_lucky_shoot(self.player_battlefield, coordinate, is_killed)
-        self._is_game_over()
+        # The same as _is_game_over(), inlined as the method is called for every shot.
+        self.is_game_over = self.player_battlefield.is_game_over
         return shooting_results, is_killed
 
     def set_ship_coordinates(self, coordinates: List[Tuple[int, int]]) -> Dict[Tuple[int, int], Cell]:
@@ -98,6 +126,38 @@ class Player:
         """
         return self.player_battlefield.set_ship_coordinates(coordinates)
 
+    def set_fleet_coordinates(self, fleet_coordinates: List[List[Tuple[int, int]]]) -> Dict[Tuple[int, int], Cell]:
+        """
+        Method sets several ships at once on player battlefield (all ships or none).
+        Args:
+            fleet_coordinates: List with coordinates for every ship.
+
+        Returns:
+            Dictionary with coordinates as keys and cells of all added ships as values.
+        """
+        return self.player_battlefield.set_fleet_coordinates(fleet_coordinates)
+
+    def auto_place_fleet(
+            self, fleet_coordinates: Optional[List[List[Tuple[int, int]]]] = None
+    ) -> Dict[Tuple[int, int], Cell]:
+        """
+        Method adds all ships, that are not added yet, to player battlefield.
+        Args:
+            fleet_coordinates: List with coordinates for every ship (pre-generated layout). If None, random
+                coordinates are generated around ships, that are already on the battlefield.
+
+        Returns:
+            Dictionary with coordinates as keys and cells of all added ships as values.
+        """
+        if fleet_coordinates is None:
+            fleet_coordinates = create_fleet_coordinates(
+                self.player_battlefield.width,
+                self.player_battlefield.height,
+                self.player_battlefield.get_new_ships(),
+                placed_coordinates=[list(ship.ship) for ship in self.player_battlefield.ships.values()]
+            )
+        return self.player_battlefield.set_fleet_coordinates(fleet_coordinates)
+
     def is_all_ships_added(self) -> bool:
         """Method check if all ships added to the battlefield."""
         return self.player_battlefield.is_all_ships_added()
@@ -111,11 +171,11 @@ class Player:
         """
 
         if self.top_target_coordinates:
-            coordinate = self.top_target_coordinates.pop(random.randint(0, len(self.top_target_coordinates) - 1))
+            coordinate = self.top_target_coordinates.pop(int(random.random() * len(self.top_target_coordinates)))
             self.coordinates_for_shooting.remove(coordinate)
             return coordinate
 
-        return self.coordinates_for_shooting.pop(random.randint(0, len(self.coordinates_for_shooting) - 1))
+        return self.coordinates_for_shooting.pop_random()
 
     def define_top_target_coordinates(self, coordinate: Tuple[int, int], is_killed: bool):
         """
@@ -132,37 +192,35 @@ class Player:
         else:
             self.is_horizontal = self._is_horizontal_ship()
             x, y = coordinate
+            lookup = self.player_battlefield.lookup
             if self.is_horizontal is None:
                 # Add all directions as ship has only one cell for now.
-                self.top_target_coordinates.extend([(x + x_, y + y_) for x_, y_ in HORIZONTAL_AROUND])
-                self.top_target_coordinates.extend([(x + x_, y + y_) for x_, y_ in VERTICAL_AROUND])
+                self.top_target_coordinates.extend(lookup.horizontal[coordinate])
+                self.top_target_coordinates.extend(lookup.vertical[coordinate])
             elif self.is_horizontal:
                 # Add horizontal coordinates.
-                self.top_target_coordinates.extend([(x + x_, y + y_) for x_, y_ in HORIZONTAL_AROUND])
+                self.top_target_coordinates.extend(lookup.horizontal[coordinate])
                 self.top_target_coordinates = [top_coordinate for top_coordinate in self.top_target_coordinates
                                                if top_coordinate[1] == y]
             else:
                 # Add vertical coordinates.
-                self.top_target_coordinates.extend([(x + x_, y + y_) for x_, y_ in VERTICAL_AROUND])
+                self.top_target_coordinates.extend(lookup.vertical[coordinate])
                 self.top_target_coordinates = [top_coordinate for top_coordinate in self.top_target_coordinates
                                                if top_coordinate[0] == x]
 
-    def clear_coordinates_for_shooting(self, coordinates: list):
+    def clear_coordinates_for_shooting(self, coordinates: Iterable[Tuple[int, int]]):
         """
         Method deletes coordinates that cannot be used for shooting (were shot already or were updated after
         successful shooting).
         Args:
             coordinates: List of coordinates for deleting.
         """
-        for coordinate in coordinates:
-            if coordinate in self.coordinates_for_shooting:
-                self.coordinates_for_shooting.remove(coordinate)
+        self.coordinates_for_shooting.difference_update(coordinates)
 
         # Update top_target_coordinates if it has any coordinates.
         if self.top_target_coordinates:
-            self.top_target_coordinates = list(
-                set(self.top_target_coordinates).intersection(set(self.coordinates_for_shooting))
-            )
+            self.top_target_coordinates = [top_coordinate for top_coordinate in self.top_target_coordinates
+                                           if top_coordinate in self.coordinates_for_shooting]
 
     @staticmethod
     def get_coordinates_for_update(battlefield: BattleField,
@@ -178,16 +236,11 @@ class Player:
         Returns:
             set: Set of coordinates for cells on battlefield, that should be updated (change signs).
         """
-        coordinates = {coordinate}
-        x, y = coordinate
-        for x_add, y_add in DIAG_AROUND:
-            coordinates.add((x + x_add, y + y_add))
+        coordinates = {coordinate, *battlefield.lookup.diagonals[coordinate]}
 
         if is_killed:
-            ship_id = battlefield.battlefield[(x, y)].ship_id
-            for cell in battlefield.ships[ship_id].ship.values():
-                for x_add, y_add in AREA_AROUND:
-                    coordinates.add((cell.x + x_add, cell.y + y_add))
+            ship_id = battlefield.battlefield[coordinate].ship_id
+            coordinates |= battlefield.lookup.get_ship_halo(battlefield.ships[ship_id].ship)
         return coordinates
 
     def set_sings_for_lucky_shoot(self, battlefield: BattleField,
@@ -204,11 +257,7 @@ class Player:
             dict: Dict of coordinates for cells on battlefield as keys, and updated cells as values.
         """
         coordinates_for_update = self.get_coordinates_for_update(battlefield, coordinate, is_killed)
-        shooting_results = {}
-        for new_coordinate in coordinates_for_update:
-            if battlefield.battlefield[new_coordinate].sign == SignObjects.empty_sign.sign:
-                battlefield.battlefield[new_coordinate].sign = SignObjects.miss_sign.sign
-            if 1 <= new_coordinate[0] <= self.player_battlefield.width - 1 and \
-                    1 <= new_coordinate[1] <= self.player_battlefield.height - 1:
-                shooting_results.update({new_coordinate: battlefield.battlefield[new_coordinate]})
-        return shooting_results
+        battlefield.mark_missed_cells(list(coordinates_for_update))
+        inner_coordinates, cells = battlefield.lookup.inner_coordinate_set, battlefield.battlefield
+        return {new_coordinate: cells[new_coordinate] for new_coordinate in coordinates_for_update
+                if new_coordinate in inner_coordinates}
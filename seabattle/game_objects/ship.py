@@ -1,23 +1,28 @@
 """Module for creation ship objects."""
-import uuid
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Tuple, Optional
 
 from seabattle.game_errors.ship_errors import NotParallelShipError, WrongShipCoordinateError
 from seabattle.game_objects.cell import Cell
 from seabattle.helpers.constants import SignObjects, SHIP_NAMES
 
 
-@dataclass
+@dataclass(slots=True)
 class Ship:
-    """Class contains ship object and its methods."""
+    """Class contains ship object and its methods. Ship id is unique only inside its battlefield."""
+    id: int
+    ship: dict[Tuple[int, int], Cell]
+    name: Optional[str]
+    hits: int
+    is_alive: bool
 
-    def __init__(self, ship_cells: dict[Tuple[int, int], Cell]):
-        self.id = uuid.uuid4()
-        self._check_coordinates(list(ship_cells.keys()))
+    def __init__(self, ship_cells: dict[Tuple[int, int], Cell], ship_id: int = 0):
+        self.id = ship_id
+        self.check_coordinates(list(ship_cells.keys()))
 
         self.ship = self._set_ship_info(ship_cells)
         self.name = SHIP_NAMES.get(len(self.ship))
+        self.hits = 0
         self.is_alive = True
 
     def _set_ship_info(self, ship_cells: dict[Tuple[int, int], Cell]) -> dict[Tuple[int, int], Cell]:
@@ -36,7 +41,7 @@ class Ship:
         return ship_cells
 
     @staticmethod
-    def _check_coordinates(coordinates: list[Tuple[int, int]]):
+    def check_coordinates(coordinates: list[Tuple[int, int]]):
         """
         Method checks giving coordinates if they acceptable as ship coordinates.
         Args:
@@ -72,3 +77,14 @@ class Ship:
         """
         self.is_alive = sum(cell.sign == SignObjects.ship_sign.sign for cell in self.ship.values()) > 0
         return self.is_alive
+
+    def register_hit(self) -> bool:
+        """
+        Method counts one more hit in the ship without checking all ship's cells.
+
+        Returns:
+            True, if there is at least one ship cell that alive.
+        """
+        self.hits += 1
+        self.is_alive = self.hits < len(self.ship)
+        return self.is_alive
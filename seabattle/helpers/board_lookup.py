@@ -0,0 +1,125 @@
+"""Module contains precomputed lookup tables with neighbour cells for every board size."""
+from functools import lru_cache
+from typing import Tuple, Dict, FrozenSet, List, Iterable, Set
+
+from seabattle.helpers.constants import AREA_AROUND, DIAG_AROUND, HORIZONTAL_AROUND, VERTICAL_AROUND
+
+Coordinate = Tuple[int, int]
+
+
+class BoardLookup:
+    """
+    Class contains lookup tables for the board size (border cells are included): coordinates of all cells,
+    neighbours of every cell, cell bits and halo bitmasks (cell and all cells around it).
+    Cell index is y * (width + 1) + x. Neighbours outside the board are skipped.
+    All tables share the same coordinate objects.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.row_len = width + 1
+        self.coordinates: Tuple[Coordinate, ...] = tuple((x, y) for y in range(height + 1) for x in range(width + 1))
+        self.inner_coordinates: Tuple[Coordinate, ...] = tuple(
+            coordinate for coordinate in self.coordinates if self.is_inner(coordinate)
+        )
+        self.inner_coordinate_set: FrozenSet[Coordinate] = frozenset(self.inner_coordinates)
+        self.around = self._create_neighbours(AREA_AROUND)
+        self.diagonals = self._create_neighbours(DIAG_AROUND)
+        self.horizontal = self._create_neighbours(HORIZONTAL_AROUND)
+        self.vertical = self._create_neighbours(VERTICAL_AROUND)
+        self.halo: Dict[Coordinate, Tuple[Coordinate, ...]] = {
+            coordinate: (coordinate,) + neighbours for coordinate, neighbours in self.around.items()
+        }
+        self.cell_bits: Dict[Coordinate, int] = {
+            coordinate: 1 << self.get_index(coordinate) for coordinate in self.coordinates
+        }
+        # Bits of cells, that end user sees, in row-major order.
+        self.inner_bits: Tuple[int, ...] = tuple(self.cell_bits[coordinate] for coordinate in self.inner_coordinates)
+        self.inner_mask = 0
+        for coordinate in self.inner_coordinates:
+            self.inner_mask |= 1 << self.get_index(coordinate)
+        self.halo_masks: Tuple[int, ...] = tuple(
+            sum(1 << self.get_index(halo_coordinate) for halo_coordinate in self.halo[coordinate])
+            for coordinate in self.coordinates
+        )
+
+    def _create_neighbours(self, shifts: List[Tuple[int, int]]) -> Dict[Coordinate, Tuple[Coordinate, ...]]:
+        """
+        Method creates table with neighbours of every cell in specified directions.
+        Args:
+            shifts: List with coordinate shifts for neighbours.
+
+        Returns:
+            Dictionary with coordinates as keys and tuples with neighbour coordinates as values.
+        """
+        return {
+            (x, y): tuple(
+                self.coordinates[self.get_index((x + x_add, y + y_add))] for x_add, y_add in shifts
+                if self.is_on_board((x + x_add, y + y_add))
+            )
+            for x, y in self.coordinates
+        }
+
+    def get_index(self, coordinate: Coordinate) -> int:
+        """
+        Method converts coordinate into cell index.
+        Args:
+            coordinate: Cell coordinate.
+
+        Returns:
+            Cell index.
+        """
+        return coordinate[1] * self.row_len + coordinate[0]
+
+    def is_on_board(self, coordinate: Coordinate) -> bool:
+        """
+        Method checks if coordinate belongs to the board (including border cells).
+        Args:
+            coordinate: Cell coordinate.
+
+        Returns:
+            True if coordinate belongs to the board, else False.
+        """
+        return 0 <= coordinate[0] <= self.width and 0 <= coordinate[1] <= self.height
+
+    def is_inner(self, coordinate: Coordinate) -> bool:
+        """
+        Method checks if coordinate is inside the board and not on border.
+        Args:
+            coordinate: Cell coordinate.
+
+        Returns:
+            True if coordinate is inside the board, else False.
+        """
+        return 0 < coordinate[0] < self.width and 0 < coordinate[1] < self.height
+
+    def get_ship_halo(self, coordinates: Iterable[Coordinate]) -> Set[Coordinate]:
+        """
+        Method collects ship cells and all cells around them.
+        Args:
+            coordinates: Ship coordinates.
+
+        Returns:
+            Set with coordinates of ship halo.
+        """
+        halo: Set[Coordinate] = set()
+        for coordinate in coordinates:
+            halo.update(self.halo[coordinate])
+        return halo
+
+
+@lru_cache(maxsize=None)
+def get_board_lookup(width: int, height: int) -> BoardLookup:
+    """
+    Method creates lookup tables for the board size (only once for every size).
+    Args:
+        width: Battlefield width (index of the right border column).
+        height: Battlefield height (index of the bottom border row).
+
+    Returns:
+        BoardLookup object.
+    """
+    return BoardLookup(width, height)
@@ -1,15 +1,19 @@
 """Module with game constants."""
+import sys
 from copy import deepcopy
 from dataclasses import dataclass
 from enum import Enum
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Sign:
-    """Class for sign mark and value."""
+    """Class for sign mark and value. Sign mark is interned, so all cells share the same string objects."""
     sign: str
     value: int
 
+    def __post_init__(self):
+        object.__setattr__(self, "sign", sys.intern(self.sign))
+
 
 @dataclass
 class SignObjects:
@@ -23,10 +27,26 @@ class SignObjects:
 class StatusCode(Enum):
     """Class contains all useful status codes."""
     OK = 200
+    NOT_MODIFIED = 304
     BAD_REQUEST = 400
     VALIDATION_FAILED = 400
     ENTITY_NOT_FOUND = 404
+    UNPROCESSABLE_ENTITY = 422
     APPLICATION_ERROR = 500
+    SERVICE_UNAVAILABLE = 503
+
+
+class BoardFormat(Enum):
+    """Class contains formats of battlefields in api responses."""
+    CELLS = "cells"  # List of cells with x, y and sign.
+    ROWS = "rows"  # Row-major string with cell signs.
+    BITMASK = "bitmask"  # Base64 row-major bitmask for every sign layer.
+
+
+BOARD_FORMAT_MEDIA_TYPES = {
+    "application/vnd.seabattle.rows+json": BoardFormat.ROWS,
+    "application/vnd.seabattle.bitmask+json": BoardFormat.BITMASK,
+}
 
 
 DIAG_AROUND = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
@@ -1,8 +1,30 @@
 """Module contains functions for converting data before send them to front."""
+import base64
+from functools import lru_cache
 from typing import Dict, Tuple, List
 
 from seabattle.game_objects.cell import Cell
-from seabattle.helpers.constants import DEFAULT_BATTLEFIELD_BEGINNING_COORD, DEFAULT_BATTLEFIELD_END_COORD
+from seabattle.helpers.constants import DEFAULT_BATTLEFIELD_BEGINNING_COORD, DEFAULT_BATTLEFIELD_END_COORD, \
+    SignObjects
+
+# Sign layers for bitmask format (empty cells are cells without any layer).
+SIGN_LAYERS = {
+    "ship": SignObjects.ship_sign.sign,
+    "miss": SignObjects.miss_sign.sign,
+    "hit": SignObjects.hit_sign.sign,
+}
+
+# Translation tables, that turn signs into "1" for the sign layer and into "0" for other signs.
+LAYER_TABLES = {
+    sign: str.maketrans({
+        other_sign.sign: "1" if other_sign.sign == sign else "0"
+        for other_sign in (SignObjects.empty_sign, SignObjects.ship_sign, SignObjects.miss_sign, SignObjects.hit_sign)
+    })
+    for sign in SIGN_LAYERS.values()
+}
+
+# Coordinate strings are created once, so state conversion doesn't call str() twice for every cell.
+COORDINATE_STRINGS = tuple(str(coordinate) for coordinate in range(DEFAULT_BATTLEFIELD_END_COORD))
 
 
 def convert_coordinates(coordinates: Dict[Tuple[int, int], Cell]) -> List[Dict[str, str]]:
@@ -14,7 +36,86 @@ def convert_coordinates(coordinates: Dict[Tuple[int, int], Cell]) -> List[Dict[s
     Returns:
         Dictionary with x, y and sign keys, and its values.
     """
-    return [{"x": str(coord[0]), "y": str(coord[1]), "sign": cell.sign}
+    return [{"x": COORDINATE_STRINGS[coord[0]], "y": COORDINATE_STRINGS[coord[1]], "sign": cell.sign}
             for coord, cell in coordinates.items()
             if DEFAULT_BATTLEFIELD_BEGINNING_COORD < coord[0] < DEFAULT_BATTLEFIELD_END_COORD
             and DEFAULT_BATTLEFIELD_BEGINNING_COORD < coord[1] < DEFAULT_BATTLEFIELD_END_COORD]
+
+
+def convert_to_rows(cells: Dict[Tuple[int, int], Cell], width: int, height: int) -> str:
+    """
+    Method converts battlefield cells into row-major string with cell signs.
+    Args:
+        cells: Dictionary with tuple coordinates as keys and cell object as values (without border cells).
+        width: Battlefield width (index of the right border column).
+        height: Battlefield height (index of the bottom border row).
+
+    Returns:
+        String with (width - 1) * (height - 1) signs, row by row.
+    """
+    return "".join(cells[(x, y)].sign for y in range(1, height) for x in range(1, width))
+
+
+def convert_to_bitmasks(cells: Dict[Tuple[int, int], Cell], width: int, height: int) -> Dict[str, str]:
+    """
+    Method converts battlefield cells into bitmask for every sign layer. Bit index of cell is
+    (y - 1) * (width - 1) + (x - 1), bitmask is encoded as little-endian bytes in base64.
+    Args:
+        cells: Dictionary with tuple coordinates as keys and cell object as values (without border cells).
+        width: Battlefield width (index of the right border column).
+        height: Battlefield height (index of the bottom border row).
+
+    Returns:
+        Dictionary with layer names as keys and base64 bitmasks as values.
+    """
+    return convert_rows_to_bitmasks(convert_to_rows(cells, width, height))
+
+
+def convert_rows_to_bitmasks(rows: str) -> Dict[str, str]:
+    """
+    Method converts row-major string with cell signs into bitmask for every sign layer. Bit index of cell is its index
+    in the string, bitmask is encoded as little-endian bytes in base64.
+    Args:
+        rows: Row-major string with cell signs.
+
+    Returns:
+        Dictionary with layer names as keys and base64 bitmasks as values.
+    """
+    # The first cell is the lowest bit, so the reversed string is a binary number of the layer.
+    reversed_rows = rows[::-1]
+    mask_len = (len(rows) + 7) // 8
+    return {
+        layer: base64.b64encode(
+            int(reversed_rows.translate(LAYER_TABLES[sign]) or "0", 2).to_bytes(mask_len, "little")
+        ).decode("ascii")
+        for layer, sign in SIGN_LAYERS.items()
+    }
+
+
+@lru_cache(maxsize=None)
+def get_coordinate_strings(width: int, height: int) -> Tuple[Tuple[str, str], ...]:
+    """
+    Method creates x and y strings of battlefield cells in row-major order (without border cells).
+    Args:
+        width: Battlefield width (index of the right border column).
+        height: Battlefield height (index of the bottom border row).
+
+    Returns:
+        Tuple with x and y strings for every cell.
+    """
+    return tuple((str(x), str(y)) for y in range(1, height) for x in range(1, width))
+
+
+def convert_rows_to_coordinates(rows: str, width: int, height: int) -> List[Dict[str, str]]:
+    """
+    Method converts row-major string with cell signs into the same list of dictionaries, as convert_coordinates
+    creates for all battlefield cells, without creation of cell objects.
+    Args:
+        rows: Row-major string with cell signs.
+        width: Battlefield width (index of the right border column).
+        height: Battlefield height (index of the bottom border row).
+
+    Returns:
+        List of dictionaries with x, y and sign keys, and its values.
+    """
+    return [{"x": x, "y": y, "sign": sign} for (x, y), sign in zip(get_coordinate_strings(width, height), rows)]
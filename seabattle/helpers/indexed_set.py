@@ -0,0 +1,132 @@
+"""Module contains set with constant time membership, removal and random pop."""
+import random
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional
+
+
+class IndexedSet:
+    """
+    Class contains set of items, that stored in list with position map.
+    Removal swaps the item with the last one, so every operation takes constant time.
+    """
+
+    def __init__(self, items: Optional[Iterable[Hashable]] = None):
+        self._items: List[Any] = []
+        self._positions: Dict[Any, int] = {}
+        for item in items or []:
+            self.add(item)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._positions
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(list(self._items))
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._items})"
+
+    def add(self, item: Hashable) -> None:
+        """
+        Method adds item to the set if it isn't there yet.
+        Args:
+            item: Item for adding.
+        """
+        if item not in self._positions:
+            self._positions[item] = len(self._items)
+            self._items.append(item)
+
+    def discard(self, item: Hashable) -> None:
+        """
+        Method removes item from the set if it is there.
+        Args:
+            item: Item for removing.
+        """
+        position = self._positions.pop(item, None)
+        if position is None:
+            return
+        last_item = self._items.pop()
+        if position < len(self._items):
+            self._items[position] = last_item
+            self._positions[last_item] = position
+
+    def difference_update(self, items: Iterable[Hashable]) -> None:
+        """
+        Method removes all items, that are in the set (discard is inlined, as it is called for every shot cell).
+        Args:
+            items: Items for removing.
+        """
+        positions, set_items = self._positions, self._items
+        for item in items:
+            position = positions.pop(item, None)
+            if position is None:
+                continue
+            last_item = set_items.pop()
+            if position < len(set_items):
+                set_items[position] = last_item
+                positions[last_item] = position
+
+    def remove(self, item: Hashable) -> None:
+        """
+        Method removes item from the set. Raises KeyError if there is no such item.
+        Args:
+            item: Item for removing.
+        """
+        self._pop_position(self._positions[item])
+
+    def _pop_position(self, position: int) -> Any:
+        """
+        Method removes item with specified position in the list (the last item takes its position).
+        Args:
+            position: Item position.
+
+        Returns:
+            Removed item.
+        """
+        items = self._items
+        item = items[position]
+        last_item = items.pop()
+        del self._positions[item]
+        if position < len(items):
+            items[position] = last_item
+            self._positions[last_item] = position
+        return item
+
+    def copy(self) -> "IndexedSet":
+        """
+        Method creates shallow copy of the set.
+
+        Returns:
+            New indexed set with the same items.
+        """
+
+        # pylint: disable=protected-access
+
+        new_set = self.__class__()
+        new_set._items = self._items.copy()
+        new_set._positions = self._positions.copy()
+        return new_set
+
+    def choice(self) -> Any:
+        """
+        Method returns random item from the set (uniformly) without removing it.
+
+        Returns:
+            Random item from the set.
+        """
+        if not self._items:
+            raise IndexError("Cannot choose from an empty set")
+        return self._items[random.randrange(len(self._items))]
+
+    def pop_random(self) -> Any:
+        """
+        Method removes and returns random item from the set (uniformly). Position is taken from random() directly,
+        as the method is called for almost every bot shot, and randrange() costs several times more.
+
+        Returns:
+            Random item from the set.
+        """
+        if not self._items:
+            raise KeyError("pop from an empty set")
+        return self._pop_position(int(random.random() * len(self._items)))
@@ -0,0 +1,118 @@
+"""Module contains bounded object pool, that is refilled by background worker."""
+import logging
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+from seabattle.helpers.logger import API_LOGGER
+
+
+class ObjectPool:
+    """
+    Class contains bounded pool of pre-created objects. Background worker refills the pool up to high watermark,
+    when number of objects falls below low watermark. If pool is empty, object is created synchronously.
+    Refill rate is a maximum number of objects per second, that worker adds to the pool (0 - without limit).
+    Hit/miss counters are logged after every stats_log_interval requests (0 - without logging).
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+            self,
+            factory: Callable[[], Any],
+            size: int,
+            low_watermark: Optional[int] = None,
+            refill_rate: float = 0,
+            stats_log_interval: int = 0,
+            logger: Optional[logging.Logger] = None
+    ):
+
+        # pylint: disable=too-many-arguments
+
+        self.factory = factory
+        self.size = size
+        self.low_watermark = size if low_watermark is None else low_watermark
+        self.refill_rate = refill_rate
+        self.stats_log_interval = stats_log_interval
+        self.logger = logger if logger is not None else API_LOGGER
+        self.hits = 0
+        self.misses = 0
+        self._objects: Deque[Any] = deque()
+        self._stats_lock = threading.Lock()
+        self._refill_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def get(self) -> Any:
+        """
+        Method takes object from the pool or creates it if pool is empty.
+
+        Returns:
+            Object from the pool.
+        """
+        try:
+            obj = self._objects.popleft()
+            is_hit = True
+        except IndexError:
+            obj = self.factory()
+            is_hit = False
+        with self._stats_lock:
+            if is_hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+            requests_number = self.hits + self.misses
+        if self.stats_log_interval and not requests_number % self.stats_log_interval:
+            self.logger.info(f"{self.__class__.__name__} stats: {self.get_stats()}.")
+        if len(self._objects) < self.low_watermark:
+            self._refill_event.set()
+        return obj
+
+    def fill(self) -> None:
+        """Method fills the pool up to its size synchronously."""
+        while len(self._objects) < self.size:
+            self._objects.append(self.factory())
+
+    def _refill(self) -> None:
+        """Method contains worker loop, that keeps the pool filled."""
+        refill_interval = 1 / self.refill_rate if self.refill_rate > 0 else 0
+        while not self._stop_event.is_set():
+            self._refill_event.wait()
+            self._refill_event.clear()
+            while len(self._objects) < self.size and not self._stop_event.is_set():
+                self._objects.append(self.factory())
+                if refill_interval:
+                    self._stop_event.wait(refill_interval)
+
+    def start(self) -> None:
+        """Method starts background worker, that refills the pool."""
+        if self.size <= 0 or (self._worker is not None and self._worker.is_alive()):
+            return
+        self._stop_event.clear()
+        if len(self._objects) < self.low_watermark:
+            self._refill_event.set()
+        self._worker = threading.Thread(target=self._refill, name=self.__class__.__name__, daemon=True)
+        self._worker.start()
+        self.logger.info(f"{self.__class__.__name__} worker is started with size {self.size}, "
+                         f"low watermark {self.low_watermark} and refill rate {self.refill_rate}.")
+
+    def stop(self) -> None:
+        """Method stops background worker."""
+        self._stop_event.set()
+        self._refill_event.set()
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Method collects pool statistics.
+
+        Returns:
+            Dictionary with current pool size, number of hits and misses.
+        """
+        with self._stats_lock:
+            return {"size": len(self._objects), "hits": self.hits, "misses": self.misses}
@@ -6,8 +6,12 @@ from typing import Tuple, Dict, Any
 from marshmallow import ValidationError
 from werkzeug.exceptions import HTTPException
 from seabattle.helpers.constants import StatusCode, FRONT_Y_COORDINATE
+from seabattle.game_errors.api_errors import GameBusyApiError, IdempotencyKeyApiError
 from seabattle.helpers.logger import API_LOGGER
 
+# Number of seconds, after which client should retry request for busy game.
+GAME_BUSY_RETRY_AFTER = 1
+
 
 def handle_validation_error(error: ValidationError) -> Tuple[Dict[str, Any], int]:
     """
@@ -50,7 +54,7 @@ def handle_application_error(error: Exception) -> Tuple[Dict[str, Any], int]:
     Returns:
         tuple: Dictionary whit application error information and status code.
     """
-    hint = error.args[0]
+    hint = str(error.args[0]) if error.args else str(error)
     coordinates = re.search(r"\[.*?\]", hint)
     coordinate = re.search(r"\(.*?\)", hint)
     while coordinate or coordinates:
@@ -75,3 +79,37 @@ def handle_application_error(error: Exception) -> Tuple[Dict[str, Any], int]:
     API_LOGGER.error(response)
     traceback.print_exc()
     return response, StatusCode.APPLICATION_ERROR.value
+
+
+def handle_game_busy_error(error: GameBusyApiError) -> Tuple[Dict[str, Any], int, Dict[str, str]]:
+    """
+    Method handles errors of requests for games, that are locked by other requests.
+    Args:
+        error: Game busy error.
+
+    Returns:
+        tuple: Dictionary whit error information, status code and headers with retry time.
+    """
+    response = {"statusCode": StatusCode.SERVICE_UNAVAILABLE.value,
+                "errorCode": error.__class__.__name__,
+                "message": "Game is busy.",
+                "hint": str(error)}
+    API_LOGGER.warning(response)
+    return response, StatusCode.SERVICE_UNAVAILABLE.value, {"Retry-After": str(GAME_BUSY_RETRY_AFTER)}
+
+
+def handle_idempotency_key_error(error: IdempotencyKeyApiError) -> Tuple[Dict[str, Any], int]:
+    """
+    Method handles errors of requests with idempotency key, that was already used for other request.
+    Args:
+        error: Idempotency key error.
+
+    Returns:
+        tuple: Dictionary whit error information and status code.
+    """
+    response = {"statusCode": StatusCode.UNPROCESSABLE_ENTITY.value,
+                "errorCode": error.__class__.__name__,
+                "message": "Idempotency key is already used.",
+                "hint": str(error)}
+    API_LOGGER.error(response)
+    return response, StatusCode.UNPROCESSABLE_ENTITY.value
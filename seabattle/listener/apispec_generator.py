@@ -1,10 +1,38 @@
 """Module contains methods for automatic generation of API specifications"""
-from apispec import APISpec
+from typing import Iterable, Optional
+
+from apispec import APISpec, BasePlugin
 from apispec.ext.marshmallow import MarshmallowPlugin
 from apispec_webframeworks.flask import FlaskPlugin  # type: ignore
 from flask import Flask
 
 
+class MediaTypesPlugin(BasePlugin):
+    """
+    Class adds alternate media types to request bodies and responses, that are documented as JSON.
+    Alternate media types use the same schemas as JSON.
+    """
+
+    def __init__(self, media_types: Iterable[str]):
+        self.media_types = tuple(media_types)
+
+    def operation_helper(self, path: Optional[str] = None, operations: Optional[dict] = None, **kwargs) -> None:
+        """
+        Method copies JSON content of every operation for alternate media types.
+        Args:
+            path: Endpoint path.
+            operations: Dictionary with endpoint operations.
+        """
+        for operation in (operations or {}).values():
+            contents = [operation.get("requestBody", {}).get("content", {})]
+            contents.extend(response.get("content", {}) for response in operation.get("responses", {}).values())
+            for content in contents:
+                if "application/json" not in content:
+                    continue
+                for media_type in self.media_types:
+                    content.setdefault(media_type, dict(content["application/json"]))
+
+
 def load_docstrings(spec: APISpec, app: Flask) -> None:
     """
     Method loads endpoint methods docstrings for further parsing.
@@ -17,13 +45,14 @@ def load_docstrings(spec: APISpec, app: Flask) -> None:
         spec.path(view=view_fn)
 
 
-def get_apispec(app: Flask, api_title: str, api_version: str) -> APISpec:
+def get_apispec(app: Flask, api_title: str, api_version: str, media_types: Iterable[str] = ()) -> APISpec:
     """
     Method creates APISpec based on the docstring data of flask endpoints.
     Args:
         app: Flask application object.
         api_title: Title that is used in API spec.
         api_version: Version of API.
+        media_types: Alternate media types, that are supported by endpoints in addition to JSON.
 
     Returns:
         API spec config.
@@ -32,7 +61,7 @@ def get_apispec(app: Flask, api_title: str, api_version: str) -> APISpec:
         title=api_title,
         version=api_version,
         openapi_version="3.0.3",
-        plugins=[FlaskPlugin(), MarshmallowPlugin()]
+        plugins=[FlaskPlugin(), MediaTypesPlugin(media_types), MarshmallowPlugin()]
     )
     load_docstrings(spec, app)
     return spec
@@ -0,0 +1,159 @@
+"""Module contains codecs for content negotiation of api requests and responses (JSON is used by default)."""
+import json
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple, Type, Union
+
+from flask import Response, g, request
+from werkzeug.exceptions import BadRequest
+
+from seabattle.helpers.constants import StatusCode
+
+try:
+    import msgpack  # type: ignore
+except ImportError:
+    msgpack = None  # pylint: disable=invalid-name
+
+try:
+    import cbor2  # type: ignore
+except ImportError:
+    cbor2 = None  # pylint: disable=invalid-name
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+CBOR_MEDIA_TYPE = "application/cbor"
+
+
+@dataclass(frozen=True)
+class Codec:
+    """
+    Class contains media type and functions for encoding and decoding api data. Decode errors are errors, that are
+    raised by decode function for broken data (they are reported as bad request).
+    """
+    media_type: str
+    encode: Callable[[Any], bytes]
+    decode: Callable[[bytes], Any]
+    decode_errors: Tuple[Type[Exception], ...] = field(default=(ValueError,))
+
+
+JSON_CODEC = Codec(
+    media_type=JSON_MEDIA_TYPE,
+    encode=lambda data: json.dumps(data, separators=(",", ":")).encode(),
+    decode=json.loads
+)
+
+# Binary codecs, that are available for requests and responses (depend on installed optional packages).
+CODECS: Dict[str, Codec] = {}
+
+
+def register_codec(codec: Codec) -> None:
+    """
+    Method adds codec for content negotiation.
+    Args:
+        codec: Codec object.
+    """
+    CODECS[codec.media_type] = codec
+
+
+if msgpack is not None:
+    register_codec(Codec(media_type=MSGPACK_MEDIA_TYPE, encode=msgpack.packb, decode=msgpack.unpackb))
+if cbor2 is not None:
+    # CBORDecodeError isn't a subclass of ValueError in newer cbor2 versions.
+    register_codec(Codec(
+        media_type=CBOR_MEDIA_TYPE,
+        encode=cbor2.dumps,
+        decode=cbor2.loads,
+        decode_errors=(ValueError, cbor2.CBORDecodeError)
+    ))
+
+
+def get_request_data() -> Any:
+    """
+    Method decodes request body with codec chosen by Content-Type header (JSON by default). Body is decoded only once
+    per request.
+
+    Returns:
+        Decoded request data.
+    """
+    if "request_data" in g:
+        return g.request_data
+    codec = CODECS.get(request.mimetype)
+    if codec is None:
+        g.request_data = request.json
+        return g.request_data
+    try:
+        g.request_data = codec.decode(request.get_data())
+    except codec.decode_errors as error:
+        raise BadRequest(f"Failed to decode {codec.media_type} request body.") from error
+    return g.request_data
+
+
+def get_response_codec() -> Optional[Codec]:
+    """
+    Method chooses binary codec for response by Accept header.
+
+    Returns:
+        Codec object or None, if JSON response is expected.
+    """
+    return CODECS.get(request.accept_mimetypes.best_match([JSON_MEDIA_TYPE, *CODECS]))
+
+
+def set_json_media_type(media_type: str) -> None:
+    """
+    Method sets media type of successful JSON response, when it is negotiated by Accept header (for example, vendor
+    media type of battlefields format).
+    Args:
+        media_type: JSON based media type.
+    """
+    g.json_media_type = media_type
+
+
+def get_json_media_type() -> str:
+    """
+    Method returns media type of successful JSON response.
+
+    Returns:
+        Negotiated JSON based media type or application/json.
+    """
+    return g.get("json_media_type", JSON_MEDIA_TYPE)
+
+
+def create_response(
+        data: Any, status_code: int, headers: Optional[Dict[str, str]] = None
+) -> Union[tuple, Response]:
+    """
+    Method encodes response data with codec chosen by Accept header.
+    Args:
+        data: Response data.
+        status_code: Response status code.
+        headers: Additional response headers.
+
+    Returns:
+        Encoded response, or data, status code (and headers, if they are set) for JSON response.
+    """
+    codec = get_response_codec()
+    if codec is None:
+        # Error responses don't contain battlefields, so they are always application/json.
+        media_type = get_json_media_type()
+        if media_type != JSON_MEDIA_TYPE and status_code < StatusCode.BAD_REQUEST.value:
+            headers = {**(headers or {}), "Content-Type": media_type}
+        return (data, status_code) if headers is None else (data, status_code, headers)
+    return Response(codec.encode(data), status=status_code, mimetype=codec.media_type, headers=headers)
+
+
+def encode_response(function: Callable[..., tuple]) -> Callable[..., Union[tuple, Response]]:
+    """
+    Decorator encodes result (data, status code and optional headers) of endpoint or error handler with negotiated
+    codec.
+    Args:
+        function: Endpoint or error handler.
+
+    Returns:
+        Wrapped function.
+    """
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        return create_response(*function(*args, **kwargs))
+
+    return wrapper
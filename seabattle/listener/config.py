@@ -9,6 +9,41 @@ class Config:
     HOST = os.environ.get("SEABATTLE_HOST", "0.0.0.0")
     PORT = os.environ.get("SEABATTLE_PORT", 8080)
 
+    # Pool of pre-generated bot fleet layouts (size 0 disables the pool), refill rate is layouts per second.
+    FLEET_POOL_SIZE = int(os.environ.get("SEABATTLE_FLEET_POOL_SIZE", 200))
+    FLEET_POOL_REFILL_RATE = float(os.environ.get("SEABATTLE_FLEET_POOL_REFILL_RATE", 0))
+    # Log fleet pool hit/miss counters after every N games (0 disables logging).
+    FLEET_POOL_STATS_LOG_INTERVAL = int(os.environ.get("SEABATTLE_FLEET_POOL_STATS_LOG_INTERVAL", 1000))
+
+    # Pool of pre-created games for '/new-game' (high watermark 0 disables the pool). Pool is filled up to high
+    # watermark at startup, and is refilled in background when number of games falls below low watermark.
+    GAME_POOL_HIGH_WATERMARK = int(os.environ.get("SEABATTLE_GAME_POOL_HIGH_WATERMARK", 100))
+    GAME_POOL_LOW_WATERMARK = int(os.environ.get("SEABATTLE_GAME_POOL_LOW_WATERMARK", 50))
+    GAME_POOL_REFILL_RATE = float(os.environ.get("SEABATTLE_GAME_POOL_REFILL_RATE", 0))
+    GAME_POOL_STATS_LOG_INTERVAL = int(os.environ.get("SEABATTLE_GAME_POOL_STATS_LOG_INTERVAL", 1000))
+
+    # Output validation policy: 'always' (every response is validated by schema), 'sampled' (sample rate percent of
+    # responses is validated) or 'off'. Not validated responses are built by fast serializers.
+    OUTPUT_VALIDATION_POLICY = os.environ.get("SEABATTLE_OUTPUT_VALIDATION_POLICY", "sampled")
+    OUTPUT_VALIDATION_SAMPLE_RATE = float(os.environ.get("SEABATTLE_OUTPUT_VALIDATION_SAMPLE_RATE", 1))
+
+    # Number of events, that are buffered for every subscriber of game events stream (slow subscriber is disconnected
+    # when its buffer is full), and interval in seconds for keepalive comments in the stream.
+    EVENT_STREAM_BUFFER_SIZE = int(os.environ.get("SEABATTLE_EVENT_STREAM_BUFFER_SIZE", 100))
+    EVENT_STREAM_KEEPALIVE_INTERVAL = float(os.environ.get("SEABATTLE_EVENT_STREAM_KEEPALIVE_INTERVAL", 15))
+
+    # Number of the most recent responses, that are stored for every game by idempotency keys (0 disables replay).
+    IDEMPOTENCY_CACHE_SIZE = int(os.environ.get("SEABATTLE_IDEMPOTENCY_CACHE_SIZE", 16))
+
+    # Games without requests for TTL seconds are removed (0 disables expiration), expired games are checked every
+    # reap interval seconds. The least recently used game is removed, when number of games exceeds max games
+    # (0 - without limit).
+    GAME_STORAGE_TTL = float(os.environ.get("SEABATTLE_GAME_STORAGE_TTL", 3600))
+    GAME_STORAGE_MAX_GAMES = int(os.environ.get("SEABATTLE_GAME_STORAGE_MAX_GAMES", 100000))
+    GAME_STORAGE_REAP_INTERVAL = float(os.environ.get("SEABATTLE_GAME_STORAGE_REAP_INTERVAL", 10))
+    # Maximum time in seconds, that request waits for the game locked by other request, before busy error.
+    GAME_LOCK_TIMEOUT = float(os.environ.get("SEABATTLE_GAME_LOCK_TIMEOUT", 2))
+
 
 class DevConfig(Config):
     """Class for Dev environment configuration."""
@@ -17,6 +52,11 @@ class DevConfig(Config):
     DEBUG = True
     TESTING = True
 
+    FLEET_POOL_SIZE = int(os.environ.get("SEABATTLE_FLEET_POOL_SIZE", 10))
+    GAME_POOL_HIGH_WATERMARK = int(os.environ.get("SEABATTLE_GAME_POOL_HIGH_WATERMARK", 5))
+    GAME_POOL_LOW_WATERMARK = int(os.environ.get("SEABATTLE_GAME_POOL_LOW_WATERMARK", 2))
+    OUTPUT_VALIDATION_POLICY = os.environ.get("SEABATTLE_OUTPUT_VALIDATION_POLICY", "always")
+
 
 class ProdConfig(Config):
     """Class for Prod environment configuration."""
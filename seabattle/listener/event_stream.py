@@ -0,0 +1,168 @@
+"""Module contains broker of server-sent events with game changes."""
+import json
+import logging
+import queue
+import threading
+from typing import Any, Dict, Iterator, Optional, Set
+from uuid import UUID
+
+from seabattle.helpers.logger import API_LOGGER
+
+# Comment, that is sent right after subscription, so client gets response headers without waiting for events.
+CONNECTED_EVENT = b": connected\n\n"
+KEEPALIVE_EVENT = b": keepalive\n\n"
+OVERFLOW_EVENT = b"event: overflow\ndata: {}\n\n"
+# Marker, that closes subscription (it is put into subscriber queue, when game is deleted).
+CLOSE_EVENT = b""
+
+
+def format_event(event_type: str, event_id: int, data: Any) -> bytes:
+    """
+    Method serializes event in server-sent events format.
+    Args:
+        event_type: Type of event.
+        event_id: Event id (game state version).
+        data: Event data, that is serialized to JSON.
+
+    Returns:
+        Event bytes.
+    """
+    return f"id: {event_id}\nevent: {event_type}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n".encode()
+
+
+class Subscription:
+    """
+    Class contains bounded buffer of events for one subscriber. If subscriber is too slow and buffer is full,
+    subscription is marked as overflowed and doesn't get new events.
+    """
+
+    def __init__(self, buffer_size: int):
+        self.events: queue.Queue = queue.Queue(maxsize=buffer_size)
+        self.is_overflowed = False
+
+    def put(self, event: bytes) -> bool:
+        """
+        Method adds event to the buffer without blocking.
+        Args:
+            event: Event bytes.
+
+        Returns:
+            True, if event is added, else False (buffer is full and subscription is overflowed).
+        """
+        try:
+            self.events.put_nowait(event)
+        except queue.Full:
+            self.is_overflowed = True
+            return False
+        return True
+
+
+class GameEventBroker:
+    """
+    Class contains subscriptions for game events. Every event is serialized only once and the same bytes are put into
+    buffers of all game subscribers. Publisher never blocks: overflowed subscriptions are removed and their streams
+    end with overflow event after the buffered events.
+    """
+
+    def __init__(self, buffer_size: int = 100, keepalive_interval: float = 15, logger: Optional[logging.Logger] = None):
+        self.buffer_size = buffer_size
+        self.keepalive_interval = keepalive_interval
+        self.logger = logger if logger is not None else API_LOGGER
+        self._subscriptions: Dict[UUID, Set[Subscription]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, game_id: UUID) -> Subscription:
+        """
+        Method creates subscription for game events.
+        Args:
+            game_id: Game id.
+
+        Returns:
+            Subscription object.
+        """
+        subscription = Subscription(self.buffer_size)
+        with self._lock:
+            self._subscriptions.setdefault(game_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, game_id: UUID, subscription: Subscription) -> None:
+        """
+        Method removes subscription for game events.
+        Args:
+            game_id: Game id.
+            subscription: Subscription object.
+        """
+        with self._lock:
+            subscriptions = self._subscriptions.get(game_id)
+            if subscriptions is None:
+                return
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                self._subscriptions.pop(game_id)
+
+    def has_subscribers(self, game_id: UUID) -> bool:
+        """
+        Method checks if game has subscribers (events shouldn't be serialized for games without them).
+        Args:
+            game_id: Game id.
+
+        Returns:
+            True, if game has at least one subscriber.
+        """
+        return game_id in self._subscriptions
+
+    def publish(self, game_id: UUID, event: bytes) -> None:
+        """
+        Method puts event into buffers of all game subscribers.
+        Args:
+            game_id: Game id.
+            event: Serialized event.
+        """
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(game_id, ()))
+        for subscription in subscriptions:
+            if not subscription.put(event):
+                self.logger.warning(f"Event subscriber of game with id {game_id} is too slow and is disconnected.")
+                self.unsubscribe(game_id, subscription)
+
+    def close(self, game_id: UUID) -> None:
+        """
+        Method closes all subscriptions of the game.
+        Args:
+            game_id: Game id.
+        """
+        with self._lock:
+            subscriptions = self._subscriptions.pop(game_id, set())
+        for subscription in subscriptions:
+            subscription.put(CLOSE_EVENT)
+
+    def stream(self, game_id: UUID, subscription: Subscription) -> Iterator[bytes]:
+        """
+        Method yields subscription events (after connected comment). Keepalive comment is sent if there are no events
+        for keepalive interval.
+        Args:
+            game_id: Game id.
+            subscription: Subscription object.
+
+        Returns:
+            Iterator with event bytes.
+        """
+        try:
+            yield CONNECTED_EVENT
+            while True:
+                try:
+                    event = subscription.events.get(timeout=self.keepalive_interval)
+                except queue.Empty:
+                    if subscription.is_overflowed:
+                        yield OVERFLOW_EVENT
+                        return
+                    yield KEEPALIVE_EVENT
+                    continue
+                if event == CLOSE_EVENT:
+                    return
+                yield event
+                if subscription.is_overflowed and subscription.events.empty():
+                    yield OVERFLOW_EVENT
+                    return
+        finally:
+            self.unsubscribe(game_id, subscription)
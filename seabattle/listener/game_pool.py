@@ -0,0 +1,52 @@
+"""Module contains pool of pre-created games for '/new-game' endpoint."""
+import logging
+from typing import Optional
+
+from seabattle.game import Game
+from seabattle.game_objects.fleet_pool import FleetPool
+from seabattle.helpers.object_pool import ObjectPool
+
+
+class GamePool(ObjectPool):
+    """
+    Class contains bounded pool of fully created, but not issued games. Background worker refills the pool up to
+    its size, when number of games falls below low watermark. Every issued game gets new ids.
+    """
+
+    def __init__(
+            self,
+            size: int,
+            low_watermark: Optional[int] = None,
+            fleet_pool: Optional[FleetPool] = None,
+            refill_rate: float = 0,
+            stats_log_interval: int = 0,
+            logger: Optional[logging.Logger] = None
+    ):
+
+        # pylint: disable=too-many-arguments
+
+        self.fleet_pool = fleet_pool
+        super().__init__(
+            factory=self._create_game,
+            size=size,
+            low_watermark=low_watermark,
+            refill_rate=refill_rate,
+            stats_log_interval=stats_log_interval,
+            logger=logger
+        )
+
+    def _create_game(self) -> Game:
+        """Method creates new game. Pool logger is used until game is issued."""
+        enemy_fleet_coordinates = self.fleet_pool.get() if self.fleet_pool is not None else None
+        return Game(enemy_fleet_coordinates=enemy_fleet_coordinates, logger=self.logger)
+
+    def get(self) -> Game:
+        """
+        Method takes game from the pool (or creates it if pool is empty) and assigns new ids to it.
+
+        Returns:
+            Game object.
+        """
+        game = super().get()
+        game.assign_ids()
+        return game
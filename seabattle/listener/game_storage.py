@@ -0,0 +1,448 @@
+"""Module contains thread-safe storage of active games with idle timeout and bounded number of games."""
+import heapq
+import logging
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, MutableMapping, Optional, Tuple
+from uuid import UUID
+
+from seabattle.game import Game
+from seabattle.game_errors.api_errors import GameBusyApiError
+from seabattle.helpers.logger import API_LOGGER
+
+# Marker of pop call without default value.
+_MISSING = object()
+
+
+class GameStorageStripe:
+    """
+    Class contains part of storage games with its own lock, so requests for games from different stripes don't
+    contend. Games are kept in LRU order, and expiry times are kept in a heap with one valid entry per game, so every
+    eviction costs O(log n) without scanning all games. Entry of a game, that was used after it was scheduled, is
+    moved to the new expiry time when it is popped. Every game has its own lock for mutating requests, and game,
+    that is locked, isn't evicted.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, ttl: float, clock: Callable[[], float]):
+        self.ttl = ttl
+        self.clock = clock
+        self.expired = 0
+        # Games are ordered from the least to the most recently used.
+        self.games: "OrderedDict[UUID, Game]" = OrderedDict()
+        self.game_locks: Dict[UUID, threading.Lock] = {}
+        self.lock = threading.RLock()
+        self._last_activity: Dict[UUID, float] = {}
+        self._expiry_heap: List[Tuple[float, UUID]] = []
+        # Expiry time of the only valid heap entry for every game.
+        self._expiry: Dict[UUID, float] = {}
+
+    def configure(self, ttl: float) -> None:
+        """
+        Method sets idle timeout and reschedules expiration of stripe games.
+        Args:
+            ttl: Idle time in seconds, after which game is removed (0 - games don't expire).
+        """
+        with self.lock:
+            self.ttl = ttl
+            self._expiry_heap = []
+            self._expiry = {}
+            now = self.clock()
+            for game_id in self.games:
+                self._schedule(game_id, now)
+
+    def get(self, game_id: UUID) -> Game:
+        """
+        Method returns game and marks it as the most recently used.
+        Args:
+            game_id: Game id.
+
+        Returns:
+            Game object.
+        """
+        with self.lock:
+            game = self.games[game_id]
+            self._touch(game_id)
+            return game
+
+    def add(self, game_id: UUID, game: Game) -> bool:
+        """
+        Method adds game to the stripe.
+        Args:
+            game_id: Game id.
+            game: Game object.
+
+        Returns:
+            True, if game is new for the stripe, else False (game is replaced).
+        """
+        with self.lock:
+            is_new = game_id not in self.games
+            self.games[game_id] = game
+            self.game_locks.setdefault(game_id, threading.Lock())
+            self._touch(game_id)
+            if game_id not in self._expiry:
+                self._schedule(game_id, self._last_activity[game_id])
+            return is_new
+
+    def remove(self, game_id: UUID) -> Optional[Game]:
+        """
+        Method removes game from the stripe.
+        Args:
+            game_id: Game id.
+
+        Returns:
+            Removed game, or None, if there is no such game (for example, it is already evicted).
+        """
+        with self.lock:
+            game = self.games.pop(game_id, None)
+            if game is not None:
+                self._forget(game_id)
+            return game
+
+    def get_least_recently_used(self) -> Optional[Tuple[float, UUID]]:
+        """
+        Method returns the least recently used game of the stripe, that isn't locked by request.
+
+        Returns:
+            Tuple with last activity time and id of the game, or None, if stripe has no such games.
+        """
+        with self.lock:
+            game_id = self._get_least_recently_used_idle()
+            if game_id is None:
+                return None
+            return self._last_activity[game_id], game_id
+
+    def pop_least_recently_used(self, game_id: UUID) -> Optional[Game]:
+        """
+        Method removes the least recently used game of the stripe, that isn't locked by request, if it is still the
+        specified game.
+        Args:
+            game_id: Game id.
+
+        Returns:
+            Removed game, or None, if game was used, locked or removed by other request.
+        """
+        with self.lock:
+            if self._get_least_recently_used_idle() != game_id:
+                return None
+            game_lock = self.game_locks[game_id]
+            if not game_lock.acquire(blocking=False):
+                return None
+            try:
+                game = self.games.pop(game_id)
+                self._forget(game_id)
+            finally:
+                game_lock.release()
+            return game
+
+    def _get_least_recently_used_idle(self) -> Optional[UUID]:
+        """
+        Method finds the least recently used game, that isn't locked by request (game is changed by request, so it
+        can't be evicted).
+
+        Returns:
+            Game id, or None, if all games of the stripe are locked or stripe is empty.
+        """
+        for game_id in self.games:
+            if not self.game_locks[game_id].locked():
+                return game_id
+        return None
+
+    def _touch(self, game_id: UUID) -> None:
+        """
+        Method marks game as the most recently used.
+        Args:
+            game_id: Game id.
+        """
+        self.games.move_to_end(game_id)
+        self._last_activity[game_id] = self.clock()
+
+    def _schedule(self, game_id: UUID, last_activity: float) -> None:
+        """
+        Method adds heap entry with expiry time of the game.
+        Args:
+            game_id: Game id.
+            last_activity: Time of the last game activity.
+        """
+        if self.ttl <= 0:
+            return
+        expires_at = last_activity + self.ttl
+        self._expiry[game_id] = expires_at
+        heapq.heappush(self._expiry_heap, (expires_at, game_id))
+
+    def _forget(self, game_id: UUID) -> None:
+        """
+        Method removes activity data and lock of the game. Its heap entry becomes invalid and is dropped, when it is
+        popped.
+        Args:
+            game_id: Game id.
+        """
+        self.game_locks.pop(game_id, None)
+        self._last_activity.pop(game_id, None)
+        self._expiry.pop(game_id, None)
+
+    def evict_expired(self) -> List[Game]:
+        """
+        Method removes games, that are idle for longer than ttl. Game, that is locked by request, is rescheduled.
+
+        Returns:
+            List of removed games.
+        """
+        if self.ttl <= 0:
+            return []
+        now = self.clock()
+        expired_games = []
+        with self.lock:
+            while self._expiry_heap and self._expiry_heap[0][0] <= now:
+                expires_at, game_id = heapq.heappop(self._expiry_heap)
+                if self._expiry.get(game_id) != expires_at:
+                    # Game is already removed or rescheduled.
+                    continue
+                last_activity = self._last_activity[game_id]
+                if last_activity + self.ttl > now:
+                    self._schedule(game_id, last_activity)
+                    continue
+                game_lock = self.game_locks[game_id]
+                if not game_lock.acquire(blocking=False):
+                    # Game is changed by request right now, so it is active.
+                    self._schedule(game_id, now)
+                    continue
+                try:
+                    expired_games.append(self.games.pop(game_id))
+                    self._forget(game_id)
+                finally:
+                    game_lock.release()
+                self.expired += 1
+        return expired_games
+
+
+class GameStorage(MutableMapping[UUID, Game]):
+    """
+    Class contains active games by their ids and works as a dictionary. Games are split between stripes by game id,
+    every stripe has its own lock, so requests for different games scale across threads without one global lock.
+    Every access to the game updates its last activity time. Games, that are idle for longer than ttl seconds, are
+    removed by background reaper, and the least recently used game is removed, when number of games exceeds
+    max_games (0 - without limit for both). Number of games is counted for the whole storage, and evicted game is
+    chosen among the least recently used games of all stripes, so only adding of a new game takes the counter lock.
+    Mutating requests take per-game lock with bounded wait, so requests for the same game don't interleave.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+            self,
+            ttl: float = 0,
+            max_games: int = 0,
+            reap_interval: float = 1,
+            stripes_number: int = 16,
+            logger: Optional[logging.Logger] = None,
+            clock: Callable[[], float] = time.monotonic
+    ):
+
+        # pylint: disable=too-many-arguments
+
+        self.ttl = ttl
+        self.max_games = max_games
+        self.reap_interval = reap_interval
+        self.logger = logger if logger is not None else API_LOGGER
+        # Method is called for every evicted game (not for games, that are removed by client).
+        self.eviction_listener: Optional[Callable[[Game], None]] = None
+        self.evicted = 0
+        self._stripes = [GameStorageStripe(ttl, clock) for _ in range(stripes_number)]
+        self._size = 0
+        self._size_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._reaper: Optional[threading.Thread] = None
+
+    def configure(self, ttl: float, max_games: int, reap_interval: float, logger: Optional[logging.Logger] = None):
+        """
+        Method sets storage limits (storage is created before application config is loaded).
+        Args:
+            ttl: Idle time in seconds, after which game is removed (0 - games don't expire).
+            max_games: Maximum number of games (0 - without limit).
+            reap_interval: Interval in seconds between checks of expired games.
+            logger: Logger object.
+        """
+        self.ttl = ttl
+        self.max_games = max_games
+        self.reap_interval = reap_interval
+        if logger is not None:
+            self.logger = logger
+        for stripe in self._stripes:
+            stripe.configure(ttl)
+
+    def _get_stripe(self, game_id: object) -> GameStorageStripe:
+        """
+        Method chooses stripe for the game.
+        Args:
+            game_id: Game id.
+
+        Returns:
+            GameStorageStripe object.
+        """
+        return self._stripes[hash(game_id) % len(self._stripes)]
+
+    def __getitem__(self, game_id: UUID) -> Game:
+        return self._get_stripe(game_id).get(game_id)
+
+    def __setitem__(self, game_id: UUID, game: Game) -> None:
+        if not self._get_stripe(game_id).add(game_id, game):
+            return
+        evicted_games = []
+        with self._size_lock:
+            self._size += 1
+            while 0 < self.max_games < self._size:
+                evicted_game = self._pop_least_recently_used()
+                if evicted_game is None:
+                    break
+                self._size -= 1
+                self.evicted += 1
+                evicted_games.append(evicted_game)
+        for evicted_game in evicted_games:
+            self.logger.info(f"Game with id {evicted_game.id} is evicted, as storage is full.")
+            self._notify(evicted_game)
+
+    def __delitem__(self, game_id: UUID) -> None:
+        self.pop(game_id)
+
+    def pop(self, key: UUID, default: Any = _MISSING) -> Any:
+        """
+        Method removes game and returns it. Game is looked up and removed under one stripe lock, so game, that is
+        evicted by other thread at the same time, is removed (and counted) only once.
+        Args:
+            key: Game id.
+            default: Value, that is returned, if there is no such game (KeyError is raised, if it isn't set).
+
+        Returns:
+            Removed game or default value.
+        """
+        game = self._get_stripe(key).remove(key)
+        if game is None:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        with self._size_lock:
+            self._size -= 1
+        return game
+
+    def __contains__(self, game_id: object) -> bool:
+        # Check doesn't update last activity of the game.
+        return game_id in self._get_stripe(game_id).games
+
+    def __iter__(self) -> Iterator[UUID]:
+        game_ids: List[UUID] = []
+        for stripe in self._stripes:
+            with stripe.lock:
+                game_ids.extend(stripe.games)
+        return iter(game_ids)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _pop_least_recently_used(self) -> Optional[Game]:
+        """
+        Method removes the least recently used game of the storage (the oldest of stripes least recently used games).
+        Only one stripe is locked at a time. Games, that are locked by requests, are skipped.
+
+        Returns:
+            Removed game, or None, if storage is empty or all games are locked.
+        """
+        while True:
+            candidates = [
+                (candidate, stripe) for stripe in self._stripes
+                if (candidate := stripe.get_least_recently_used()) is not None
+            ]
+            if not candidates:
+                return None
+            (_, game_id), stripe = min(candidates, key=lambda candidate: candidate[0][0])
+            game = stripe.pop_least_recently_used(game_id)
+            if game is not None:
+                return game
+
+    @contextmanager
+    def lock(self, game_id: Optional[UUID], timeout: float) -> Iterator[None]:
+        """
+        Context manager holds lock of the game, so game isn't changed by other requests. If there is no such game,
+        nothing is locked (request fails on game validation).
+        Args:
+            game_id: Game id.
+            timeout: Maximum time in seconds to wait for the lock.
+        """
+        stripe = self._get_stripe(game_id)
+        with stripe.lock:
+            game_lock = stripe.game_locks.get(game_id)  # type: ignore[arg-type]
+        if game_lock is None:
+            yield
+            return
+        if not game_lock.acquire(timeout=timeout):
+            raise GameBusyApiError(f"Game with id {game_id} is busy with other request, try again later.")
+        try:
+            yield
+        finally:
+            game_lock.release()
+
+    def _notify(self, game: Game) -> None:
+        """
+        Method calls eviction listener for evicted game.
+        Args:
+            game: Evicted game.
+        """
+        if self.eviction_listener is not None:
+            self.eviction_listener(game)
+
+    def evict_expired(self) -> int:
+        """
+        Method removes games, that are idle for longer than ttl.
+
+        Returns:
+            Number of removed games.
+        """
+        expired_games_number = 0
+        for stripe in self._stripes:
+            expired_games = stripe.evict_expired()
+            expired_games_number += len(expired_games)
+            with self._size_lock:
+                self._size -= len(expired_games)
+            for game in expired_games:
+                self.logger.info(f"Game with id {game.id} is evicted after {self.ttl} seconds without activity.")
+                self._notify(game)
+        return expired_games_number
+
+    def _reap(self) -> None:
+        """Method contains reaper loop, that removes expired games."""
+        while not self._stop_event.wait(self.reap_interval):
+            self.evict_expired()
+
+    def start(self) -> None:
+        """Method starts background reaper, that removes expired games."""
+        if self.ttl <= 0 or (self._reaper is not None and self._reaper.is_alive()):
+            return
+        self._stop_event.clear()
+        self._reaper = threading.Thread(target=self._reap, name=self.__class__.__name__, daemon=True)
+        self._reaper.start()
+        self.logger.info(f"{self.__class__.__name__} reaper is started with ttl {self.ttl}, "
+                         f"max games {self.max_games} and reap interval {self.reap_interval}.")
+
+    def stop(self) -> None:
+        """Method stops background reaper."""
+        self._stop_event.set()
+        if self._reaper is not None:
+            self._reaper.join()
+            self._reaper = None
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Method collects storage statistics.
+
+        Returns:
+            Dictionary with number of games, and numbers of expired and evicted (least recently used) games.
+        """
+        with self._size_lock:
+            stats = {"size": self._size, "expired": 0, "evicted": self.evicted}
+        for stripe in self._stripes:
+            with stripe.lock:
+                stats["expired"] += stripe.expired
+        return stats
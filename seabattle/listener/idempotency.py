@@ -0,0 +1,136 @@
+"""Module contains cache of responses for requests with idempotency keys (retried requests get original response)."""
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from flask import Response, current_app, request
+from werkzeug.exceptions import BadRequest
+
+from seabattle.game_errors.api_errors import IdempotencyKeyApiError
+from seabattle.listener.validators import get_request_game_id
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+IDEMPOTENCY_REPLAYED_HEADER = "Idempotency-Replayed"
+MAX_IDEMPOTENCY_KEY_LENGTH = 255
+
+
+@dataclass(frozen=True)
+class StoredResponse:
+    """Class contains encoded response and fingerprint of request, that produced it."""
+    fingerprint: str
+    body: bytes
+    status_code: int
+    mimetype: Optional[str]
+
+
+class IdempotencyCache:
+    """
+    Class contains the most recent responses for every game by idempotency keys. Number of responses for one game is
+    bounded, the oldest response is removed first. Responses are stored already encoded, so replay doesn't run game
+    logic and serialization. Request fingerprint contains negotiated representation of the response (for example,
+    media type and battlefields format), so response isn't replayed in a representation, that client didn't ask for.
+    """
+
+    def __init__(self, size: int = 16, get_representation: Optional[Callable[[], Hashable]] = None):
+        self.size = size
+        self.get_representation = get_representation
+        self._responses: Dict[str, "OrderedDict[str, StoredResponse]"] = {}
+        self._lock = threading.Lock()
+        self.replays = 0
+
+    def get(self, game_id: str, key: str) -> Optional[StoredResponse]:
+        """
+        Method returns stored response for idempotency key.
+        Args:
+            game_id: Game id.
+            key: Idempotency key.
+
+        Returns:
+            StoredResponse object or None, if there is no response for the key.
+        """
+        with self._lock:
+            return self._responses.get(game_id, {}).get(key)
+
+    def add(self, game_id: str, key: str, response: StoredResponse) -> None:
+        """
+        Method stores response for idempotency key (the oldest game response is removed, if cache is full).
+        Args:
+            game_id: Game id.
+            key: Idempotency key.
+            response: StoredResponse object.
+        """
+        if self.size <= 0:
+            return
+        with self._lock:
+            responses = self._responses.setdefault(game_id, OrderedDict())
+            responses[key] = response
+            if len(responses) > self.size:
+                responses.popitem(last=False)
+
+    def discard(self, game_id: str) -> None:
+        """
+        Method removes all stored responses of the game.
+        Args:
+            game_id: Game id.
+        """
+        with self._lock:
+            self._responses.pop(game_id, None)
+
+    def get_fingerprint(self) -> str:
+        """
+        Method creates fingerprint of current request from its path, negotiated response representation and body.
+
+        Returns:
+            Request fingerprint.
+        """
+        representation = self.get_representation() if self.get_representation is not None else None
+        return hashlib.sha256(
+            request.path.encode() + b"\n" + repr(representation).encode() + b"\n" + request.get_data()
+        ).hexdigest()
+
+    def idempotent(self, function: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Decorator makes mutating endpoint idempotent for requests with Idempotency-Key header. Successful response is
+        stored for the key, and request with the same key, body and response representation gets stored response back.
+        Request with the same key and other body or representation is rejected. Requests without the key work as usual.
+        Args:
+            function: Endpoint.
+
+        Returns:
+            Wrapped function.
+        """
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            key = request.headers.get(IDEMPOTENCY_KEY_HEADER)
+            if key is None:
+                return function(*args, **kwargs)
+            if not key or len(key) > MAX_IDEMPOTENCY_KEY_LENGTH:
+                raise BadRequest(f"{IDEMPOTENCY_KEY_HEADER} header should contain from 1 to "
+                                 f"{MAX_IDEMPOTENCY_KEY_LENGTH} symbols.")
+            game_id = str(get_request_game_id())
+            fingerprint = self.get_fingerprint()
+
+            stored_response = self.get(game_id, key)
+            if stored_response is not None:
+                if stored_response.fingerprint != fingerprint:
+                    raise IdempotencyKeyApiError(f"Idempotency key {key} is already used for other request.")
+                with self._lock:
+                    self.replays += 1
+                response = Response(
+                    stored_response.body, status=stored_response.status_code, mimetype=stored_response.mimetype
+                )
+                response.headers[IDEMPOTENCY_REPLAYED_HEADER] = "true"
+                return response
+
+            response = current_app.make_response(function(*args, **kwargs))
+            if response.status_code < 300:
+                self.add(game_id, key, StoredResponse(
+                    fingerprint, response.get_data(), response.status_code, response.mimetype
+                ))
+            return response
+
+        return wrapper
@@ -1,33 +1,217 @@
 """Module contains flash application for running and interacting with games."""
 import json
 import os
-from flask import Flask, request
+from functools import partial, wraps
+from typing import Any, Callable, Optional
+from uuid import UUID
+
+from flask import Flask, Response, request
 from flask_swagger_ui import get_swaggerui_blueprint  # type: ignore
 from marshmallow import ValidationError
+from werkzeug.exceptions import NotFound
 from seabattle.game import Game
-from seabattle.helpers.constants import StatusCode, SWAGGER_URL, API_URL, API_NAME, API_VERSION
+from seabattle.game_errors.api_errors import GameBusyApiError, IdempotencyKeyApiError
+from seabattle.game_objects.fleet_pool import FleetPool
+from seabattle.helpers.constants import StatusCode, SWAGGER_URL, API_URL, API_NAME, API_VERSION, BoardFormat, \
+    BOARD_FORMAT_MEDIA_TYPES
 from seabattle.helpers.logger import API_LOGGER
 from seabattle.listener import config
-from seabattle.listener.api_error_handlers import handle_validation_error, handle_application_error, handle_api_error
+from seabattle.listener.api_error_handlers import handle_validation_error, handle_application_error, handle_api_error, \
+    handle_game_busy_error, handle_idempotency_key_error
 from seabattle.listener.apispec_generator import get_apispec
+from seabattle.listener.codecs import CODECS, JSON_CODEC, encode_response, get_json_media_type, get_request_data, \
+    get_response_codec, set_json_media_type
+from seabattle.listener.event_stream import GameEventBroker, format_event
+from seabattle.listener.game_pool import GamePool
+from seabattle.listener.idempotency import IdempotencyCache
+from seabattle.listener.output_validation import OutputValidator
+from seabattle.listener.serializers import GAME_INFO_SERIALIZERS, serialize_new_ship_info
+from seabattle.listener.state_cache import GameStateCache
 from seabattle.listener.validators import (
     GAME_STORAGE,
+    get_request_game_id,
     validate_game_and_player,
     validate_create_game_info_response,
+    validate_create_new_game_request,
     validate_start_game_request,
     validate_create_new_ship_request,
+    validate_create_new_fleet_request,
     validate_create_new_ship_response,
     validate_player_shoot_request,
-    validate_enemy_shoot_request
+    validate_enemy_shoot_request,
+    validate_auto_play_request
 )
 
 app = Flask(__name__)
-app.register_error_handler(Exception, handle_application_error)
-app.register_error_handler(ValidationError, handle_validation_error)
-app.register_error_handler(StatusCode.BAD_REQUEST.value, handle_api_error)
-app.register_error_handler(StatusCode.ENTITY_NOT_FOUND.value, handle_api_error)
+app.register_error_handler(Exception, encode_response(handle_application_error))
+app.register_error_handler(ValidationError, encode_response(handle_validation_error))
+app.register_error_handler(GameBusyApiError, encode_response(handle_game_busy_error))
+app.register_error_handler(IdempotencyKeyApiError, encode_response(handle_idempotency_key_error))
+app.register_error_handler(StatusCode.BAD_REQUEST.value, encode_response(handle_api_error))
+app.register_error_handler(StatusCode.ENTITY_NOT_FOUND.value, encode_response(handle_api_error))
 app.config.from_object(getattr(config, os.environ.get("SEABATTLE_SETTINGS", "DevConfig")))
 
+FLEET_POOL = FleetPool(
+    size=app.config["FLEET_POOL_SIZE"],
+    refill_rate=app.config["FLEET_POOL_REFILL_RATE"],
+    stats_log_interval=app.config["FLEET_POOL_STATS_LOG_INTERVAL"],
+    logger=API_LOGGER
+)
+FLEET_POOL.start()
+
+GAME_POOL = GamePool(
+    size=app.config["GAME_POOL_HIGH_WATERMARK"],
+    low_watermark=app.config["GAME_POOL_LOW_WATERMARK"],
+    fleet_pool=FLEET_POOL,
+    refill_rate=app.config["GAME_POOL_REFILL_RATE"],
+    stats_log_interval=app.config["GAME_POOL_STATS_LOG_INTERVAL"],
+    logger=API_LOGGER
+)
+# Warm up the pool before the first request.
+GAME_POOL.fill()
+GAME_POOL.start()
+
+OUTPUT_VALIDATOR = OutputValidator(
+    policy=app.config["OUTPUT_VALIDATION_POLICY"],
+    sample_rate=app.config["OUTPUT_VALIDATION_SAMPLE_RATE"],
+    logger=API_LOGGER
+)
+
+EVENT_BROKER = GameEventBroker(
+    buffer_size=app.config["EVENT_STREAM_BUFFER_SIZE"],
+    keepalive_interval=app.config["EVENT_STREAM_KEEPALIVE_INTERVAL"],
+    logger=API_LOGGER
+)
+
+GAME_STATE_CACHE = GameStateCache()
+
+# Stored response is replayed only in the same media type and battlefields format, as client asks for.
+IDEMPOTENCY_CACHE = IdempotencyCache(
+    size=app.config["IDEMPOTENCY_CACHE_SIZE"],
+    get_representation=lambda: (get_board_format().value, (get_response_codec() or JSON_CODEC).media_type)
+)
+
+
+def release_game(game_id: UUID) -> None:
+    """
+    Method releases resources of the game, that is removed from game storage (closes event streams and drops cached
+    responses).
+    Args:
+        game_id: Game id.
+    """
+    EVENT_BROKER.close(game_id)
+    GAME_STATE_CACHE.discard(game_id)
+    IDEMPOTENCY_CACHE.discard(str(game_id))
+
+
+GAME_STORAGE.configure(
+    ttl=app.config["GAME_STORAGE_TTL"],
+    max_games=app.config["GAME_STORAGE_MAX_GAMES"],
+    reap_interval=app.config["GAME_STORAGE_REAP_INTERVAL"],
+    logger=API_LOGGER
+)
+GAME_STORAGE.eviction_listener = lambda game: release_game(game.id)
+GAME_STORAGE.start()
+
+
+def lock_game(function: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Decorator runs mutating endpoint under lock of the game from request, so requests for the same game don't
+    interleave. If game is locked for longer than lock timeout, busy error is raised.
+    Args:
+        function: Endpoint.
+
+    Returns:
+        Wrapped function.
+    """
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        with GAME_STORAGE.lock(get_request_game_id(), app.config["GAME_LOCK_TIMEOUT"]):
+            return function(*args, **kwargs)
+
+    return wrapper
+
+
+def publish_game_change(game: Game, event_type: str) -> None:
+    """
+    Method publishes game change event with cells, that were changed by the last state change. Event is serialized
+    only if game has subscribers.
+    Args:
+        game: Game object.
+        event_type: Type of state change ('change' or 'start').
+    """
+    if not EVENT_BROKER.has_subscribers(game.id):
+        return
+    since_version = game.version - 1 if event_type == "change" else game.version
+    data = create_public_game_info_response(game.return_game_state(since_version))
+    EVENT_BROKER.publish(game.id, format_event(event_type, game.version, data))
+
+
+def get_board_format(player_data: Optional[dict] = None) -> BoardFormat:
+    """
+    Method defines format of battlefields in response: from request field, or from Accept header.
+    Args:
+        player_data: Validated request data.
+
+    Returns:
+        Format of battlefields (cells format by default).
+    """
+    if player_data is not None and player_data.get("board_format") is not None:
+        return player_data["board_format"]
+    media_type = request.accept_mimetypes.best_match(["application/json", *BOARD_FORMAT_MEDIA_TYPES])
+    if media_type not in BOARD_FORMAT_MEDIA_TYPES:
+        return BoardFormat.CELLS
+    # JSON response is answered with negotiated media type.
+    set_json_media_type(media_type)
+    return BOARD_FORMAT_MEDIA_TYPES[media_type]
+
+
+def create_game_info_response(data: dict, board_format: BoardFormat = BoardFormat.CELLS) -> dict:
+    """
+    Method creates response for several endpoints that return full game information.
+    Args:
+        data: Game information.
+        board_format: Format of battlefields in game information.
+
+    Returns:
+        dict: Response data (validated by schema according to output validation policy).
+    """
+    return OUTPUT_VALIDATOR.create_response(
+        data,
+        partial(validate_create_game_info_response, board_format=board_format),
+        GAME_INFO_SERIALIZERS[board_format]
+    )
+
+
+def create_public_game_info_response(data: dict, board_format: BoardFormat = BoardFormat.CELLS) -> dict:
+    """
+    Method creates game information response for read-only endpoints, that don't require player id.
+    Args:
+        data: Game information.
+        board_format: Format of battlefields in game information.
+
+    Returns:
+        dict: Response data without player id.
+    """
+    response = create_game_info_response(data, board_format)
+    # Player id is a secret of the player, spectators shouldn't get it.
+    response.pop("playerId")
+    return response
+
+
+def create_new_ship_response(data: dict) -> dict:
+    """
+    Method creates response for '/new-ship' endpoint.
+    Args:
+        data: Information about added ship.
+
+    Returns:
+        dict: Response data (validated by schema according to output validation policy).
+    """
+    return OUTPUT_VALIDATOR.create_response(data, validate_create_new_ship_response, serialize_new_ship_info)
+
+
 swagger_ui_blueprint = get_swaggerui_blueprint(
     base_url=SWAGGER_URL,
     api_url=API_URL,
@@ -50,12 +234,43 @@ def health_check():
     return "Hi, I'm OK!", StatusCode.OK.value
 
 
+@app.route("/stats", methods=["GET"])
+def get_stats():
+    """
+    ---
+    get:
+        summary: Method returns statistics of game storage and pools.
+        responses:
+            "200":
+                description: Number of games in storage, numbers of expired and evicted games, and hit/miss counters
+                    of game and fleet pools.
+                content:
+                    application/json:
+                        schema:
+                            type: object
+        tags:
+            - Endpoints
+    """
+    return {
+        "gameStorage": GAME_STORAGE.get_stats(),
+        "gamePool": GAME_POOL.get_stats(),
+        "fleetPool": FLEET_POOL.get_stats()
+    }, StatusCode.OK.value
+
+
 @app.route("/new-game", methods=["POST"])
+@encode_response
 def create_new_game():
     """
     ---
     post:
         summary: Method creates a new game.
+        requestBody:
+            description: API for creating a new game (player fleet can be placed automatically).
+            required: false
+            content:
+                application/json:
+                    schema: CreateNewGameInputSchema
         responses:
             "200":
                 description: OK
@@ -65,19 +280,39 @@ def create_new_game():
         tags:
             - Endpoints
     """
-    game = Game()
+    # Request body is optional for '/new-game', body of other media types is ignored (as before body was added).
+    has_body = request.get_data() and (request.is_json or request.mimetype in CODECS)
+    player_data = validate_create_new_game_request(get_request_data() if has_body else {})
+    game = GAME_POOL.get()
     API_LOGGER.info(f"Create game with id: {game.id}")
+    if player_data["auto_place_fleet"]:
+        # Layout is taken from the same pool as bot layouts, so placement costs the same as for bot.
+        game.player_auto_place_fleet(FLEET_POOL.get())
+        API_LOGGER.info(f"Player fleet is auto placed in game with id: {game.id}")
+    game.change_listener = publish_game_change
     GAME_STORAGE.update({game.id: game})
-    response = validate_create_game_info_response(game.return_game_state())
+    board_format = get_board_format(player_data)
+    response = create_game_info_response(game.return_game_state(board_format=board_format), board_format)
     return response, StatusCode.OK.value
 
 
 @app.route("/new-ship", methods=["POST"])
+@lock_game
+@IDEMPOTENCY_CACHE.idempotent
+@encode_response
 def add_new_ship():
     """
     ---
     post:
         summary: Method creates a new ship for the game.
+        parameters:
+            - in: header
+              name: Idempotency-Key
+              description: Key of the request. Retried request with the same key gets the original response.
+              schema:
+                type: string
+                maxLength: 255
+              required: false
         requestBody:
             description: API for adding a new ship to game board.
             required: true
@@ -93,22 +328,75 @@ def add_new_ship():
         tags:
             - Endpoints
     """
-    player_data = validate_create_new_ship_request(request.json)
+    player_data = validate_create_new_ship_request(get_request_data())
     game = validate_game_and_player(player_data)
     API_LOGGER.info(f"Try to add ship with coordinates: {player_data['coordinates']} to game with id {game.id}.")
     coordinates = player_data.pop("coordinates")
     player_ship_cells = game.player_set_ship(coordinates)
-    response = validate_create_new_ship_response({**player_ship_cells, **player_data})
+    response = create_new_ship_response({**player_ship_cells, **player_data})
     API_LOGGER.info(f"Successfully added ship with coordinates: {coordinates} to game with id {game.id}.")
     return response, StatusCode.OK.value
 
 
+@app.route("/new-fleet", methods=["POST"])
+@lock_game
+@IDEMPOTENCY_CACHE.idempotent
+@encode_response
+def add_new_fleet():
+    """
+    ---
+    post:
+        summary: Method creates several ships for the game at once (all ships are added or none).
+        parameters:
+            - in: header
+              name: Idempotency-Key
+              description: Key of the request. Retried request with the same key gets the original response.
+              schema:
+                type: string
+                maxLength: 255
+              required: false
+        requestBody:
+            description: API for adding the whole fleet to game board in one request.
+            required: true
+            content:
+                application/json:
+                    schema: CreateNewFleetInputSchema
+        responses:
+            "200":
+                description: OK
+                content:
+                    application/json:
+                        schema: CreateNewShipOutputSchema
+        tags:
+            - Endpoints
+    """
+    player_data = validate_create_new_fleet_request(get_request_data())
+    game = validate_game_and_player(player_data)
+    API_LOGGER.info(f"Try to add fleet with coordinates: {player_data['ships']} to game with id {game.id}.")
+    fleet_coordinates = player_data.pop("ships")
+    player_ship_cells = game.player_set_fleet(fleet_coordinates)
+    response = create_new_ship_response({**player_ship_cells, **player_data})
+    API_LOGGER.info(f"Successfully added fleet with {len(fleet_coordinates)} ships to game with id {game.id}.")
+    return response, StatusCode.OK.value
+
+
 @app.route("/game-start", methods=["POST"])
+@lock_game
+@IDEMPOTENCY_CACHE.idempotent
+@encode_response
 def start_game():
     """
     ---
     post:
         summary: Method starts a game.
+        parameters:
+            - in: header
+              name: Idempotency-Key
+              description: Key of the request. Retried request with the same key gets the original response.
+              schema:
+                type: string
+                maxLength: 255
+              required: false
         requestBody:
             description: API for starting a new game.
             required: true
@@ -124,21 +412,33 @@ def start_game():
         tags:
             - Endpoints
     """
-    player_data = validate_start_game_request(request.json)
+    player_data = validate_start_game_request(get_request_data())
     game = validate_game_and_player(player_data)
     API_LOGGER.info(f"Try to start game with id {game.id}.")
-    response = game.start_game()
-    response = validate_create_game_info_response({**response})
+    board_format = get_board_format(player_data)
+    response = game.start_game(board_format)
+    response = create_game_info_response({**response}, board_format)
     API_LOGGER.info(f"Game with id {game.id} is started.")
     return response, StatusCode.OK.value
 
 
 @app.route("/player-shoot", methods=["POST"])
+@lock_game
+@IDEMPOTENCY_CACHE.idempotent
+@encode_response
 def player_shoot():
     """
     ---
     post:
         summary: Method calls player shooting method.
+        parameters:
+            - in: header
+              name: Idempotency-Key
+              description: Key of the request. Retried request with the same key gets the original response.
+              schema:
+                type: string
+                maxLength: 255
+              required: false
         requestBody:
             description: API for player shooting.
             required: true
@@ -154,11 +454,14 @@ def player_shoot():
         tags:
             - Endpoints
     """
-    player_data = validate_player_shoot_request(request.json)
+    player_data = validate_player_shoot_request(get_request_data())
     game = validate_game_and_player(player_data)
     API_LOGGER.info(f"Player is trying to shoot on coordinate {player_data['coordinate']} in game with id {game.id}.")
-    result = game.player_shoot(player_data["coordinate"])
-    response = validate_create_game_info_response({**result})
+    board_format = get_board_format(player_data)
+    result = game.player_shoot(
+        player_data["coordinate"], player_data["state_version"], board_format, player_data["with_enemy_reply"]
+    )
+    response = create_game_info_response({**result}, board_format)
     API_LOGGER.info(f"Player doesn't have any problems with shooting on coordinate {player_data['coordinate']} "
                     f"in game with id {game.id}.")
 
@@ -166,11 +469,22 @@ def player_shoot():
 
 
 @app.route("/enemy-shoot", methods=["POST"])
+@lock_game
+@IDEMPOTENCY_CACHE.idempotent
+@encode_response
 def enemy_shoot():
     """
     ---
     post:
         summary: Method calls enemy shooting method.
+        parameters:
+            - in: header
+              name: Idempotency-Key
+              description: Key of the request. Retried request with the same key gets the original response.
+              schema:
+                type: string
+                maxLength: 255
+              required: false
         requestBody:
             description: API for enemy shooting.
             required: true
@@ -186,17 +500,63 @@ def enemy_shoot():
         tags:
             - Endpoints
     """
-    player_data = validate_enemy_shoot_request(request.json)
+    player_data = validate_enemy_shoot_request(get_request_data())
     game = validate_game_and_player(player_data)
     API_LOGGER.info(f"Enemy is trying to shoot in game with id {game.id}.")
-    result = game.enemy_shoot()
-    response = validate_create_game_info_response({**result})
+    board_format = get_board_format(player_data)
+    result = game.enemy_shoot(player_data["state_version"], board_format)
+    response = create_game_info_response({**result}, board_format)
     API_LOGGER.info(f"Enemy doesn't have any problems with shooting in game with id {game.id}.")
 
     return response, StatusCode.OK.value
 
 
+@app.route("/auto-play", methods=["POST"])
+@lock_game
+@IDEMPOTENCY_CACHE.idempotent
+@encode_response
+def auto_play():
+    """
+    ---
+    post:
+        summary: Method plays the game for both sides with bot targeting (to completion or for several moves).
+        parameters:
+            - in: header
+              name: Idempotency-Key
+              description: Key of the request. Retried request with the same key gets the original response.
+              schema:
+                type: string
+                maxLength: 255
+              required: false
+        requestBody:
+            description: API for playing the game on server side.
+            required: true
+            content:
+                application/json:
+                    schema: AutoPlayInputSchema
+        responses:
+            "200":
+                description: OK
+                content:
+                    application/json:
+                        schema: CreateGameInfoOutputSchema
+        tags:
+            - Endpoints
+    """
+    player_data = validate_auto_play_request(get_request_data())
+    game = validate_game_and_player(player_data)
+    API_LOGGER.info(f"Try to auto play game with id {game.id}.")
+    board_format = get_board_format(player_data)
+    result = game.auto_play(player_data["max_moves"], player_data["state_version"], board_format)
+    response = create_game_info_response({**result}, board_format)
+    API_LOGGER.info(f"Game with id {game.id} was auto played for {len(result['move_log'])} moves.")
+
+    return response, StatusCode.OK.value
+
+
 @app.route("/exit", methods=["POST"])
+@lock_game
+@encode_response
 def exit_game():
     """
     ---
@@ -218,19 +578,132 @@ def exit_game():
             - Endpoints
     """
     # Use the same validation as for start game.
-    player_data = validate_start_game_request(request.json)
+    player_data = validate_start_game_request(get_request_data())
     game = validate_game_and_player(player_data, True)
     API_LOGGER.info(f"Try to exit game with id {game.id}.")
-    GAME_STORAGE.pop(game.id)
+    # Game could be evicted after validation, then it is already released, and pop doesn't fail.
+    if GAME_STORAGE.pop(game.id, None) is not None:
+        release_game(game.id)
     API_LOGGER.info(f"Game with id {game.id} is stopped and deleted.")
     return {}, StatusCode.OK.value
 
 
+@app.route("/games/<uuid:game_id>", methods=["GET"])
+def get_game_state(game_id: UUID):
+    """
+    ---
+    get:
+        summary: Method returns current game state without changing it.
+        parameters:
+            - in: path
+              name: game_id
+              schema:
+                type: string
+                format: uuid
+              required: true
+            - in: header
+              name: If-None-Match
+              schema:
+                type: string
+              required: false
+        responses:
+            "200":
+                description: Full game state (without player id). Response contains ETag header, that is changed only
+                    after game changes.
+                headers:
+                    ETag:
+                        schema:
+                            type: string
+                content:
+                    application/json:
+                        schema: GameStartOutputSchema
+            "304":
+                description: Game isn't changed since the state with ETag from If-None-Match header.
+            "404":
+                description: There is no game with such id.
+        tags:
+            - Endpoints
+    """
+    game = GAME_STORAGE.get(game_id)
+    if game is None:
+        # Resource of read-only endpoint is missing, so it is answered with 404 (not with application error).
+        raise NotFound(f"No game with id: {game_id}")
+    board_format = get_board_format()
+    codec = get_response_codec() or JSON_CODEC
+    # ETag is built from game revision without serialization, so unchanged game costs only this comparison.
+    etag_suffix = f"{board_format.value}-{codec.media_type.rsplit('/', 1)[-1]}"
+    etag = f"{GAME_STATE_CACHE.get_revision(game)}-{etag_suffix}"
+    data = None
+    if not request.if_none_match.contains(etag):
+        # Game is locked, so state isn't serialized in the middle of other request.
+        with GAME_STORAGE.lock(game_id, app.config["GAME_LOCK_TIMEOUT"]):
+            revision, data = GAME_STATE_CACHE.get(
+                game,
+                (board_format, codec.media_type),
+                lambda cached_game: codec.encode(create_public_game_info_response(
+                    cached_game.return_game_state(board_format=board_format), board_format
+                ))
+            )
+        # Game could be changed while request waited for the lock, so ETag is built from serialized revision.
+        etag = f"{revision}-{etag_suffix}"
+    if data is None or request.if_none_match.contains(etag):
+        response = Response(status=StatusCode.NOT_MODIFIED.value)
+    else:
+        media_type = get_json_media_type() if codec is JSON_CODEC else codec.media_type
+        response = Response(data, status=StatusCode.OK.value, mimetype=media_type)
+    response.set_etag(etag)
+    # Clients should always revalidate cached state, as game can be changed at any moment.
+    response.headers["Cache-Control"] = "no-cache"
+    response.vary.add("Accept")
+    return response
+
+
+@app.route("/games/<uuid:game_id>/events", methods=["GET"])
+def stream_game_events(game_id: UUID):
+    """
+    ---
+    get:
+        summary: Method streams game changes as server-sent events.
+        parameters:
+            - in: path
+              name: game_id
+              schema:
+                type: string
+                format: uuid
+              required: true
+        responses:
+            "200":
+                description: Stream of 'start' and 'change' events with changed cells (the same data as delta
+                    responses of shooting endpoints, but without player id). Stream ends with 'overflow' event,
+                    if client is too slow to read events.
+                content:
+                    text/event-stream:
+                        schema:
+                            type: string
+            "404":
+                description: There is no game with such id.
+        tags:
+            - Endpoints
+    """
+    API_LOGGER.info(f"Subscribe to events of game with id {game_id}.")
+    # Game is checked after subscription: game, that is removed later, closes the subscription, and game, that is
+    # already removed (its subscriptions are closed before this one is created), is reported as missing.
+    subscription = EVENT_BROKER.subscribe(game_id)
+    if game_id not in GAME_STORAGE:
+        EVENT_BROKER.unsubscribe(game_id, subscription)
+        raise NotFound(f"No game with id: {game_id}")
+    return Response(
+        EVENT_BROKER.stream(game_id, subscription),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @app.route("/apidocs", methods=["GET"])
 def create_swagger_spec():
     """Method creates swagger endpoint."""
     API_LOGGER.info("Generate API Specification.")
-    return json.dumps(get_apispec(app, API_NAME, API_VERSION).to_dict())
+    return json.dumps(get_apispec(app, API_NAME, API_VERSION, tuple(CODECS)).to_dict())
 
 
 app.register_blueprint(swagger_ui_blueprint)
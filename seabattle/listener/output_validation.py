@@ -0,0 +1,92 @@
+"""Module contains output validation policy for api responses."""
+import logging
+import random
+import threading
+from typing import Callable, Dict, Optional
+
+from marshmallow import ValidationError
+
+from seabattle.helpers.logger import API_LOGGER
+
+ALWAYS = "always"
+SAMPLED = "sampled"
+OFF = "off"
+POLICIES = (ALWAYS, SAMPLED, OFF)
+
+
+class OutputValidator:
+    """
+    Class contains output validation policy: responses are always validated by schema, validated only for sampled
+    percent of responses, or not validated at all. Not validated responses are built by fast serializers.
+    Violations are counted and logged. In 'always' mode violation is raised, in 'sampled' mode response is returned
+    anyway, so clients don't get errors because of the check.
+    """
+
+    def __init__(self, policy: str = ALWAYS, sample_rate: float = 0, logger: Optional[logging.Logger] = None):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown output validation policy: {policy}. Should be one of {POLICIES}.")
+        self.policy = policy
+        self.sample_rate = sample_rate
+        self.logger = logger if logger is not None else API_LOGGER
+        self.checks = 0
+        self.violations = 0
+        self._stats_lock = threading.Lock()
+
+    def _is_sampled(self) -> bool:
+        """Method defines if the current response should be validated."""
+        if self.policy == ALWAYS:
+            return True
+        if self.policy == SAMPLED:
+            return random.random() * 100 < self.sample_rate
+        return False
+
+    def _register_check(self, error: Optional[ValidationError] = None) -> None:
+        """
+        Method updates validation counters and logs violation.
+        Args:
+            error: Validation error, if response doesn't match the schema.
+        """
+        with self._stats_lock:
+            self.checks += 1
+            if error is not None:
+                self.violations += 1
+        if error is not None:
+            self.logger.error(f"Output validation violation: {error.messages}. Stats: {self.get_stats()}.")
+
+    def create_response(
+            self,
+            data: dict,
+            validate_func: Callable[[dict], dict],
+            serialize_func: Callable[[dict], dict]
+    ) -> dict:
+        """
+        Method creates response according to the policy.
+        Args:
+            data: Response data with snake case keys.
+            validate_func: Function, that validates data by schema and dumps it.
+            serialize_func: Function, that dumps data without validation.
+
+        Returns:
+            dict: Response data.
+        """
+        if not self._is_sampled():
+            return serialize_func(data)
+        try:
+            response = validate_func(data)
+        except ValidationError as error:
+            self._register_check(error)
+            if self.policy == ALWAYS:
+                raise
+            return serialize_func(data)
+        self._register_check()
+        return response
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Method collects validation statistics.
+
+        Returns:
+            Dictionary with number of validated responses and violations.
+        """
+        with self._stats_lock:
+            return {"checks": self.checks, "violations": self.violations}
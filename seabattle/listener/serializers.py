@@ -0,0 +1,70 @@
+"""Module contains fast serializers, that build api responses without marshmallow validation."""
+from typing import Any, Callable
+
+from marshmallow import Schema, fields as ma_fields
+
+from seabattle.helpers.constants import BoardFormat
+from seabattle.listener.validators import GAME_INFO_OUTPUT_SCHEMAS, CREATE_NEW_SHIP_OUTPUT_SCHEMA
+
+
+def _identity(value: Any) -> Any:
+    """Method returns value without changes."""
+    return value
+
+
+def _get_converter(field: ma_fields.Field) -> Callable[[Any], Any]:
+    """
+    Method chooses function, that converts value the same way as marshmallow load and dump do.
+    Args:
+        field: Schema field.
+
+    Returns:
+        Function for value converting.
+    """
+    if isinstance(field, ma_fields.UUID):
+        return str
+    if isinstance(field, ma_fields.Int):
+        return int
+    if isinstance(field, ma_fields.Nested):
+        nested_serializer = compile_serializer(field.schema)
+        if field.schema.many:
+            return lambda values: [nested_serializer(value) for value in values]
+        return nested_serializer
+    return _identity
+
+
+def compile_serializer(schema: Schema) -> Callable[[dict], dict]:
+    """
+    Method creates serializer for output schema. Camel case keys and converters for every field are defined only once,
+    so serializer returns the same data as schema load and dump, but without validation.
+    Not required fields are added to response only if they are in data.
+    Args:
+        schema: Output schema object.
+
+    Returns:
+        Function, that converts dictionary with snake case keys into response with camel case keys.
+    """
+    converters = tuple(
+        (name, field.data_key or name, _get_converter(field)) for name, field in schema.fields.items()
+        if field.required
+    )
+    optional_converters = tuple(
+        (name, field.data_key or name, _get_converter(field)) for name, field in schema.fields.items()
+        if not field.required
+    )
+
+    def serialize(data: dict) -> dict:
+        response = {data_key: convert(data[name]) for name, data_key, convert in converters}
+        for name, data_key, convert in optional_converters:
+            if name in data:
+                response[data_key] = convert(data[name])
+        return response
+
+    return serialize
+
+
+GAME_INFO_SERIALIZERS = {
+    board_format: compile_serializer(schema) for board_format, schema in GAME_INFO_OUTPUT_SCHEMAS.items()
+}
+serialize_game_info = GAME_INFO_SERIALIZERS[BoardFormat.CELLS]
+serialize_new_ship_info = compile_serializer(CREATE_NEW_SHIP_OUTPUT_SCHEMA)
@@ -0,0 +1,73 @@
+"""Module contains cache of serialized game states for read-only game state endpoint."""
+import threading
+from typing import Callable, Dict, Hashable, Tuple
+from uuid import UUID
+
+from seabattle.game import Game
+
+
+class GameStateCache:
+    """
+    Class contains serialized game states for every game. Cached state is identified by game revision (state version
+    and start flag), so it is replaced only after game mutation. Every representation of the state (battlefields
+    format, media type) is serialized once per revision.
+    """
+
+    def __init__(self):
+        self._states: Dict[UUID, Tuple[str, Dict[Hashable, bytes]]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def get_revision(game: Game) -> str:
+        """
+        Method creates game revision, that is changed on every game mutation. Revision is cheap, so it can be
+        compared with client's one without serialization.
+        Args:
+            game: Game object.
+
+        Returns:
+            Game revision.
+        """
+        return f"{game.id.hex}-{game.version}-{int(game.is_game_started)}"
+
+    def get(self, game: Game, representation: Hashable, serialize: Callable[[Game], bytes]) -> Tuple[str, bytes]:
+        """
+        Method returns serialized game state for current game revision. State is serialized only if it isn't cached.
+        Args:
+            game: Game object.
+            representation: Key of state representation (for example, battlefields format and media type).
+            serialize: Function, that serializes game state.
+
+        Returns:
+            Tuple with game revision and serialized game state.
+        """
+        revision = self.get_revision(game)
+        with self._lock:
+            cached_revision, representations = self._states.get(game.id, (None, {}))
+            if cached_revision == revision and representation in representations:
+                self.hits += 1
+                return revision, representations[representation]
+            self.misses += 1
+        data = serialize(game)
+        with self._lock:
+            cached_revision, representations = self._states.get(game.id, (None, {}))
+            if cached_revision != revision:
+                # Game is changed, so all its cached representations are outdated.
+                representations = {}
+                self._states[game.id] = (revision, representations)
+            representations[representation] = data
+        return revision, data
+
+    def discard(self, game_id: UUID) -> None:
+        """
+        Method removes cached states of the game.
+        Args:
+            game_id: Game id.
+        """
+        with self._lock:
+            self._states.pop(game_id, None)
+
+    def __len__(self) -> int:
+        return len(self._states)
@@ -1,10 +1,18 @@
 """Module contains validation schemas for checking api input ana output data."""
+from functools import lru_cache
+
 import inflection
 from marshmallow import Schema, fields as ma_fields, validate, pre_load
 
+from seabattle.helpers.constants import DEFAULT_BATTLEFIELD_SIZE, BoardFormat
+
+# Length of battlefield in rows format (one sign for every cell).
+BATTLEFIELD_CELLS_NUMBER = DEFAULT_BATTLEFIELD_SIZE ** 2
+
 
+@lru_cache(maxsize=None)
 def camelaze(param):
-    """This method converts marshmallow fields to camel case."""
+    """This method converts marshmallow fields to camel case (result is cached, as there are few field names)."""
     return inflection.camelize(param, False)
 
 
@@ -70,17 +78,60 @@ class CreateGameInfoOutputSchema(OutputSchema):
     player_id = ma_fields.UUID(required=True)
     is_player_move = ma_fields.Bool(required=True)
     is_game_over = ma_fields.Bool(required=True)
+    state_version = ma_fields.Int(required=True, validate=validate.Range(min=0))
+    is_delta = ma_fields.Bool(required=True)
     player_battle_field_cells = ma_fields.Nested(CellSchema(many=True), required=True)
     player_fleet = ma_fields.Nested(FleetStructureSchema(), required=True)
     enemy_battle_field_cells = ma_fields.Nested(CellSchema(many=True), required=True)
     enemy_fleet = ma_fields.Nested(FleetStructureSchema(), required=True)
     winner = ma_fields.Str(required=True)
+    # Ordered enemy shots, that were made right after player shot (only in turn mode of '/player-shoot').
+    enemy_shots = ma_fields.Nested(CellSchema(many=True))
+    # Ordered moves of both sides as [name of shooting side, x, y, sign] (only in '/auto-play' response).
+    move_log = ma_fields.List(ma_fields.Tuple((ma_fields.Str(), ma_fields.Int(), ma_fields.Int(), ma_fields.Str())))
+
+
+class BoardMasksSchema(OutputSchema):
+    """Class for validation battlefield in bitmask format (base64 bitmask for every sign layer)."""
+    ship = ma_fields.Str(required=True)
+    miss = ma_fields.Str(required=True)
+    hit = ma_fields.Str(required=True)
+
+
+class RowsGameInfoOutputSchema(CreateGameInfoOutputSchema):
+    """Class for validation responses with game information, where battlefields are row-major strings with signs."""
+    player_battle_field_rows = ma_fields.Str(required=True, validate=validate.Length(equal=BATTLEFIELD_CELLS_NUMBER))
+    enemy_battle_field_rows = ma_fields.Str(required=True, validate=validate.Length(equal=BATTLEFIELD_CELLS_NUMBER))
+
+    class Meta:
+        """Class excludes battlefields in cells format."""
+        exclude = ("player_battle_field_cells", "enemy_battle_field_cells")
+
+
+class BitmaskGameInfoOutputSchema(CreateGameInfoOutputSchema):
+    """Class for validation responses with game information, where battlefields are bitmasks for every sign layer."""
+    player_battle_field_masks = ma_fields.Nested(BoardMasksSchema(), required=True)
+    enemy_battle_field_masks = ma_fields.Nested(BoardMasksSchema(), required=True)
+
+    class Meta:
+        """Class excludes battlefields in cells format."""
+        exclude = ("player_battle_field_cells", "enemy_battle_field_cells")
+
+
+class CreateNewGameInputSchema(InputSchema):
+    """Class for validation '/new-game' input (request body is optional)."""
+    # If it is set, player fleet is placed automatically the same way as bot fleet.
+    auto_place_fleet = ma_fields.Bool(load_default=False)
+    # Format of battlefields in response. If it is not set, format from Accept header or cells format is used.
+    board_format = ma_fields.Enum(BoardFormat, by_value=True, load_default=None)
 
 
 class GameStartInputSchema(InputSchema):
     """Class for validation '/game-start' input."""
     game_id = ma_fields.UUID(required=True)
     player_id = ma_fields.UUID(required=True)
+    # Format of battlefields in response. If it is not set, format from Accept header or cells format is used.
+    board_format = ma_fields.Enum(BoardFormat, by_value=True, load_default=None)
 
 
 class CreateNewShipInputSchema(InputSchema):
@@ -96,6 +147,23 @@ class CreateNewShipInputSchema(InputSchema):
     )
 
 
+class CreateNewFleetInputSchema(InputSchema):
+    """Class for validation '/new-fleet' input."""
+    game_id = ma_fields.UUID(required=True)
+    player_id = ma_fields.UUID(required=True)
+    ships = ma_fields.List(
+        ma_fields.List(
+            ma_fields.Tuple(
+                (ma_fields.Int(required=True, validate=validate.Range(min=1, max=10)),
+                 ma_fields.Int(required=True, validate=validate.Range(min=1, max=10))),
+                required=True),
+            required=True,
+            validate=validate.Length(min=1)),
+        required=True,
+        validate=validate.Length(min=1)
+    )
+
+
 class CreateNewShipOutputSchema(OutputSchema):
     """Class for validation '/new-ship' output."""
     game_id = ma_fields.UUID(required=True)
@@ -113,9 +181,31 @@ class PlayerShootInputSchema(InputSchema):
          ma_fields.Int(required=True, validate=validate.Range(min=1, max=10))),
         required=True
     )
+    # State version, that client already has. If it is set, response contains only cells changed after it.
+    state_version = ma_fields.Int(validate=validate.Range(min=0), load_default=None)
+    # Format of battlefields in response. If it is not set, format from Accept header or cells format is used.
+    board_format = ma_fields.Enum(BoardFormat, by_value=True, load_default=None)
+    # Turn mode: if it is set, all consecutive enemy shots are made after player miss in the same request.
+    with_enemy_reply = ma_fields.Bool(load_default=False)
 
 
 class EnemyShootInputSchema(InputSchema):
     """Class for validation '/enemy-shoot' input."""
     game_id = ma_fields.UUID(required=True)
     player_id = ma_fields.UUID(required=True)
+    # State version, that client already has. If it is set, response contains only cells changed after it.
+    state_version = ma_fields.Int(validate=validate.Range(min=0), load_default=None)
+    # Format of battlefields in response. If it is not set, format from Accept header or cells format is used.
+    board_format = ma_fields.Enum(BoardFormat, by_value=True, load_default=None)
+
+
+class AutoPlayInputSchema(InputSchema):
+    """Class for validation '/auto-play' input."""
+    game_id = ma_fields.UUID(required=True)
+    player_id = ma_fields.UUID(required=True)
+    # Maximum number of moves (shots of both sides). If it is not set, the game is played to completion.
+    max_moves = ma_fields.Int(validate=validate.Range(min=1), load_default=None)
+    # State version, that client already has. If it is set, response contains only cells changed after it.
+    state_version = ma_fields.Int(validate=validate.Range(min=0), load_default=None)
+    # Format of battlefields in response. If it is not set, format from Accept header or cells format is used.
+    board_format = ma_fields.Enum(BoardFormat, by_value=True, load_default=None)
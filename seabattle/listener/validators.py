@@ -1,36 +1,77 @@
 """Module contains validation methods for input and output data."""
-from typing import Dict
+from typing import Optional
 from uuid import UUID
 
 from seabattle.game import Game
 from seabattle.game_errors.api_errors import NoGameApiError, NoGamePlayerApiError
 from seabattle.game_errors.game_errors import GameOverError
+from seabattle.helpers.constants import BoardFormat
 from seabattle.listener.validation_schemas import (
     CreateGameInfoOutputSchema,
+    RowsGameInfoOutputSchema,
+    BitmaskGameInfoOutputSchema,
+    CreateNewGameInputSchema,
     GameStartInputSchema,
     CreateNewShipInputSchema,
+    CreateNewFleetInputSchema,
     CreateNewShipOutputSchema,
     PlayerShootInputSchema,
     EnemyShootInputSchema,
+    AutoPlayInputSchema,
 )
-
-GAME_STORAGE: Dict[UUID, Game] = {}
-
-
-def validate_create_game_info_response(data: dict) -> dict:
+from seabattle.listener.codecs import get_request_data
+from seabattle.listener.game_storage import GameStorage
+
+# Storage limits are set from application config by listener.
+GAME_STORAGE = GameStorage()
+
+# Schemas are created only once (camel case data keys are bound at creation), load and dump don't change them,
+# so the same instances are used by all requests.
+CREATE_GAME_INFO_OUTPUT_SCHEMA = CreateGameInfoOutputSchema()
+GAME_INFO_OUTPUT_SCHEMAS = {
+    BoardFormat.CELLS: CREATE_GAME_INFO_OUTPUT_SCHEMA,
+    BoardFormat.ROWS: RowsGameInfoOutputSchema(),
+    BoardFormat.BITMASK: BitmaskGameInfoOutputSchema(),
+}
+CREATE_NEW_GAME_INPUT_SCHEMA = CreateNewGameInputSchema()
+GAME_START_INPUT_SCHEMA = GameStartInputSchema()
+CREATE_NEW_SHIP_INPUT_SCHEMA = CreateNewShipInputSchema()
+CREATE_NEW_SHIP_OUTPUT_SCHEMA = CreateNewShipOutputSchema()
+CREATE_NEW_FLEET_INPUT_SCHEMA = CreateNewFleetInputSchema()
+PLAYER_SHOOT_INPUT_SCHEMA = PlayerShootInputSchema()
+ENEMY_SHOOT_INPUT_SCHEMA = EnemyShootInputSchema()
+AUTO_PLAY_INPUT_SCHEMA = AutoPlayInputSchema()
+
+
+def validate_create_game_info_response(data: dict, board_format: BoardFormat = BoardFormat.CELLS) -> dict:
     """
     Method validates response for several endpoints that return full game information.
     Args:
         data: Response from endpoint.
+        board_format: Format of battlefields in response.
 
     Returns:
         dict: Validated response data from endpoint.
     """
-    validator = CreateGameInfoOutputSchema()
+    validator = GAME_INFO_OUTPUT_SCHEMAS[board_format]
     # Validate response and dump it (make camel case keys).
     return validator.dump(validator.load(data))
 
 
+def validate_create_new_game_request(data: dict) -> dict:
+    """
+    Method validates request for '/new-game' endpoint.
+    Args:
+        data: Request to endpoint.
+
+    Returns:
+        dict: Validated request data to endpoint.
+    """
+    validator = CREATE_NEW_GAME_INPUT_SCHEMA
+    # Validate request and load it (make snake case keys).
+    return validator.load(data)
+
+
 def validate_start_game_request(data: dict) -> dict:
     """
     Method validates request for '/game-start' endpoint.
@@ -40,7 +81,7 @@ def validate_start_game_request(data: dict) -> dict:
     Returns:
         dict: Validated request data to endpoint.
     """
-    validator = GameStartInputSchema()
+    validator = GAME_START_INPUT_SCHEMA
     # Validate request and load it (make snake case keys).
     return validator.load(data)
 
@@ -54,7 +95,21 @@ def validate_create_new_ship_request(data: dict) -> dict:
     Returns:
         dict: Validated request data to endpoint.
     """
-    validator = CreateNewShipInputSchema()
+    validator = CREATE_NEW_SHIP_INPUT_SCHEMA
+    # Validate request and load it (make snake case keys).
+    return validator.load(data)
+
+
+def validate_create_new_fleet_request(data: dict) -> dict:
+    """
+    Method validates request for '/new-fleet' endpoint.
+    Args:
+        data: Request to endpoint.
+
+    Returns:
+        dict: Validated request data to endpoint.
+    """
+    validator = CREATE_NEW_FLEET_INPUT_SCHEMA
     # Validate request and load it (make snake case keys).
     return validator.load(data)
 
@@ -68,7 +123,7 @@ def validate_create_new_ship_response(data: dict) -> dict:
     Returns:
         dict: Validated response data from endpoint.
     """
-    validator = CreateNewShipOutputSchema()
+    validator = CREATE_NEW_SHIP_OUTPUT_SCHEMA
     # Validate response and dump it (make camel case keys).
     return validator.dump(validator.load(data))
 
@@ -82,7 +137,7 @@ def validate_player_shoot_request(data: dict) -> dict:
     Returns:
         dict: Validated request data to endpoint.
     """
-    validator = PlayerShootInputSchema()
+    validator = PLAYER_SHOOT_INPUT_SCHEMA
     # Validate request and load it (make snake case keys).
     return validator.load(data)
 
@@ -96,11 +151,41 @@ def validate_enemy_shoot_request(data: dict) -> dict:
     Returns:
         dict: Validated request data to endpoint.
     """
-    validator = EnemyShootInputSchema()
+    validator = ENEMY_SHOOT_INPUT_SCHEMA
     # Validate request and load it (make snake case keys).
     return validator.load(data)
 
 
+def validate_auto_play_request(data: dict) -> dict:
+    """
+    Method validates request for '/auto-play' endpoint.
+    Args:
+        data: Request to endpoint.
+
+    Returns:
+        dict: Validated request data to endpoint.
+    """
+    validator = AUTO_PLAY_INPUT_SCHEMA
+    # Validate request and load it (make snake case keys).
+    return validator.load(data)
+
+
+def get_request_game_id() -> Optional[UUID]:
+    """
+    Method reads game id from request body before request validation (request is validated by endpoint).
+
+    Returns:
+        Game id or None, if request doesn't contain valid game id.
+    """
+    request_data = get_request_data()
+    if not isinstance(request_data, dict):
+        return None
+    try:
+        return UUID(str(request_data.get("gameId")))
+    except ValueError:
+        return None
+
+
 def validate_game_and_player(player_data: dict, exit_mark: bool = False) -> Game:
     """
     Method validates that request contains game id and player id, that contains real game and player in game storage.
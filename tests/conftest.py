@@ -1,20 +1,26 @@
 """Module contains general data for pytest (fixtures, etc.)."""
-from copy import deepcopy
-
 import pytest
 
 from seabattle.game import Game
 from seabattle.game_objects.battlefield import BattleField
+from seabattle.game_objects.bitboard_battlefield import BitBoardBattleField
+from seabattle.game_objects.numpy_battlefield import NumPyBattleField
 from seabattle.game_objects.player import Player
 from seabattle.helpers.constants import SHIPS_COORDINATES
 from seabattle.listener.listener import app
 from seabattle.listener.validators import GAME_STORAGE
 
 
+@pytest.fixture(name="battlefield_class", params=[BattleField, BitBoardBattleField, NumPyBattleField])
+def battlefield_class_fixture(request):
+    """Method returns battlefield class, so tests run for every battlefield engine."""
+    yield request.param
+
+
 @pytest.fixture(name="game")
-def game_fixture():
+def game_fixture(battlefield_class):
     """Method returns game right after starting game."""
-    game = Game()
+    game = Game(battlefield_class=battlefield_class)
     # Set ship for player and enemy.
     for coordinates in SHIPS_COORDINATES:
         _ = game.player_set_ship(coordinates)
@@ -22,17 +28,17 @@ def game_fixture():
 
 
 @pytest.fixture(name="battlefield")
-def battlefield_fixture():
+def battlefield_fixture(battlefield_class):
     """Method returns battlefield with one ship."""
-    battlefield = BattleField(name="Mike")
+    battlefield = battlefield_class(name="Mike")
     battlefield.set_ship_coordinates([(1, 1), (1, 2)])
     yield battlefield
 
 
 @pytest.fixture(name="player")
-def player_fixture():
+def player_fixture(battlefield_class):
     """Method returns player object."""
-    yield Player(player_name="Mike", enemy_name="Sailor")
+    yield Player(player_name="Mike", enemy_name="Sailor", battlefield_class=battlefield_class)
 
 
 @pytest.fixture(name="application")
@@ -84,7 +90,7 @@ def app_fixture():
     yield app, test_info
 
     # Clear GAME_STORAGE after test.
-    for game_id in deepcopy(GAME_STORAGE):
+    for game_id in list(GAME_STORAGE):
         GAME_STORAGE.pop(game_id)
 
 
@@ -1,4 +1,5 @@
 """Module contains integration api tests."""
+import json
 import uuid
 from copy import deepcopy
 from unittest.mock import patch
@@ -6,7 +7,9 @@ from unittest.mock import patch
 import pytest
 
 from seabattle.game_objects.cell import Cell
-from seabattle.helpers.constants import StatusCode, SignObjects
+from seabattle.helpers.constants import StatusCode, SignObjects, SHIPS_COORDINATES
+from seabattle.listener.codecs import CODECS
+from seabattle.listener.listener import OUTPUT_VALIDATOR
 from seabattle.listener.validators import GAME_STORAGE, validate_create_game_info_response
 from tests.helpers.test_cases import START_GAME_BAD_REQUEST, ADD_SHIP_BAD_REQUEST, PLAYER_SHOOT_BAD_REQUEST
 
@@ -24,6 +27,21 @@ def test_health_check(client):
     assert response.status_code == StatusCode.OK.value
 
 
+def test_stats(client):
+    """
+    Method tests that /stats endpoint returns game storage and pools statistics.
+    Args:
+        client: Fixture with flash client to make a request.
+    """
+    client.post(f"{BASE_URL}/new-game")
+    response = client.get(f"{BASE_URL}/stats")
+
+    assert response.status_code == StatusCode.OK.value
+    assert response.json["gameStorage"]["size"] == len(GAME_STORAGE)
+    assert set(response.json["gameStorage"]) == {"size", "expired", "evicted"}
+    assert set(response.json["gamePool"]) == set(response.json["fleetPool"]) == {"size", "hits", "misses"}
+
+
 def test_create_new_game(client):
     """
     Method tests correct work /health-check endpoint.
@@ -37,6 +55,36 @@ def test_create_new_game(client):
     assert response.status_code == StatusCode.OK.value
 
 
+def test_create_new_game_ignores_body_of_unknown_media_type(client):
+    """
+    Method tests that /new-game endpoint ignores request body, that isn't JSON or binary codec data.
+    Args:
+        client: Fixture with flash client to make a request.
+    """
+    response = client.post(f"{BASE_URL}/new-game", data="x")
+
+    assert response.status_code == StatusCode.OK.value
+    assert not GAME_STORAGE[uuid.UUID(response.json["gameId"])].player.is_all_ships_added()
+
+
+def test_create_new_game_with_auto_placed_fleet(client):
+    """
+    Method tests that /new-game endpoint places player fleet automatically, if client asks for it.
+    Args:
+        client: Fixture with flash client to make a request.
+    """
+    response = client.post(f"{BASE_URL}/new-game", json={"autoPlaceFleet": True})
+
+    assert response.status_code == StatusCode.OK.value
+    game = GAME_STORAGE[uuid.UUID(response.json["gameId"])]
+    assert game.player.is_all_ships_added()
+    assert response.json == validate_create_game_info_response(game.return_game_state())
+    assert sum(cell["sign"] == SignObjects.ship_sign.sign for cell in response.json["playerBattleFieldCells"]) == 20
+
+    response = client.post(f"{BASE_URL}/game-start", json={"gameId": str(game.id), "playerId": str(game.player.id)})
+    assert response.status_code == StatusCode.OK.value
+
+
 def test_add_new_ship_works_correct(application, client):
     """
     Method tests correct work /new-ship endpoint.
@@ -118,6 +166,62 @@ def test_add_new_ship_cannot_work_correctly(application, client, game_type, coor
     assert response.status_code == StatusCode.APPLICATION_ERROR.value
 
 
+def test_add_new_fleet_works_correct(application, client):
+    """
+    Method tests correct work /new-fleet endpoint.
+    Args:
+        application: Fixture with tuple, that contains application object and game information for api tests.
+        client: Fixture with flash client to make a request.
+    """
+    json_request = {**application[1]["just_created"], "ships": [list(map(list, ship)) for ship in SHIPS_COORDINATES]}
+    game = GAME_STORAGE[uuid.UUID(json_request["gameId"])]
+
+    response = client.post(f"{BASE_URL}/new-fleet", json=json_request)
+
+    assert response.status_code == StatusCode.OK.value
+    assert len(response.json["playerShipCells"]) == sum(len(ship) for ship in SHIPS_COORDINATES)
+    assert response.json["playerFleet"] == {"patrolBoat": 4, "submarine": 3, "destroyer": 2, "battleship": 1}
+    assert game.player.is_all_ships_added()
+
+
+def test_add_new_fleet_is_atomic(application, client):
+    """
+    Method tests that /new-fleet endpoint doesn't add any ship if one of them has wrong coordinates.
+    Args:
+        application: Fixture with tuple, that contains application object and game information for api tests.
+        client: Fixture with flash client to make a request.
+    """
+    json_request = {**application[1]["just_created"], "ships": [[[1, 2]], [[5, 5]], [[6, 6]]]}
+    game = GAME_STORAGE[uuid.UUID(json_request["gameId"])]
+
+    response = client.post(f"{BASE_URL}/new-fleet", json=json_request)
+
+    assert response.json == {
+        "message": "Internal Server Error.",
+        "errorCode": "BlockedAreaAroundError",
+        "statusCode": 500,
+        "hint": "Area around coordinates: 6f is not empty"
+    }
+    assert not game.player.player_battlefield.ships
+    assert game.version == 0
+
+
+def test_add_new_fleet_validation_failed(client):
+    """
+    Method tests that /new-fleet endpoint produce ValidationError correctly.
+    Args:
+        client: Fixture with flash client to make a request.
+    """
+    response = client.post(f"{BASE_URL}/new-fleet",
+                           json={"gameId": str(uuid.uuid4()), "playerId": str(uuid.uuid4()), "ships": [[[1, 11]]]})
+
+    assert response.json == {
+        "message": "Validation failed.", "statusCode": 400,
+        "errors": {"ships": {"0": {"0": {"1": ["Must be greater than or equal to 1 and less than or equal to 10."]}}}}
+    }
+    assert response.status_code == StatusCode.BAD_REQUEST.value
+
+
 def test_start_game_works_correct(application, client):
     """
     Method tests correct work /game-start endpoint.
@@ -200,7 +304,17 @@ def test_player_shoot_works_correct(mock_shooting_result, application, client):
         client: Fixture with flash client to make a request.
     """
     json_request = application[1]["game_started_player"]
-    game_state_after_shooting = GAME_STORAGE[uuid.UUID(json_request['gameId'])].return_game_state()
+    game = GAME_STORAGE[uuid.UUID(json_request['gameId'])]
+    game_state_after_shooting = game.return_game_state()
+
+    def enemy_shooting(_coordinate):
+        # Enemy view reads cells from enemy battlefield, so mocked results are applied to it.
+        shooting_results, is_killed = mock_shooting_result.return_value
+        for coordinate, cell in shooting_results.items():
+            game.enemy.player_battlefield.battlefield[coordinate].sign = cell.sign
+        return shooting_results, is_killed
+
+    mock_shooting_result.side_effect = enemy_shooting
 
     # Not exclude killed ship as we use mock.
     for x, y, sign in [
@@ -213,6 +327,8 @@ def test_player_shoot_works_correct(mock_shooting_result, application, client):
             if cell_info["x"] == str(x) and cell_info["y"] == str(y):
                 cell_info["sign"] = sign
                 break
+    # Every shot increases state version.
+    game_state_after_shooting["state_version"] += 1
     check_result_after_shooting = validate_create_game_info_response({**game_state_after_shooting})
 
     # Test if hit and kill the ship.
@@ -240,6 +356,8 @@ def test_player_shoot_works_correct(mock_shooting_result, application, client):
             if cell_info["x"] == str(x) and cell_info["y"] == str(y):
                 cell_info["sign"] = sign
                 break
+    # Every shot increases state version.
+    game_state_after_shooting["state_version"] += 1
     check_result_after_shooting = validate_create_game_info_response({**game_state_after_shooting})
 
     mock_shooting_result.return_value = (
@@ -264,6 +382,8 @@ def test_player_shoot_works_correct(mock_shooting_result, application, client):
                 cell_info["sign"] = sign
                 break
     game_state_after_shooting["is_player_move"] = not game_state_after_shooting["is_player_move"]
+    # Every shot increases state version.
+    game_state_after_shooting["state_version"] += 1
     check_result_after_shooting = validate_create_game_info_response({**game_state_after_shooting})
 
     mock_shooting_result.return_value = (
@@ -278,6 +398,102 @@ def test_player_shoot_works_correct(mock_shooting_result, application, client):
     assert response.status_code == StatusCode.OK.value
 
 
+def test_player_shoot_returns_delta(application, client):
+    """
+    Method tests that /player-shoot endpoint returns only changed cells if client sends state version.
+    Args:
+        application: Fixture with tuple, that contains application object and game information for api tests.
+        client: Fixture with flash client to make a request.
+    """
+    json_request = application[1]["game_started_player"]
+    game = GAME_STORAGE[uuid.UUID(json_request["gameId"])]
+    version = game.version
+
+    response = client.post(f"{BASE_URL}/player-shoot",
+                           json={**json_request, "coordinate": [1, 1], "stateVersion": version})
+
+    assert response.status_code == StatusCode.OK.value
+    assert response.json["stateVersion"] == version + 1
+    assert response.json["isDelta"]
+    assert response.json["playerBattleFieldCells"] == []
+    assert {(cell["x"], cell["y"]) for cell in response.json["enemyBattleFieldCells"]} == set(game.changes[version][1])
+
+
+def test_player_shoot_without_output_validation(application, client):
+    """
+    Method tests that /player-shoot endpoint returns the same response with fast serializer.
+    Args:
+        application: Fixture with tuple, that contains application object and game information for api tests.
+        client: Fixture with flash client to make a request.
+    """
+    json_request = {**application[1]["game_started_player"], "coordinate": [1, 1]}
+    game = GAME_STORAGE[uuid.UUID(json_request["gameId"])]
+    OUTPUT_VALIDATOR.policy = "off"
+    try:
+        response = client.post(f"{BASE_URL}/player-shoot", json=json_request)
+    finally:
+        OUTPUT_VALIDATOR.policy = "always"
+
+    assert response.status_code == StatusCode.OK.value
+    assert response.json == validate_create_game_info_response(game.return_game_state())
+
+
+def test_player_shoot_with_enemy_reply(application, client):
+    """
+    Method tests that /player-shoot endpoint in turn mode returns enemy shots, that were made after player miss.
+    Args:
+        application: Fixture with tuple, that contains application object and game information for api tests.
+        client: Fixture with flash client to make a request.
+    """
+    json_request = application[1]["game_started_player"]
+    game = GAME_STORAGE[uuid.UUID(json_request["gameId"])]
+    enemy_cells = game.enemy.player_battlefield.battlefield
+    miss_coordinate = next(coordinate for coordinate in game.enemy.player_battlefield.lookup.inner_coordinates
+                           if enemy_cells[coordinate].sign == SignObjects.empty_sign.sign)
+    version = game.version
+
+    response = client.post(f"{BASE_URL}/player-shoot",
+                           json={**json_request, "coordinate": list(miss_coordinate), "withEnemyReply": True})
+
+    assert response.status_code == StatusCode.OK.value
+    assert response.json["isPlayerMove"] or response.json["isGameOver"]
+    enemy_shots = response.json["enemyShots"]
+    assert enemy_shots
+    assert all(shot["sign"] == SignObjects.hit_sign.sign for shot in enemy_shots[:-1])
+    assert response.json["stateVersion"] == version + 1 + len(enemy_shots)
+
+
+@pytest.mark.parametrize(
+    ("request_field", "headers", "boards_key"), [
+        ({"boardFormat": "rows"}, {}, "BattleFieldRows"),
+        ({}, {"Accept": "application/vnd.seabattle.rows+json"}, "BattleFieldRows"),
+        ({}, {"Accept": "application/vnd.seabattle.bitmask+json"}, "BattleFieldMasks"),
+        # Request field has priority over Accept header.
+        ({"boardFormat": "cells"}, {"Accept": "application/vnd.seabattle.bitmask+json"}, "BattleFieldCells"),
+    ]
+)
+def test_player_shoot_board_format(application, client, request_field, headers, boards_key):
+    """
+    Method tests that /player-shoot endpoint returns battlefields in format, that is chosen by client, and answers
+    with vendor media type, if format is chosen by Accept header.
+    Args:
+        application: Fixture with tuple, that contains application object and game information for api tests.
+        client: Fixture with flash client to make a request.
+        request_field: Request field with board format.
+        headers: Request headers.
+        boards_key: Suffix of keys with battlefields in response.
+    """
+    json_request = {**application[1]["game_started_player"], "coordinate": [1, 1], **request_field}
+
+    response = client.post(f"{BASE_URL}/player-shoot", json=json_request, headers=headers)
+
+    assert response.status_code == StatusCode.OK.value
+    assert response.mimetype == ("application/json" if request_field else headers.get("Accept", "application/json"))
+    assert f"player{boards_key}" in response.json
+    assert f"enemy{boards_key}" in response.json
+    assert "playerBattleFieldCells" not in response.json or boards_key == "BattleFieldCells"
+
+
 @pytest.mark.parametrize(("wrong_request", "validation_error_dict"), PLAYER_SHOOT_BAD_REQUEST)
 def test_player_shoot_validation_failed(client, wrong_request, validation_error_dict):
     """
@@ -351,6 +567,8 @@ def test_enemy_shoot_works_correct(mocking_coordinate, application, client):
             if cell_info["x"] == str(x) and cell_info["y"] == str(y):
                 cell_info["sign"] = sign
                 break
+    # Every shot increases state version.
+    game_state_after_shooting["state_version"] += 1
     check_result_after_shooting = validate_create_game_info_response({**game_state_after_shooting})
 
     # Hit and kill shoot.
@@ -375,6 +593,8 @@ def test_enemy_shoot_works_correct(mocking_coordinate, application, client):
             if cell_info["x"] == str(x) and cell_info["y"] == str(y):
                 cell_info["sign"] = sign
                 break
+    # Every shot increases state version.
+    game_state_after_shooting["state_version"] += 1
     check_result_after_shooting = validate_create_game_info_response({**game_state_after_shooting})
 
     response = client.post(f"{BASE_URL}/enemy-shoot", json={**json_request})
@@ -394,6 +614,8 @@ def test_enemy_shoot_works_correct(mocking_coordinate, application, client):
             cell_info["sign"] = SignObjects.miss_sign.sign
             break
     game_state_after_shooting["is_player_move"] = not game_state_after_shooting["is_player_move"]
+    # Every shot increases state version.
+    game_state_after_shooting["state_version"] += 1
     check_result_after_shooting = validate_create_game_info_response({**game_state_after_shooting})
 
     response = client.post(f"{BASE_URL}/enemy-shoot", json={**json_request})
@@ -446,6 +668,43 @@ def test_enemy_shoot_cannot_work_correctly(application, client, game_type, error
     assert response.status_code == StatusCode.APPLICATION_ERROR.value
 
 
+def test_auto_play_works_correct(application, client):
+    """
+    Method tests that /auto-play endpoint plays the game to completion and returns move log.
+    Args:
+        application: Fixture with tuple, that contains application object and game information for api tests.
+        client: Fixture with flash client to make a request.
+    """
+    json_request = application[1]["game_started_player"]
+    game = GAME_STORAGE[uuid.UUID(json_request["gameId"])]
+
+    response = client.post(f"{BASE_URL}/auto-play", json=json_request)
+
+    assert response.status_code == StatusCode.OK.value
+    assert response.json["isGameOver"]
+    assert response.json["winner"]
+    assert len(response.json["moveLog"]) == game.version - 10
+    assert all(len(move) == 4 for move in response.json["moveLog"])
+
+    response = client.post(f"{BASE_URL}/auto-play", json=json_request)
+    assert response.json["errorCode"] == "GameOverError"
+
+
+def test_auto_play_for_several_moves(application, client):
+    """
+    Method tests that /auto-play endpoint stops after specified number of moves.
+    Args:
+        application: Fixture with tuple, that contains application object and game information for api tests.
+        client: Fixture with flash client to make a request.
+    """
+    json_request = {**application[1]["game_started_player"], "maxMoves": 2}
+
+    response = client.post(f"{BASE_URL}/auto-play", json=json_request)
+
+    assert response.status_code == StatusCode.OK.value
+    assert len(response.json["moveLog"]) == 2
+
+
 def test_exit_works_correct(application, client):
     """
     Method tests that /exit endpoint works correctly.
@@ -554,3 +813,56 @@ def test_raw_api_endpoint(client):
     """
     response = client.get(f"{BASE_URL}/apidocs")
     assert response.status_code == StatusCode.OK.value
+
+
+@pytest.mark.parametrize("media_type", ["application/msgpack", "application/cbor"])
+def test_player_shoot_binary_codec(application, client, media_type):
+    """
+    Method tests that /player-shoot endpoint accepts and returns binary content with the same data as JSON.
+    Args:
+        application: Fixture with tuple, that contains application object and game information for api tests.
+        client: Fixture with flash client to make a request.
+        media_type: Media type of request and response.
+    """
+    if media_type not in CODECS:
+        pytest.skip(f"Codec for {media_type} is not installed.")
+    codec = CODECS[media_type]
+    json_request = {**application[1]["game_started_player"], "coordinate": [1, 1]}
+    game = GAME_STORAGE[uuid.UUID(json_request["gameId"])]
+
+    response = client.post(f"{BASE_URL}/player-shoot", data=codec.encode(json_request),
+                           content_type=media_type, headers={"Accept": media_type})
+
+    assert response.status_code == StatusCode.OK.value
+    assert response.mimetype == media_type
+    assert codec.decode(response.data) == validate_create_game_info_response(game.return_game_state())
+
+
+def test_binary_codec_validation_error(client):
+    """
+    Method tests that errors are returned in media type, that is chosen by client.
+    Args:
+        client: Fixture with flash client to make a request.
+    """
+    if "application/msgpack" not in CODECS:
+        pytest.skip("Codec for application/msgpack is not installed.")
+    codec = CODECS["application/msgpack"]
+
+    response = client.post(f"{BASE_URL}/player-shoot", data=codec.encode({}),
+                           content_type=codec.media_type, headers={"Accept": codec.media_type})
+
+    assert response.status_code == StatusCode.VALIDATION_FAILED.value
+    assert response.mimetype == codec.media_type
+    assert codec.decode(response.data)["message"] == "Validation failed."
+
+
+def test_raw_api_endpoint_documents_binary_media_types(client):
+    """
+    Method tests that apispec documentation contains binary media types.
+    Args:
+        client: Fixture with flash client to make a request.
+    """
+    response = client.get(f"{BASE_URL}/apidocs")
+
+    content = json.loads(response.data)["paths"]["/player-shoot"]["post"]["requestBody"]["content"]
+    assert set(content) == {"application/json", *CODECS}
@@ -0,0 +1,160 @@
+"""Module contains integration api tests for read-only game state and game events endpoints."""
+import json
+import uuid
+from unittest.mock import patch
+
+from seabattle.helpers.constants import StatusCode
+from seabattle.listener.listener import EVENT_BROKER, GAME_STATE_CACHE, release_game
+from seabattle.listener.validators import GAME_STORAGE, validate_create_game_info_response
+from tests.integration_tests.api_test import BASE_URL
+
+
+def test_get_game_state(application, client):
+    """
+    Method tests that /games/<game_id> endpoint returns game state with ETag, and answers 304 for unchanged game.
+    Args:
+        application: Fixture with tuple, that contains application object and game information for api tests.
+        client: Fixture with flash client to make a request.
+    """
+    json_request = application[1]["game_started_player"]
+    game = GAME_STORAGE[uuid.UUID(json_request["gameId"])]
+    url = f"{BASE_URL}/games/{json_request['gameId']}"
+
+    response = client.get(url)
+    etag = response.headers["ETag"]
+    assert response.status_code == StatusCode.OK.value
+    assert response.json == {
+        key: value for key, value in validate_create_game_info_response(game.return_game_state()).items()
+        if key != "playerId"
+    }
+    hits, misses = GAME_STATE_CACHE.hits, GAME_STATE_CACHE.misses
+    assert client.get(url).data == response.data
+    assert (GAME_STATE_CACHE.hits, GAME_STATE_CACHE.misses) == (hits + 1, misses)
+
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == StatusCode.NOT_MODIFIED.value
+    assert response.headers["ETag"] == etag and not response.data
+    assert GAME_STATE_CACHE.misses == misses
+
+    client.post(f"{BASE_URL}/player-shoot", json={**json_request, "coordinate": [1, 1]})
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == StatusCode.OK.value
+    assert response.headers["ETag"] != etag
+    assert response.json["stateVersion"] == game.version
+    # Representation in other battlefields format has its own ETag.
+    response = client.get(url, headers={"Accept": "application/vnd.seabattle.rows+json"})
+    assert "playerBattleFieldRows" in response.json
+    assert response.mimetype == "application/vnd.seabattle.rows+json"
+    assert response.headers["ETag"] != client.get(url).headers["ETag"]
+
+
+def test_get_game_state_changed_while_waiting_for_lock(application, client):
+    """
+    Method tests that ETag matches returned game state, if game is changed while request waits for the game lock.
+    Args:
+        application: Fixture with tuple, that contains application object and game information for api tests.
+        client: Fixture with flash client to make a request.
+    """
+    json_request = application[1]["game_started_player"]
+    game = GAME_STORAGE[uuid.UUID(json_request["gameId"])]
+    url = f"{BASE_URL}/games/{json_request['gameId']}"
+    etag = client.get(url).headers["ETag"]
+    game.player_shoot((1, 1))
+    lock = GAME_STORAGE.lock
+
+    def lock_after_change(game_id, timeout):
+        game.is_player_move = True
+        # Cell is far from the first shot, so it isn't marked as missed around a sunk ship.
+        game.player_shoot((5, 5))
+        return lock(game_id, timeout)
+
+    with patch.object(GAME_STORAGE, "lock", lock_after_change):
+        response = client.get(url, headers={"If-None-Match": etag})
+
+    assert response.status_code == StatusCode.OK.value
+    assert response.json["stateVersion"] == game.version
+    assert response.headers["ETag"] == client.get(url).headers["ETag"]
+
+
+def test_get_game_state_no_game(client):
+    """
+    Method tests that state of not existing game can't be returned.
+    Args:
+        client: Fixture with flash client to make a request.
+    """
+    game_id = uuid.uuid4()
+    response = client.get(f"{BASE_URL}/games/{game_id}")
+
+    assert response.status_code == StatusCode.ENTITY_NOT_FOUND.value
+    assert response.json["statusCode"] == StatusCode.ENTITY_NOT_FOUND.value
+    assert response.json["message"] == f"No game with id: {game_id}"
+
+
+def test_game_events_stream(client):
+    """
+    Method tests that /games/<game_id>/events endpoint streams game changes.
+    Args:
+        client: Fixture with flash client to make a request.
+    """
+    response = client.post(f"{BASE_URL}/new-game", json={"autoPlaceFleet": True})
+    json_request = {"gameId": response.json["gameId"], "playerId": response.json["playerId"]}
+    game = GAME_STORAGE[uuid.UUID(json_request["gameId"])]
+
+    stream_response = client.get(f"{BASE_URL}/games/{json_request['gameId']}/events")
+    assert stream_response.status_code == StatusCode.OK.value
+    assert stream_response.mimetype == "text/event-stream"
+    events = stream_response.response
+    assert next(events) == b": connected\n\n"
+
+    client.post(f"{BASE_URL}/game-start", json=json_request)
+    assert next(events).startswith(f"id: {game.version}\nevent: start\n".encode())
+
+    game.is_player_move = True
+    client.post(f"{BASE_URL}/player-shoot", json={**json_request, "coordinate": [1, 1]})
+    event = next(events).decode()
+    assert event.startswith(f"id: {game.version}\nevent: change\n")
+    data = json.loads(event.split("data: ", 1)[1])
+    assert data["isDelta"] and data["stateVersion"] == game.version
+    assert {"x": 1, "y": 1, "sign": game.enemy.player_battlefield.battlefield[(1, 1)].sign} in \
+           data["enemyBattleFieldCells"]
+    assert "playerId" not in data
+
+    client.post(f"{BASE_URL}/exit", json=json_request)
+    assert not list(events)
+
+
+def test_game_events_stream_no_game(client):
+    """
+    Method tests that events of not existing game can't be streamed.
+    Args:
+        client: Fixture with flash client to make a request.
+    """
+    game_id = uuid.uuid4()
+    response = client.get(f"{BASE_URL}/games/{game_id}/events")
+
+    assert response.status_code == StatusCode.ENTITY_NOT_FOUND.value
+    assert response.json["message"] == f"No game with id: {game_id}"
+    assert not EVENT_BROKER.has_subscribers(game_id)
+
+
+def test_game_events_stream_game_removed_while_subscribing(application, client):
+    """
+    Method tests that subscription isn't left open, if game is removed while events stream is created.
+    Args:
+        application: Fixture with tuple, that contains application object and game information for api tests.
+        client: Fixture with flash client to make a request.
+    """
+    game_id = uuid.UUID(application[1]["game_started_player"]["gameId"])
+    subscribe = EVENT_BROKER.subscribe
+
+    def subscribe_and_remove_game(subscribed_game_id):
+        subscription = subscribe(subscribed_game_id)
+        del GAME_STORAGE[subscribed_game_id]
+        release_game(subscribed_game_id)
+        return subscription
+
+    with patch.object(EVENT_BROKER, "subscribe", subscribe_and_remove_game):
+        response = client.get(f"{BASE_URL}/games/{game_id}/events")
+
+    assert response.status_code == StatusCode.ENTITY_NOT_FOUND.value
+    assert not EVENT_BROKER.has_subscribers(game_id)
@@ -3,7 +3,7 @@ import pytest
 
 from seabattle.game import Game
 from seabattle.game_errors.game_errors import StartedGameError, NotStartedGameError
-from seabattle.helpers.constants import SignObjects
+from seabattle.helpers.constants import SignObjects, BoardFormat, SHIPS_COORDINATES
 
 
 def test_game_is_started(game):
@@ -111,6 +111,38 @@ def test_game_is_not_adding_ship_after_game_start(game):
         _ = game.player_set_ship([(4, 4)])
 
 
+def test_game_is_adding_fleet_before_game_start():
+    """
+    Method checks if game adds the whole fleet in one command and registers one state change.
+    """
+    game = Game()
+    result = game.player_set_fleet(list(SHIPS_COORDINATES))
+    assert len(result["player_ship_cells"]) == sum(len(coordinates) for coordinates in SHIPS_COORDINATES)
+    assert game.player.is_all_ships_added()
+    assert game.version == 1
+
+
+def test_game_is_auto_placing_fleet():
+    """
+    Method checks if game places player fleet automatically and the game can be started after it.
+    """
+    game = Game()
+    result = game.player_auto_place_fleet(list(SHIPS_COORDINATES))
+    assert len(result["player_ship_cells"]) == sum(len(coordinates) for coordinates in SHIPS_COORDINATES)
+    assert game.start_game()["player_fleet"]["battleship"] == 1
+
+
+def test_game_is_not_adding_fleet_after_game_start(game):
+    """
+    Method checks if game couldn't add the fleet after game is started.
+    Args:
+        game: Game object with ships.
+    """
+    game.start_game()
+    with pytest.raises(StartedGameError):
+        _ = game.player_set_fleet([[(4, 4)]])
+
+
 def test_game_cannot_start_after_start(game):
     """
     Method checks if game raises an error if we try to start game after it already started.
@@ -120,3 +152,146 @@ def test_game_cannot_start_after_start(game):
     game.start_game()
     with pytest.raises(StartedGameError):
         game.start_game()
+
+
+def test_game_state_version(game):
+    """
+    Method checks that every change of battlefields increases state version.
+    Args:
+        game: Game object with ships.
+    """
+    # Every added ship is a change.
+    assert game.version == 10
+    game.start_game()
+    assert game.version == 10
+    game.is_player_move = True
+    state = game.player_shoot((1, 2))
+    assert game.version == state["state_version"] == 11
+    assert not state["is_delta"]
+
+
+def test_player_shoot_with_enemy_reply(game):
+    """
+    Method checks that in turn mode all consecutive enemy shots are made after player miss.
+    Args:
+        game: Game object with ships.
+    """
+    game.start_game()
+    game.is_player_move = True
+    enemy_cells = game.enemy.player_battlefield.battlefield
+    miss_coordinate = next(coordinate for coordinate in game.enemy.player_battlefield.lookup.inner_coordinates
+                           if enemy_cells[coordinate].sign == SignObjects.empty_sign.sign)
+    enemy_coordinates = iter([(10, 1), (10, 2), (3, 3)])
+    game.enemy.choose_shooting_coordinate = lambda: next(enemy_coordinates)
+
+    state = game.player_shoot(miss_coordinate, with_enemy_reply=True)
+
+    assert state["is_player_move"]
+    assert state["enemy_shots"] == [
+        {"x": "10", "y": "1", "sign": SignObjects.hit_sign.sign},
+        {"x": "10", "y": "2", "sign": SignObjects.hit_sign.sign},
+        {"x": "3", "y": "3", "sign": SignObjects.miss_sign.sign},
+    ]
+    assert game.version == 14
+    assert "enemy_shots" not in game.player_shoot((1, 1) if miss_coordinate != (1, 1) else (2, 2))
+
+
+def test_auto_play_to_completion(game):
+    """
+    Method checks that auto play finishes the game and logs every move.
+    Args:
+        game: Game object with ships.
+    """
+    game.start_game()
+    version = game.version
+
+    state = game.auto_play()
+
+    assert state["is_game_over"]
+    assert state["winner"] in ("Player", "Enemy")
+    assert len(state["move_log"]) == game.version - version
+    assert {shooter for shooter, *_ in state["move_log"]} <= {"Player", "Enemy"}
+    assert all(sign in (SignObjects.hit_sign.sign, SignObjects.miss_sign.sign) for *_, sign in state["move_log"])
+
+
+def test_auto_play_for_several_moves(game):
+    """
+    Method checks that auto play stops after specified number of moves and can't be used before game start.
+    Args:
+        game: Game object with ships.
+    """
+    with pytest.raises(NotStartedGameError):
+        game.auto_play()
+    game.start_game()
+
+    state = game.auto_play(max_moves=3)
+
+    assert len(state["move_log"]) == 3
+    assert not state["is_game_over"]
+
+
+def test_game_change_listener(game):
+    """
+    Method checks that change listener is called after game start and every change with updated game state.
+    Args:
+        game: Game object with ships.
+    """
+    events = []
+    game.change_listener = lambda changed_game, event_type: events.append(
+        (event_type, changed_game.version, changed_game.is_game_over)
+    )
+    version = game.version
+
+    game.start_game()
+    game.auto_play()
+
+    assert events[0] == ("start", version, False)
+    assert [event_type for event_type, *_ in events[1:]] == ["change"] * (game.version - version)
+    assert events[-1] == ("change", game.version, True)
+
+
+@pytest.mark.parametrize(("coordinate", "changed_cells"), [((3, 3), 1), ((6, 1), 6)])
+def test_game_state_delta(game, coordinate, changed_cells):
+    """
+    Method checks that game state contains only cells, that were changed since client's version.
+    Args:
+        game: Game object with ships.
+        coordinate: Coordinate for enemy shooting.
+        changed_cells: Number of cells, that should be changed after shooting.
+    """
+    game.start_game()
+    version = game.version
+    game.is_player_move = False
+    game.enemy.choose_shooting_coordinate = lambda: coordinate
+    state = game.enemy_shoot(version)
+    full_state = game.return_game_state()
+
+    assert state["is_delta"]
+    assert state["enemy_battle_field_cells"] == []
+    assert len(state["player_battle_field_cells"]) == changed_cells
+    assert all(cell in full_state["player_battle_field_cells"] for cell in state["player_battle_field_cells"])
+    # Client is up to date, so there are no changed cells.
+    assert game.return_game_state(game.version)["player_battle_field_cells"] == []
+    # Unknown version returns full game state.
+    assert not game.return_game_state(game.version + 1)["is_delta"]
+
+
+@pytest.mark.parametrize(
+    ("board_format", "boards_key"), [
+        (BoardFormat.ROWS, "battle_field_rows"),
+        (BoardFormat.BITMASK, "battle_field_masks")
+    ]
+)
+def test_game_state_compact_format(game, board_format, boards_key):
+    """
+    Method checks that game state in compact format always contains whole battlefields.
+    Args:
+        game: Game object with ships.
+        board_format: Format of battlefields.
+        boards_key: Suffix of keys with battlefields.
+    """
+    game.start_game()
+    state = game.return_game_state(game.version, board_format)
+    assert not state["is_delta"]
+    assert "player_battle_field_cells" not in state
+    assert state[f"player_{boards_key}"] and state[f"enemy_{boards_key}"]
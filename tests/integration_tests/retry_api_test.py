@@ -0,0 +1,104 @@
+"""Module contains integration api tests for retried and concurrent requests."""
+import uuid
+from unittest.mock import patch
+
+import pytest
+
+from seabattle.helpers.constants import StatusCode
+from seabattle.listener.codecs import CODECS
+from seabattle.listener.listener import IDEMPOTENCY_CACHE
+from seabattle.listener.validators import GAME_STORAGE
+from tests.integration_tests.api_test import BASE_URL
+
+
+def test_player_shoot_with_idempotency_key(application, client):
+    """
+    Method tests that retried /player-shoot request with the same idempotency key gets original response without
+    shooting again, and the key can't be reused for other request.
+    Args:
+        application: Fixture with tuple, that contains application object and game information for api tests.
+        client: Fixture with flash client to make a request.
+    """
+    json_request = {**application[1]["game_started_player"], "coordinate": [1, 1]}
+    game = GAME_STORAGE[uuid.UUID(json_request["gameId"])]
+    headers = {"Idempotency-Key": str(uuid.uuid4())}
+
+    response = client.post(f"{BASE_URL}/player-shoot", json=json_request, headers=headers)
+    version = game.version
+    replays = IDEMPOTENCY_CACHE.replays
+    retried_response = client.post(f"{BASE_URL}/player-shoot", json=json_request, headers=headers)
+
+    assert response.status_code == retried_response.status_code == StatusCode.OK.value
+    assert retried_response.data == response.data
+    assert retried_response.headers["Idempotency-Replayed"] == "true"
+    assert game.version == version
+    assert IDEMPOTENCY_CACHE.replays == replays + 1
+
+    response = client.post(f"{BASE_URL}/player-shoot", json={**json_request, "coordinate": [2, 2]}, headers=headers)
+    assert response.status_code == StatusCode.UNPROCESSABLE_ENTITY.value
+    assert response.json["errorCode"] == "IdempotencyKeyApiError"
+    # Request without key is processed as usual, so the same cell can't be shot again.
+    game.is_player_move = True
+    response = client.post(f"{BASE_URL}/player-shoot", json=json_request)
+    assert response.json["errorCode"] == "ShotCellEarlierError"
+
+
+@pytest.mark.parametrize("accept", ["application/vnd.seabattle.rows+json", "application/msgpack"])
+def test_idempotency_key_with_other_representation(application, client, accept):
+    """
+    Method tests that idempotency key can't be reused for the same request, that asks for other response
+    representation, so stored response isn't replayed in media type or battlefields format, that client didn't ask for.
+    Args:
+        application: Fixture with tuple, that contains application object and game information for api tests.
+        client: Fixture with flash client to make a request.
+        accept: Accept header of retried request.
+    """
+    if accept == "application/msgpack" and accept not in CODECS:
+        pytest.skip("Codec for application/msgpack is not installed.")
+    json_request = {**application[1]["game_started_player"], "coordinate": [1, 1]}
+    game = GAME_STORAGE[uuid.UUID(json_request["gameId"])]
+    headers = {"Idempotency-Key": str(uuid.uuid4())}
+
+    response = client.post(f"{BASE_URL}/player-shoot", json=json_request, headers=headers)
+    version = game.version
+    retried_response = client.post(f"{BASE_URL}/player-shoot", json=json_request, headers={**headers, "Accept": accept})
+
+    assert response.status_code == StatusCode.OK.value
+    assert retried_response.status_code == StatusCode.UNPROCESSABLE_ENTITY.value
+    assert "Idempotency-Replayed" not in retried_response.headers
+    assert game.version == version
+
+
+def test_wrong_idempotency_key(application, client):
+    """
+    Method tests that too long idempotency key is rejected.
+    Args:
+        application: Fixture with tuple, that contains application object and game information for api tests.
+        client: Fixture with flash client to make a request.
+    """
+    response = client.post(
+        f"{BASE_URL}/game-start", json=application[1]["ships_added"], headers={"Idempotency-Key": "k" * 256}
+    )
+    assert response.status_code == StatusCode.BAD_REQUEST.value
+
+
+def test_player_shoot_in_busy_game(application, client):
+    """
+    Method tests that request for the game, that is locked by other request, fails with busy error after timeout.
+    Args:
+        application: Fixture with tuple, that contains application object and game information for api tests.
+        client: Fixture with flash client to make a request.
+    """
+    json_request = {**application[1]["game_started_player"], "coordinate": [1, 1]}
+    game = GAME_STORAGE[uuid.UUID(json_request["gameId"])]
+    version = game.version
+
+    with patch.dict(application[0].config, {"GAME_LOCK_TIMEOUT": 0.01}), GAME_STORAGE.lock(game.id, 1):
+        response = client.post(f"{BASE_URL}/player-shoot", json=json_request)
+
+    assert response.status_code == StatusCode.SERVICE_UNAVAILABLE.value
+    assert response.json["errorCode"] == "GameBusyApiError"
+    assert response.headers["Retry-After"] == "1"
+    assert game.version == version
+    response = client.post(f"{BASE_URL}/player-shoot", json=json_request)
+    assert response.status_code == StatusCode.OK.value
@@ -0,0 +1,42 @@
+"""
+Module contains benchmark for playing the whole game inside the engine. Time of the game includes the final game
+state, as auto play returns it. Dictionary battlefield is the default engine and the one, that auto play target
+(under a millisecond per game) is set for: bitboard and NumPy battlefields read every cell through a view, so every
+shot costs them more.
+"""
+import logging
+import statistics
+import time
+
+from seabattle.game import Game
+from seabattle.game_objects.battlefield import BattleField
+from seabattle.game_objects.bitboard_battlefield import BitBoardBattleField
+from seabattle.game_objects.numpy_battlefield import NumPyBattleField
+
+NUMBER_OF_GAMES = 500
+
+
+def run_benchmark(number: int = NUMBER_OF_GAMES) -> None:
+    """
+    Method measures engine time of auto play for every battlefield engine and prints median time per game.
+    Args:
+        number: Number of games for every engine.
+    """
+    logging.disable(logging.CRITICAL)
+    for battlefield_class in (BattleField, BitBoardBattleField, NumPyBattleField):
+        times = []
+        moves = []
+        for _ in range(number):
+            game = Game(battlefield_class=battlefield_class)
+            game.player_auto_place_fleet()
+            game.start_game()
+            start = time.perf_counter()
+            state = game.auto_play()
+            times.append(time.perf_counter() - start)
+            moves.append(len(state["move_log"]))
+        print(f"{battlefield_class.__name__}: {statistics.median(times) * 1000:.3f} ms per game, "
+              f"{statistics.median(moves):.0f} moves per game")
+
+
+if __name__ == "__main__":
+    run_benchmark()
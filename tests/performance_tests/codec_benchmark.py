@@ -0,0 +1,35 @@
+"""Module contains benchmark for encoding and decoding of '/player-shoot' responses with different codecs."""
+import logging
+import timeit
+
+from seabattle.listener.codecs import CODECS, JSON_CODEC
+from seabattle.listener.serializers import serialize_game_info
+from tests.performance_tests.serializer_benchmark import create_started_game
+
+NUMBER_OF_RESPONSES = 2000
+
+
+def run_benchmark(number: int = NUMBER_OF_RESPONSES) -> None:
+    """
+    Method compares JSON and binary codecs for '/player-shoot' response and prints payload size
+    and encode/decode speed.
+    Args:
+        number: Number of responses for every measurement.
+    """
+    logging.disable(logging.CRITICAL)
+    game = create_started_game()
+    while not game.is_player_move:
+        game.enemy_shoot()
+    response = serialize_game_info(game.player_shoot((1, 1)))
+
+    for codec in (JSON_CODEC, *CODECS.values()):
+        payload = codec.encode(response)
+        assert codec.decode(payload) == response
+        encode_seconds = timeit.timeit(lambda codec=codec: codec.encode(response), number=number)
+        decode_seconds = timeit.timeit(lambda codec=codec, payload=payload: codec.decode(payload), number=number)
+        print(f"{codec.media_type}: {len(payload)} bytes, encode {number / encode_seconds:.0f} responses/s, "
+              f"decode {number / decode_seconds:.0f} responses/s")
+
+
+if __name__ == "__main__":
+    run_benchmark()
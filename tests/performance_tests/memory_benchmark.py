@@ -0,0 +1,44 @@
+"""Module contains benchmark for memory used by live games."""
+import gc
+import logging
+import tracemalloc
+
+from typing import Type
+
+from seabattle.game import Game
+from seabattle.game_objects.battlefield import BattleField
+from seabattle.game_objects.bitboard_battlefield import BitBoardBattleField
+from seabattle.game_objects.numpy_battlefield import NumPyBattleField
+from seabattle.helpers.constants import SHIPS_COORDINATES
+
+NUMBER_OF_GAMES = 1000
+
+
+def run_benchmark(battlefield_class: Type[BattleField], number: int = NUMBER_OF_GAMES) -> None:
+    """
+    Method measures memory, that is used by live started games, and prints bytes per game.
+    Args:
+        battlefield_class: Battlefield engine for games.
+        number: Number of games for measurement.
+    """
+    logging.disable(logging.CRITICAL)
+    games = []
+    gc.collect()
+    tracemalloc.start()
+    start_memory, _ = tracemalloc.get_traced_memory()
+    for _ in range(number):
+        game = Game(battlefield_class=battlefield_class)
+        for coordinates in SHIPS_COORDINATES:
+            game.player_set_ship(coordinates)
+        game.start_game()
+        games.append(game)
+    gc.collect()
+    end_memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{battlefield_class.__name__}: {(end_memory - start_memory) / number:.0f} bytes per live game "
+          f"({number} games).")
+
+
+if __name__ == "__main__":
+    for engine in (BattleField, BitBoardBattleField, NumPyBattleField):
+        run_benchmark(engine)
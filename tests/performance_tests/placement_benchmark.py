@@ -0,0 +1,30 @@
+"""Module contains benchmark for bot fleet placement."""
+import timeit
+
+from seabattle.game_objects.battlefield import BattleField
+from seabattle.game_objects.bot import EasyBot
+from seabattle.game_objects.fleet_placement import create_fleet_coordinates
+
+NUMBER_OF_FLEETS = 2000
+
+
+def run_benchmark(number: int = NUMBER_OF_FLEETS) -> None:
+    """
+    Method measures fleet placement speed and prints placements per second.
+    Args:
+        number: Number of fleets for every measurement.
+    """
+    battlefield = BattleField(name="Sailor")
+    ship_lens = battlefield.create_initial_ships()
+
+    seconds = timeit.timeit(
+        lambda: create_fleet_coordinates(battlefield.width, battlefield.height, ship_lens), number=number
+    )
+    print(f"Placement engine: {number / seconds:.0f} fleets/s, {number * len(ship_lens) / seconds:.0f} placements/s")
+
+    seconds = timeit.timeit(lambda: EasyBot(player_name="Enemy", enemy_name="Player"), number=number)
+    print(f"EasyBot creation (with battlefield validation): {number / seconds:.0f} bots/s")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -37,15 +37,14 @@ class SeabattleUser(HttpUser):
         response = self.client.post("/new-game")
         game_info = response.json()
 
-        for ship_coordinates in SHIPS_COORDINATES:
-            _ = self.client.post(
-                "/new-ship",
-                json={
-                    "gameId": game_info["gameId"],
-                    "playerId": game_info["playerId"],
-                    "coordinates": ship_coordinates
-                }
-            )
+        _ = self.client.post(
+            "/new-fleet",
+            json={
+                "gameId": game_info["gameId"],
+                "playerId": game_info["playerId"],
+                "ships": SHIPS_COORDINATES
+            }
+        )
 
         result = self.client.post(
             "/game-start",
@@ -67,7 +66,9 @@ class SeabattleUser(HttpUser):
                     json={
                         "gameId": game_info["gameId"],
                         "playerId": game_info["playerId"],
-                        "coordinate": coordinate_for_shooting
+                        "coordinate": coordinate_for_shooting,
+                        # Enemy replies are made in the same request (turn mode).
+                        "withEnemyReply": True
                     }
                 ).json()
                 is_player_move = result["isPlayerMove"]
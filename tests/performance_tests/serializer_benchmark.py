@@ -0,0 +1,45 @@
+"""Module contains benchmark for game state serializers."""
+import json
+import logging
+import timeit
+
+from seabattle.game import Game
+from seabattle.helpers.constants import SHIPS_COORDINATES
+from seabattle.listener.serializers import serialize_game_info
+from seabattle.listener.validators import validate_create_game_info_response
+
+NUMBER_OF_RESPONSES = 2000
+
+
+def create_started_game() -> Game:
+    """
+    Method creates game with all ships set and starts it.
+
+    Returns:
+        Started game.
+    """
+    game = Game()
+    for coordinates in SHIPS_COORDINATES:
+        game.player_set_ship(coordinates)
+    game.start_game()
+    return game
+
+
+def run_benchmark(number: int = NUMBER_OF_RESPONSES) -> None:
+    """
+    Method compares marshmallow validation and fast serializer for full game state and prints responses per second.
+    Args:
+        number: Number of responses for every measurement.
+    """
+    logging.disable(logging.CRITICAL)
+    state = create_started_game().return_game_state()
+
+    assert json.dumps(serialize_game_info(state)) == json.dumps(validate_create_game_info_response(state))
+    for name, serializer in (("Marshmallow validation", validate_create_game_info_response),
+                             ("Fast serializer", serialize_game_info)):
+        seconds = timeit.timeit(lambda serializer=serializer: serializer(state), number=number)
+        print(f"{name}: {number / seconds:.0f} responses/s")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -4,18 +4,18 @@ import pytest
 from seabattle.game_errors.battlefield_errors import BlockedAreaError, BlockedAreaAroundError, ShotCellEarlierError, \
     AreaOutsideBattleFieldError, CellNotExistError, ExtraShipInFleetError
 from seabattle.game_errors.ship_errors import ShipError
-from seabattle.game_objects.battlefield import BattleField
 from seabattle.helpers.constants import SignObjects, SHIPS_COORDINATES
 
 
-def test_set_ship_coordinate(battlefield):
+def test_set_ship_coordinate(battlefield, battlefield_class):
     """
     Method tests correct work of set_ship_coordinates method.
     Args:
         battlefield: Battlefield object.
+        battlefield_class: Battlefield engine class.
     """
     # Check if battlefield is not empty (from fixture), BattleField(name="Mike") created empty.
-    assert battlefield != BattleField(name="Mike")
+    assert battlefield != battlefield_class(name="Mike")
 
 
 @pytest.mark.parametrize(
@@ -46,6 +46,60 @@ def test_set_ship_coordinate_raised_error(battlefield, coordinates, error):
         battlefield.set_ship_coordinates(coordinates)
 
 
+def test_set_fleet_coordinates(battlefield_class):
+    """
+    Method tests that the whole fleet is added at once and matches fleet added ship by ship.
+    Args:
+        battlefield_class: Battlefield engine class.
+    """
+    fleet_battlefield = battlefield_class(name="Mike")
+    ships_battlefield = battlefield_class(name="Mike")
+    for coordinates in SHIPS_COORDINATES:
+        ships_battlefield.set_ship_coordinates(coordinates)
+
+    ship_cells = fleet_battlefield.set_fleet_coordinates(list(SHIPS_COORDINATES))
+
+    assert len(ship_cells) == sum(len(coordinates) for coordinates in SHIPS_COORDINATES)
+    assert fleet_battlefield.is_all_ships_added()
+    assert repr(fleet_battlefield) == repr(ships_battlefield)
+    assert fleet_battlefield.get_fleet_structure() == ships_battlefield.get_fleet_structure()
+
+
+@pytest.mark.parametrize(
+    ("fleet_coordinates", "error"), [
+        # The last ship is outside the battlefield.
+        ([[(5, 5)], [(50, -1)]], AreaOutsideBattleFieldError),
+        # The last ship overlaps ship from the fixture.
+        ([[(5, 5)], [(1, 2), (1, 3)]], BlockedAreaError),
+        # The last ship overlaps another new ship.
+        ([[(5, 5), (5, 6)], [(5, 6)]], BlockedAreaError),
+        # The last ship touches another new ship.
+        ([[(5, 5)], [(6, 6)]], BlockedAreaAroundError),
+        # There are too many ships with the same size.
+        ([[(3, 5)], [(5, 5)], [(7, 5)], [(9, 5)], [(3, 9)]], ExtraShipInFleetError),
+        # The last ship has wrong shape.
+        ([[(5, 5)], [(10, 10), (9, 9)]], ShipError),
+    ]
+)
+def test_set_fleet_coordinates_raised_error(battlefield, fleet_coordinates, error):
+    """
+    Method tests that no ship is added if any ship in the fleet has wrong coordinates.
+    Args:
+        battlefield: Battlefield object.
+        fleet_coordinates: List with coordinates for every ship.
+        error: Error class that should be raised.
+    """
+    representation = repr(battlefield)
+    fleet_structure = battlefield.get_fleet_structure()
+
+    with pytest.raises(error):
+        battlefield.set_fleet_coordinates(fleet_coordinates)
+
+    assert repr(battlefield) == representation
+    assert battlefield.get_fleet_structure() == fleet_structure
+    assert len(battlefield.ships) == 1
+
+
 @pytest.mark.parametrize(
     ("coordinate", "sign"), [
         ((1, 2), SignObjects.hit_sign.sign),  # Sign after successful shooting is correct.
@@ -145,9 +199,9 @@ def test_player_battlefield_repr(battlefield, coordinate, sign, result):
     assert repr(battlefield) == result
 
 
-def test_enemy_battlefield_repr():
+def test_enemy_battlefield_repr(battlefield_class):
     """Method checks if enemy battlefield printing in console works correct."""
-    battlefield = BattleField(name="Sailor", is_visible=False)
+    battlefield = battlefield_class(name="Sailor", is_visible=False)
     # Check battlefield with ship mark. Player shouldn't see enemy's ships.
     battlefield.battlefield.get((1, 2)).sign = SignObjects.ship_sign.sign
     assert repr(battlefield) == \
@@ -163,15 +217,15 @@ def test_enemy_battlefield_repr():
            "                   "
 
 
-def test_create_initial_ships():
+def test_create_initial_ships(battlefield_class):
     """Method test battlefield creates the correct list of ships lengths."""
-    battlefield = BattleField(name="Sailor", is_visible=False)
+    battlefield = battlefield_class(name="Sailor", is_visible=False)
     assert battlefield.create_initial_ships() == [4, 3, 3, 2, 2, 2, 1, 1, 1, 1]
 
 
-def test_all_ships_added_correct():
+def test_all_ships_added_correct(battlefield_class):
     """Method tests that battlefield returns correct bool value if all ships or not."""
-    battlefield = BattleField(name="Sailor", is_visible=False)
+    battlefield = battlefield_class(name="Sailor", is_visible=False)
 
     # Check before adding the ship. Until we add all ships, should be false.
     for ship_coordinate in SHIPS_COORDINATES:
@@ -180,3 +234,41 @@ def test_all_ships_added_correct():
 
     # After adding the last ship, should be true.
     assert battlefield.is_all_ships_added()
+
+
+def test_fleet_counters(battlefield):
+    """
+    Method tests that battlefield updates fleet counters after every hit.
+    Args:
+        battlefield: Battlefield object.
+    """
+    assert battlefield.alive_ship_cells == 2
+    assert battlefield.get_fleet_structure()["submarine"] == 1
+
+    _, is_killed = battlefield.shoot((1, 1))
+    assert not is_killed
+    assert battlefield.alive_ship_cells == 1
+    assert battlefield.get_fleet_structure()["submarine"] == 1
+    assert not battlefield.is_game_over
+
+    _, is_killed = battlefield.shoot((1, 2))
+    assert is_killed
+    assert battlefield.alive_ship_cells == 0
+    assert battlefield.get_fleet_structure()["submarine"] == 0
+    assert battlefield.is_game_over
+
+
+def test_ship_ids_are_local(battlefield_class):
+    """
+    Method tests that ships get small integer ids, that are unique inside the battlefield.
+    Args:
+        battlefield_class: Battlefield engine class.
+    """
+    battlefield = battlefield_class(name="Mike")
+    for coordinates in SHIPS_COORDINATES:
+        battlefield.set_ship_coordinates(coordinates)
+    assert list(battlefield.ships) == list(range(len(SHIPS_COORDINATES)))
+    for ship_id, ship in battlefield.ships.items():
+        assert ship.id == ship_id
+        for coordinate in ship.ship:
+            assert battlefield.battlefield[coordinate].ship_id == ship_id
@@ -0,0 +1,53 @@
+"""Module with unit tests for bitboard battlefield."""
+import random
+
+import pytest
+
+from seabattle.game_objects.battlefield import BattleField
+from seabattle.game_objects.bitboard_battlefield import BitBoardBattleField
+from seabattle.helpers.constants import SignObjects, SHIPS_COORDINATES
+
+
+@pytest.mark.parametrize(
+    ("sign",), [
+        (SignObjects.empty_sign.sign,),
+        (SignObjects.ship_sign.sign,),
+        (SignObjects.miss_sign.sign,),
+        (SignObjects.hit_sign.sign,),
+    ]
+)
+def test_cell_sign_round_trip(sign):
+    """
+    Method tests that cell view stores every sign in bitboard layers.
+    Args:
+        sign: Sign for setting.
+    """
+    battlefield = BitBoardBattleField(name="Mike")
+    battlefield.battlefield[(3, 4)].sign = sign
+    assert battlefield.battlefield[(3, 4)].sign == sign
+    assert battlefield.battlefield[(4, 3)].sign == SignObjects.empty_sign.sign
+    # Views of all cells (including border cells) are created with the battlefield.
+    assert battlefield.battlefield.keys() == BattleField(name="Mike").battlefield.keys()
+
+
+def test_same_results_as_dict_engine():
+    """Method tests that bitboard and dict engines give the same results for the same shots."""
+    dict_battlefield = BattleField(name="Mike")
+    bit_battlefield = BitBoardBattleField(name="Mike")
+    for coordinates in SHIPS_COORDINATES:
+        dict_battlefield.set_ship_coordinates(coordinates)
+        bit_battlefield.set_ship_coordinates(coordinates)
+
+    coordinates_for_shooting = [(x, y) for x in range(1, 11) for y in range(1, 11)]
+    random.shuffle(coordinates_for_shooting)
+    for coordinate in coordinates_for_shooting:
+        dict_result, dict_is_killed = dict_battlefield.shoot(coordinate)
+        bit_result, bit_is_killed = bit_battlefield.shoot(coordinate)
+        assert dict_result[coordinate].sign == bit_result[coordinate].sign
+        assert dict_is_killed == bit_is_killed
+        assert dict_battlefield.is_game_over == bit_battlefield.is_game_over
+        assert dict_battlefield.get_fleet_structure() == bit_battlefield.get_fleet_structure()
+        assert dict_battlefield.get_rows() == bit_battlefield.get_rows()
+
+    assert repr(dict_battlefield) == repr(bit_battlefield)
+    assert bit_battlefield.is_game_over
@@ -0,0 +1,50 @@
+"""Module with unit tests for board lookup tables."""
+import pytest
+
+from seabattle.helpers.board_lookup import get_board_lookup
+
+
+@pytest.mark.parametrize(("width", "height"), [(11, 11), (16, 21)])
+def test_board_lookup_tables(width, height):
+    """
+    Method tests that lookup tables contain correct cells for different board sizes.
+    Args:
+        width: Battlefield width.
+        height: Battlefield height.
+    """
+    lookup = get_board_lookup(width, height)
+    assert get_board_lookup(width, height) is lookup
+    assert len(lookup.coordinates) == (width + 1) * (height + 1)
+    assert len(lookup.inner_coordinates) == (width - 1) * (height - 1)
+    assert lookup.inner_coordinate_set == set(lookup.inner_coordinates)
+    # Corner cell has 3 neighbours, inner cell has 8 neighbours.
+    assert set(lookup.around[(0, 0)]) == {(1, 0), (0, 1), (1, 1)}
+    assert len(lookup.around[(1, 1)]) == 8
+    assert set(lookup.diagonals[(2, 2)]) == {(1, 1), (1, 3), (3, 1), (3, 3)}
+    assert set(lookup.horizontal[(2, 2)]) == {(1, 2), (3, 2)}
+    assert set(lookup.vertical[(2, 2)]) == {(2, 1), (2, 3)}
+
+
+def test_board_lookup_masks():
+    """Method tests that precomputed masks contain correct cells."""
+    lookup = get_board_lookup(11, 11)
+    assert bin(lookup.inner_mask).count("1") == 100
+    assert sum(lookup.inner_bits) == lookup.inner_mask
+    assert lookup.inner_bits[0] == lookup.cell_bits[(1, 1)]
+    # Corner cell has itself and 3 neighbours, inner cell has itself and 8 neighbours.
+    assert bin(lookup.halo_masks[0]).count("1") == 4
+    assert bin(lookup.halo_masks[lookup.get_index((1, 1))]).count("1") == 9
+
+
+def test_ship_halo():
+    """Method tests that ship halo contains ship cells and all cells around them."""
+    lookup = get_board_lookup(11, 11)
+    halo = lookup.get_ship_halo([(2, 2), (3, 2)])
+    assert halo == {(x, y) for x in range(1, 5) for y in range(1, 4)}
+
+
+def test_neighbours_share_coordinates():
+    """Method tests that lookup tables reuse the same coordinate objects."""
+    lookup = get_board_lookup(11, 11)
+    coordinates = {id(coordinate) for coordinate in lookup.coordinates}
+    assert all(id(neighbour) in coordinates for neighbour in lookup.around[(5, 5)])
@@ -2,9 +2,13 @@
 from seabattle.game_objects.bot import EasyBot
 
 
-def test_all_ships_have_correct_size():
-    """Method tests that all bot ships were added correct number of ships with correct sizes."""
-    bot = EasyBot(player_name="Sailor", enemy_name="Mike")
+def test_all_ships_have_correct_size(battlefield_class):
+    """
+    Method tests that all bot ships were added correct number of ships with correct sizes.
+    Args:
+        battlefield_class: Battlefield engine class.
+    """
+    bot = EasyBot(player_name="Sailor", enemy_name="Mike", battlefield_class=battlefield_class)
     ships_lens = bot.player_battlefield.create_initial_ships()
     assert len(bot.player_battlefield.ships) == len(ships_lens)
     for ship_len in set(ships_lens):
@@ -14,3 +14,10 @@ def test_cell_representation():
     """Method tests correct Cell object representation."""
     cell = Cell(x=1, y=1)
     assert repr(cell) == cell.sign
+
+
+def test_cell_is_slotted():
+    """Method tests that Cell object doesn't have per-instance dictionary and shares interned sign."""
+    cell = Cell(x=1, y=1)
+    assert not hasattr(cell, "__dict__")
+    assert cell.sign is SignObjects.empty_sign.sign
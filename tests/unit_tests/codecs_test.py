@@ -0,0 +1,107 @@
+"""Module with unit tests for codecs of api requests and responses."""
+import pytest
+from flask import Flask
+from werkzeug.exceptions import BadRequest
+
+from seabattle.listener.apispec_generator import get_apispec
+from seabattle.listener.codecs import CODECS, JSON_CODEC, CBOR_MEDIA_TYPE, MSGPACK_MEDIA_TYPE, create_response, \
+    get_request_data
+
+# Binary codecs depend on optional packages.
+pytest.importorskip("msgpack")
+pytest.importorskip("cbor2")
+
+DATA = {"gameId": "2b5d2b5e-7a34-4d4c-9f3c-7e8e9c1c0f2a", "coordinate": [1, 2], "isDelta": False}
+
+
+@pytest.mark.parametrize("media_type", [MSGPACK_MEDIA_TYPE, CBOR_MEDIA_TYPE])
+def test_codec_round_trip(media_type):
+    """
+    Method tests that binary codecs decode the same data, that was encoded.
+    Args:
+        media_type: Media type of codec.
+    """
+    codec = CODECS[media_type]
+    assert codec.decode(codec.encode(DATA)) == DATA
+    assert len(codec.encode(DATA)) < len(JSON_CODEC.encode(DATA))
+
+
+@pytest.mark.parametrize("media_type", [JSON_CODEC.media_type, MSGPACK_MEDIA_TYPE, CBOR_MEDIA_TYPE])
+def test_get_request_data(media_type):
+    """
+    Method tests that request body is decoded by Content-Type header.
+    Args:
+        media_type: Media type of request body.
+    """
+    codec = CODECS.get(media_type, JSON_CODEC)
+    with Flask(__name__).test_request_context(data=codec.encode(DATA), content_type=media_type):
+        assert get_request_data() == DATA
+
+
+@pytest.mark.parametrize(("data", "media_type"), [(b"\xc1", MSGPACK_MEDIA_TYPE), (b"\xff\xff", CBOR_MEDIA_TYPE)])
+def test_get_request_data_decoding_failed(data, media_type):
+    """
+    Method tests that broken binary request body is reported as bad request.
+    Args:
+        data: Broken request body.
+        media_type: Media type of request body.
+    """
+    with Flask(__name__).test_request_context(data=data, content_type=media_type):
+        with pytest.raises(BadRequest):
+            get_request_data()
+
+
+@pytest.mark.parametrize(
+    ("accept", "media_type"), [
+        (None, None),
+        ("application/json", None),
+        (MSGPACK_MEDIA_TYPE, MSGPACK_MEDIA_TYPE),
+        (f"application/json;q=0.5, {CBOR_MEDIA_TYPE}", CBOR_MEDIA_TYPE),
+    ]
+)
+def test_create_response(accept, media_type):
+    """
+    Method tests that response is encoded with codec chosen by Accept header.
+    Args:
+        accept: Accept header.
+        media_type: Expected media type of binary response, or None for JSON response.
+    """
+    headers = {"Accept": accept} if accept else {}
+    with Flask(__name__).test_request_context(headers=headers):
+        response = create_response(DATA, 200)
+    if media_type is None:
+        assert response == (DATA, 200)
+    else:
+        assert response.mimetype == media_type
+        assert response.status_code == 200
+        assert CODECS[media_type].decode(response.get_data()) == DATA
+
+
+def test_apispec_documents_media_types():
+    """Method tests that alternate media types are documented with the same schemas as JSON."""
+    app = Flask(__name__)
+
+    @app.route("/ping", methods=["POST"])
+    def ping():
+        """
+        ---
+        post:
+            requestBody:
+                content:
+                    application/json:
+                        schema:
+                            type: object
+            responses:
+                "200":
+                    description: OK
+                    content:
+                        application/json:
+                            schema:
+                                type: string
+        """
+
+    with app.test_request_context():
+        spec = get_apispec(app, "Test", "1.0.0", [MSGPACK_MEDIA_TYPE]).to_dict()
+    operation = spec["paths"]["/ping"]["post"]
+    assert operation["requestBody"]["content"][MSGPACK_MEDIA_TYPE] == {"schema": {"type": "object"}}
+    assert operation["responses"]["200"]["content"][MSGPACK_MEDIA_TYPE] == {"schema": {"type": "string"}}
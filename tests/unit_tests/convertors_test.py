@@ -0,0 +1,52 @@
+"""Module with unit tests for convertors."""
+import base64
+
+from seabattle.game_objects.battlefield import BattleField
+from seabattle.helpers.constants import SignObjects
+from seabattle.helpers.convertors import convert_coordinates, convert_to_rows, convert_to_bitmasks, \
+    convert_rows_to_bitmasks, convert_rows_to_coordinates
+
+
+def test_convert_to_rows(battlefield):
+    """
+    Method tests that battlefield is converted into row-major string with signs.
+    Args:
+        battlefield: Battlefield object with ship in (1, 1), (1, 2).
+    """
+    battlefield.shoot((3, 1))
+    rows = convert_to_rows(battlefield.get_battlefield(), battlefield.width, battlefield.height)
+    assert len(rows) == 100
+    assert rows[0] == rows[10] == SignObjects.ship_sign.sign
+    assert rows[2] == SignObjects.miss_sign.sign
+    assert rows.count(SignObjects.empty_sign.sign) == 97
+
+
+def test_convert_to_bitmasks():
+    """Method tests that battlefield is converted into base64 bitmask for every sign layer."""
+    battlefield = BattleField(name="Mike")
+    battlefield.set_ship_coordinates([(2, 1), (3, 1)])
+    battlefield.shoot((2, 1))
+    battlefield.shoot((10, 10))
+    masks = convert_to_bitmasks(battlefield.get_battlefield(), battlefield.width, battlefield.height)
+
+    def decode(mask: str) -> int:
+        return int.from_bytes(base64.b64decode(mask), "little")
+
+    assert decode(masks["ship"]) == 1 << 2
+    assert decode(masks["hit"]) == 1 << 1
+    assert decode(masks["miss"]) == 1 << 99
+
+
+def test_convert_rows(battlefield):
+    """
+    Method tests that battlefield rows are converted into the same cells and bitmasks, as battlefield cells.
+    Args:
+        battlefield: Battlefield object with ship in (1, 1), (1, 2).
+    """
+    battlefield.shoot((1, 1))
+    battlefield.shoot((5, 5))
+    cells, rows = battlefield.get_battlefield(), battlefield.get_rows()
+
+    assert rows == convert_to_rows(cells, battlefield.width, battlefield.height)
+    assert convert_rows_to_coordinates(rows, battlefield.width, battlefield.height) == convert_coordinates(cells)
+    assert convert_rows_to_bitmasks(rows) == convert_to_bitmasks(cells, battlefield.width, battlefield.height)
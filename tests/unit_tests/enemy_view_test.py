@@ -0,0 +1,51 @@
+"""Module with unit tests for enemy view."""
+import pytest
+
+from seabattle.game_objects.enemy_view import EnemyView
+from seabattle.helpers.constants import SignObjects
+
+
+def test_enemy_view_masks_ships(battlefield):
+    """
+    Method tests that enemy view hides ship cells, that weren't hit, and shows hit and miss cells.
+    Args:
+        battlefield: Battlefield object.
+    """
+    view = EnemyView(battlefield)
+    assert view.battlefield[(1, 1)].sign == SignObjects.empty_sign.sign
+    assert view.battlefield[(1, 1)].ship_id is None
+
+    battlefield.shoot((1, 1))
+    battlefield.shoot((3, 3))
+    assert view.battlefield[(1, 1)].sign == SignObjects.hit_sign.sign
+    assert view.battlefield[(1, 1)].ship_id is None
+    assert view.battlefield[(1, 2)].sign == SignObjects.empty_sign.sign
+    assert view.battlefield[(3, 3)].sign == SignObjects.miss_sign.sign
+    assert SignObjects.ship_sign.sign not in repr(view)
+
+
+def test_enemy_view_is_read_only(battlefield):
+    """
+    Method tests that changes of enemy view cells don't change opponent's battlefield.
+    Args:
+        battlefield: Battlefield object.
+    """
+    view = EnemyView(battlefield)
+    view.battlefield[(1, 1)].sign = SignObjects.miss_sign.sign
+    assert battlefield.battlefield[(1, 1)].sign == SignObjects.ship_sign.sign
+    with pytest.raises(TypeError):
+        view.battlefield[(1, 1)] = None  # type: ignore[index]
+
+
+def test_enemy_view_get_battlefield(battlefield):
+    """
+    Method tests that enemy view returns only cells that end user should see.
+    Args:
+        battlefield: Battlefield object.
+    """
+    view = EnemyView(battlefield)
+    cells = view.get_battlefield()
+    assert list(cells) == list(battlefield.get_battlefield())
+    assert {cell.sign for cell in cells.values()} == {SignObjects.empty_sign.sign}
+    assert view.get_rows() == "".join(cell.sign for cell in cells.values())
+    assert view.name == battlefield.name
@@ -0,0 +1,68 @@
+"""Module with unit tests for game events broker."""
+import uuid
+
+from seabattle.listener.event_stream import GameEventBroker, CONNECTED_EVENT, KEEPALIVE_EVENT, OVERFLOW_EVENT, \
+    format_event
+
+
+def test_format_event():
+    """Method tests that event is serialized in server-sent events format."""
+    assert format_event("change", 3, {"isDelta": True}) == b'id: 3\nevent: change\ndata: {"isDelta":true}\n\n'
+
+
+def test_publish_shares_event_between_subscribers():
+    """Method tests that all subscribers get the same event object and other games don't get it."""
+    broker = GameEventBroker()
+    game_id = uuid.uuid4()
+    subscriptions = [broker.subscribe(game_id) for _ in range(3)]
+    other_subscription = broker.subscribe(uuid.uuid4())
+    event = format_event("change", 1, {})
+
+    broker.publish(game_id, event)
+
+    assert all(subscription.events.get_nowait() is event for subscription in subscriptions)
+    assert other_subscription.events.empty()
+
+
+def test_slow_subscriber_is_disconnected():
+    """Method tests that subscriber with full buffer is removed and its stream ends with overflow event."""
+    broker = GameEventBroker(buffer_size=2)
+    game_id = uuid.uuid4()
+    slow_subscription = broker.subscribe(game_id)
+    events = [format_event("change", version, {}) for version in range(3)]
+
+    for event in events:
+        broker.publish(game_id, event)
+
+    assert slow_subscription.is_overflowed
+    assert not broker.has_subscribers(game_id)
+    assert list(broker.stream(game_id, slow_subscription)) == [CONNECTED_EVENT, *events[:2], OVERFLOW_EVENT]
+
+
+def test_stream_sends_keepalive_and_ends_on_close():
+    """Method tests that stream sends keepalive comments without events and ends after game is closed."""
+    broker = GameEventBroker(keepalive_interval=0.01)
+    game_id = uuid.uuid4()
+    subscription = broker.subscribe(game_id)
+    stream = broker.stream(game_id, subscription)
+
+    assert next(stream) == CONNECTED_EVENT
+    assert next(stream) == KEEPALIVE_EVENT
+    broker.close(game_id)
+    assert not list(stream)
+    assert not broker.has_subscribers(game_id)
+
+
+def test_stream_unsubscribes_on_disconnect():
+    """Method tests that subscription is removed when client disconnects (stream is closed)."""
+    broker = GameEventBroker()
+    game_id = uuid.uuid4()
+    subscription = broker.subscribe(game_id)
+    stream = broker.stream(game_id, subscription)
+    broker.publish(game_id, format_event("change", 1, {}))
+
+    assert next(stream) == CONNECTED_EVENT
+    assert next(stream).startswith(b"id: 1")
+    stream.close()
+
+    assert not broker.has_subscribers(game_id)
@@ -0,0 +1,47 @@
+"""Module with unit tests for fleet placement engine."""
+from seabattle.game_objects.battlefield import BattleField
+from seabattle.game_objects.fleet_placement import FleetPlacement, create_fleet_coordinates, get_placement_tables
+
+
+def test_placement_tables():
+    """Method tests that tables contain all placements for every ship length on 10x10 board."""
+    tables = get_placement_tables(11, 11, (1, 2, 3, 4))
+    assert {ship_len: len(placements) for ship_len, placements in tables.placements.items()} == \
+           {1: 100, 2: 180, 3: 160, 4: 140}
+
+
+def test_block_invalidates_placements():
+    """Method tests that placements around the placed ship are invalidated."""
+    placement = FleetPlacement(11, 11, [1, 2])
+    placement.block([(1, 1)])
+    # Cells (1, 1), (1, 2), (2, 1), (2, 2) are blocked.
+    assert len(placement.alive_placements[1]) == 96
+    for placement_id in placement.alive_placements[2]:
+        assert not set(placement.tables.placements[2][placement_id]) & {(1, 1), (1, 2), (2, 1), (2, 2)}
+
+
+def test_create_fleet_coordinates():
+    """Method tests that created fleet can be added to the battlefield."""
+    battlefield = BattleField(name="Sailor")
+    ship_lens = battlefield.create_initial_ships()
+    fleet_coordinates = create_fleet_coordinates(battlefield.width, battlefield.height, ship_lens)
+
+    assert [len(coordinates) for coordinates in fleet_coordinates] == ship_lens
+    for coordinates in fleet_coordinates:
+        battlefield.set_ship_coordinates(coordinates)
+    assert battlefield.is_all_ships_added()
+
+
+def test_create_fleet_coordinates_around_placed_ships():
+    """Method tests that fleet is created only for remaining ships and can be added around placed ships."""
+    battlefield = BattleField(name="Sailor")
+    battlefield.set_ship_coordinates([(1, 1), (1, 2), (1, 3), (1, 4)])
+    battlefield.set_ship_coordinates([(5, 5)])
+    fleet_coordinates = create_fleet_coordinates(
+        battlefield.width, battlefield.height, battlefield.get_new_ships(),
+        placed_coordinates=[list(ship.ship) for ship in battlefield.ships.values()]
+    )
+
+    assert sorted(len(coordinates) for coordinates in fleet_coordinates) == [1, 1, 1, 2, 2, 2, 3, 3]
+    battlefield.set_fleet_coordinates(fleet_coordinates)
+    assert battlefield.is_all_ships_added()
@@ -0,0 +1,50 @@
+"""Module with unit tests for fleet pool."""
+import time
+
+from seabattle.game_objects.battlefield import BattleField
+from seabattle.game_objects.fleet_pool import FleetPool
+
+
+def test_get_counts_hits_and_misses():
+    """Method tests that pool returns layouts from the pool first and generates them when pool is empty."""
+    pool = FleetPool(size=2)
+    pool.fill()
+    assert len(pool) == 2
+
+    for _ in range(3):
+        battlefield = BattleField(name="Sailor")
+        for coordinates in pool.get():
+            battlefield.set_ship_coordinates(coordinates)
+        assert battlefield.is_all_ships_added()
+
+    assert pool.get_stats() == {"size": 0, "hits": 2, "misses": 1}
+
+
+def wait_for_pool_size(pool: FleetPool, size: int, timeout: float = 5) -> bool:
+    """
+    Method waits until pool has specified number of layouts.
+    Args:
+        pool: FleetPool object.
+        size: Expected number of layouts.
+        timeout: Maximum waiting time in seconds.
+
+    Returns:
+        True, if pool has specified number of layouts before timeout.
+    """
+    deadline = time.monotonic() + timeout
+    while len(pool) != size and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return len(pool) == size
+
+
+def test_worker_refills_pool():
+    """Method tests that background worker fills the pool after every taken layout and stops correctly."""
+    pool = FleetPool(size=3)
+    pool.start()
+    try:
+        assert wait_for_pool_size(pool, 3)
+        pool.get()
+        assert wait_for_pool_size(pool, 3)
+        assert pool.get_stats()["hits"] == 1
+    finally:
+        pool.stop()
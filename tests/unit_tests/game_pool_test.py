@@ -0,0 +1,40 @@
+"""Module with unit tests for game pool."""
+import time
+
+from seabattle.listener.game_pool import GamePool
+
+
+def test_get_assigns_new_ids():
+    """Method tests that every issued game gets new ids and doesn't share state with other games."""
+    pool = GamePool(size=2)
+    pool.fill()
+    pooled_ids = {game.id for game in pool._objects}  # pylint: disable=protected-access
+
+    first_game = pool.get()
+    second_game = pool.get()
+    third_game = pool.get()
+
+    assert pool.get_stats() == {"size": 0, "hits": 2, "misses": 1}
+    assert not pooled_ids & {first_game.id, second_game.id, third_game.id}
+    assert first_game.player.id != second_game.player.id
+    assert first_game.player.player_battlefield is not second_game.player.player_battlefield
+    assert first_game.enemy.player_battlefield is not second_game.enemy.player_battlefield
+    assert first_game.player.logger is first_game.logger
+
+
+def test_refill_after_low_watermark():
+    """Method tests that background worker refills the pool only after it falls below low watermark."""
+    pool = GamePool(size=3, low_watermark=2)
+    pool.fill()
+    pool.start()
+    try:
+        pool.get()
+        assert len(pool) == 2
+
+        pool.get()
+        deadline = time.monotonic() + 5
+        while len(pool) != 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(pool) == 3
+    finally:
+        pool.stop()
@@ -0,0 +1,210 @@
+"""Module with unit tests for storage of active games."""
+import threading
+import time
+import uuid
+
+import pytest
+
+from seabattle.game import Game
+from seabattle.game_errors.api_errors import GameBusyApiError
+from seabattle.listener.game_storage import GameStorage
+
+
+class FakeClock:
+    """Class contains manually moved time for storage tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TickingClock(FakeClock):
+    """Class contains time, that is moved forward on every call, so every game activity has its own time."""
+
+    def __call__(self) -> float:
+        self.now += 1
+        return self.now
+
+
+def test_idle_games_are_expired():
+    """Method tests that only games without activity for ttl seconds are removed."""
+    clock = FakeClock()
+    storage = GameStorage(ttl=10, clock=clock)
+    evicted_games = []
+    storage.eviction_listener = evicted_games.append
+    idle_game, active_game = Game(), Game()
+    storage[idle_game.id] = idle_game
+    storage[active_game.id] = active_game
+
+    clock.now = 6
+    assert storage.get(active_game.id) is active_game
+    # Check of game presence isn't an activity.
+    assert idle_game.id in storage
+    clock.now = 10
+    assert storage.evict_expired() == 1
+
+    assert evicted_games == [idle_game]
+    assert list(storage) == [active_game.id]
+    clock.now = 16
+    assert storage.evict_expired() == 1
+    assert not storage
+    assert storage.get_stats() == {"size": 0, "expired": 2, "evicted": 0}
+
+
+def test_least_recently_used_game_is_evicted():
+    """Method tests that the least recently used game of the whole storage is removed, when storage is full."""
+    clock = TickingClock()
+    storage = GameStorage(max_games=16, clock=clock)
+    evicted_games = []
+    storage.eviction_listener = evicted_games.append
+    games = [Game() for _ in range(17)]
+    for game in games[:16]:
+        storage[game.id] = game
+
+    # No game is evicted until the limit is exceeded.
+    assert not evicted_games
+    assert len(storage) == 16
+
+    _ = storage[games[0].id]
+    storage[games[16].id] = games[16]
+
+    assert evicted_games == [games[1]]
+    assert set(storage) == {game.id for game in games} - {games[1].id}
+    assert storage.get_stats() == {"size": 16, "expired": 0, "evicted": 1}
+
+
+def test_small_storage_limit():
+    """Method tests that storage with limit smaller than number of stripes keeps exactly max_games games."""
+    storage = GameStorage(max_games=3, clock=TickingClock())
+    games = [Game() for _ in range(5)]
+    for game in games[:3]:
+        storage[game.id] = game
+    assert storage.get_stats()["evicted"] == 0
+
+    for game in games[3:]:
+        storage[game.id] = game
+    assert set(storage) == {game.id for game in games[2:]}
+    assert storage.get_stats() == {"size": 3, "expired": 0, "evicted": 2}
+
+
+def test_removed_games_are_not_evicted():
+    """Method tests that games removed by client are not reported as evicted and their heap entries are dropped."""
+    clock = FakeClock()
+    storage = GameStorage(ttl=10, clock=clock)
+    game = Game()
+    storage[game.id] = game
+    storage.pop(game.id)
+    storage[game.id] = game
+
+    clock.now = 10
+    assert storage.evict_expired() == 1
+    assert storage.get_stats()["expired"] == 1
+
+
+def test_pop_of_evicted_game():
+    """Method tests that game, that is already evicted, is popped without error and isn't counted twice."""
+    storage = GameStorage(max_games=1)
+    game, new_game = Game(), Game()
+    storage[game.id] = game
+    assert storage.pop(game.id) is game
+    assert storage.pop(game.id, None) is None
+
+    storage[game.id] = game
+    storage[new_game.id] = new_game
+    assert storage.pop(game.id, None) is None
+    with pytest.raises(KeyError):
+        del storage[game.id]
+    assert len(storage) == 1
+    assert storage.get_stats() == {"size": 1, "expired": 0, "evicted": 1}
+
+
+def test_reaper_removes_expired_games():
+    """Method tests that background reaper removes expired games."""
+    storage = GameStorage(ttl=0.01, reap_interval=0.01)
+    game = Game()
+    storage[game.id] = game
+    storage.start()
+    try:
+        deadline = time.monotonic() + 5
+        while game.id in storage and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert game.id not in storage
+    finally:
+        storage.stop()
+
+
+def test_games_are_split_between_stripes():
+    """Method tests that games are split between stripes and storage works as one dictionary."""
+    storage = GameStorage(stripes_number=4)
+    games = {game.id: game for game in (Game() for _ in range(20))}
+    storage.update(games)
+
+    assert len(storage) == len(games)
+    assert set(storage) == set(games)
+    assert sum(1 for stripe in storage._stripes if stripe.games) > 1  # pylint: disable=protected-access
+    assert all(storage[game_id] is game for game_id, game in games.items())
+
+
+def test_game_lock():
+    """Method tests that locked game raises busy error after timeout, and other games aren't blocked by it."""
+    storage = GameStorage(stripes_number=1)
+    locked_game, other_game = Game(), Game()
+    storage.update({locked_game.id: locked_game, other_game.id: other_game})
+    is_locked, is_released = threading.Event(), threading.Event()
+
+    def hold_lock():
+        with storage.lock(locked_game.id, timeout=1):
+            is_locked.set()
+            is_released.wait(5)
+
+    worker = threading.Thread(target=hold_lock)
+    worker.start()
+    try:
+        assert is_locked.wait(5)
+        with pytest.raises(GameBusyApiError):
+            with storage.lock(locked_game.id, timeout=0.01):
+                pass
+        # Game from the same stripe and not existing game are not blocked.
+        with storage.lock(other_game.id, timeout=0.01), storage.lock(uuid.uuid4(), timeout=0.01):
+            _ = storage[other_game.id]
+    finally:
+        is_released.set()
+        worker.join()
+    with storage.lock(locked_game.id, timeout=0.01):
+        assert storage[locked_game.id] is locked_game
+
+
+def test_locked_games_are_not_evicted():
+    """Method tests that game, that is locked by request, is neither expired nor evicted as least recently used."""
+    clock = FakeClock()
+    storage = GameStorage(ttl=10, max_games=2, clock=clock)
+    evicted_games = []
+    storage.eviction_listener = evicted_games.append
+    locked_game, idle_game, new_game, other_game = Game(), Game(), Game(), Game()
+    storage[locked_game.id] = locked_game
+    clock.now = 1
+    storage[idle_game.id] = idle_game
+
+    with storage.lock(locked_game.id, timeout=0.01):
+        # The next least recently used game is evicted instead of the locked one.
+        clock.now = 2
+        storage[new_game.id] = new_game
+        assert evicted_games == [idle_game]
+        clock.now = 12
+        assert storage.evict_expired() == 1
+        assert evicted_games == [idle_game, new_game]
+        storage[other_game.id] = other_game
+        clock.now = 13
+        storage[new_game.id] = new_game
+        assert evicted_games == [idle_game, new_game, other_game]
+        assert set(storage) == {locked_game.id, new_game.id}
+
+    assert storage.get_stats() == {"size": 2, "expired": 1, "evicted": 2}
+    # Locked game is rescheduled as active at the time of the check.
+    clock.now = 21
+    assert storage.evict_expired() == 0
+    clock.now = 22
+    assert storage.evict_expired() == 1
+    assert list(storage) == [new_game.id]
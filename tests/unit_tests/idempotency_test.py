@@ -0,0 +1,39 @@
+"""Module with unit tests for cache of responses by idempotency keys."""
+from flask import Flask
+
+from seabattle.listener.idempotency import IdempotencyCache, StoredResponse
+
+
+def test_idempotency_cache_is_bounded_per_game():
+    """Method tests that only the most recent responses are stored for every game."""
+    cache = IdempotencyCache(size=2)
+    responses = [StoredResponse(str(i), str(i).encode(), 200, "application/json") for i in range(3)]
+    for i, response in enumerate(responses):
+        cache.add("game", f"key-{i}", response)
+    cache.add("other_game", "key-0", responses[0])
+
+    assert cache.get("game", "key-0") is None
+    assert cache.get("game", "key-1") is responses[1]
+    assert cache.get("game", "key-2") is responses[2]
+    assert cache.get("other_game", "key-0") is responses[0]
+
+    cache.discard("game")
+    assert cache.get("game", "key-2") is None
+
+
+def test_disabled_idempotency_cache():
+    """Method tests that cache with zero size doesn't store responses."""
+    cache = IdempotencyCache(size=0)
+    cache.add("game", "key", StoredResponse("", b"", 200, None))
+    assert cache.get("game", "key") is None
+
+
+def test_idempotency_fingerprint_contains_representation():
+    """Method tests that the same request gets other fingerprint, if it asks for other response representation."""
+    representation = ["application/json"]
+    cache = IdempotencyCache(get_representation=lambda: representation[0])
+    with Flask(__name__).test_request_context("/player-shoot", method="POST", data=b"{}"):
+        fingerprint = cache.get_fingerprint()
+        assert cache.get_fingerprint() == fingerprint
+        representation[0] = "application/msgpack"
+        assert cache.get_fingerprint() != fingerprint
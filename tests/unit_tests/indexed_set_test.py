@@ -0,0 +1,42 @@
+"""Module with unit tests for indexed set."""
+import pytest
+
+from seabattle.helpers.indexed_set import IndexedSet
+
+
+def test_add_and_discard():
+    """Method tests that indexed set keeps only unique items and removes them correctly."""
+    items = IndexedSet([(1, 1), (1, 2), (1, 3)])
+    items.add((1, 1))
+    assert len(items) == 3
+
+    items.discard((1, 1))
+    items.discard((5, 5))
+    assert (1, 1) not in items
+    assert set(items) == {(1, 2), (1, 3)}
+
+    with pytest.raises(KeyError):
+        items.remove((1, 1))
+
+
+def test_pop_random():
+    """Method tests that pop_random returns every item once and then raises KeyError."""
+    coordinates = {(x, y) for x in range(1, 11) for y in range(1, 11)}
+    items = IndexedSet(coordinates)
+
+    popped = {items.pop_random() for _ in range(len(coordinates))}
+    assert popped == coordinates
+    assert not items
+
+    with pytest.raises(KeyError):
+        items.pop_random()
+
+
+def test_difference_update():
+    """Method tests that difference_update removes only items, that are in the set, and keeps positions correct."""
+    items = IndexedSet(range(10))
+    items.difference_update([0, 9, 5, 42])
+    assert set(items) == {1, 2, 3, 4, 6, 7, 8}
+
+    items.remove(8)
+    assert sorted(items.pop_random() for _ in range(len(items))) == [1, 2, 3, 4, 6, 7]
@@ -0,0 +1,55 @@
+"""Module with unit tests for NumPy battlefield."""
+import random
+
+from seabattle.game_objects.battlefield import BattleField
+from seabattle.game_objects.numpy_battlefield import NumPyBattleField
+from seabattle.helpers.constants import SignObjects, SHIPS_COORDINATES
+
+
+def test_cells_array_values():
+    """Method tests that battlefield array contains sign values."""
+    battlefield = NumPyBattleField(name="Mike")
+    battlefield.set_ship_coordinates([(1, 1), (1, 2)])
+    battlefield.shoot((1, 1))
+    battlefield.shoot((5, 5))
+
+    assert battlefield.cells.shape == (12, 12)
+    assert battlefield.cells[1, 1] == SignObjects.hit_sign.value
+    assert battlefield.cells[2, 1] == SignObjects.ship_sign.value
+    assert battlefield.cells[5, 5] == SignObjects.miss_sign.value
+    assert battlefield.get_signs().shape == (10, 10)
+
+
+def test_mark_missed_cells():
+    """Method tests that only empty cells are marked as missed."""
+    battlefield = NumPyBattleField(name="Mike")
+    battlefield.set_ship_coordinates([(1, 1)])
+    battlefield.mark_missed_cells([(0, 0), (1, 1), (2, 2)])
+
+    assert battlefield.battlefield[(0, 0)].sign == SignObjects.miss_sign.sign
+    assert battlefield.battlefield[(1, 1)].sign == SignObjects.ship_sign.sign
+    assert battlefield.battlefield[(2, 2)].sign == SignObjects.miss_sign.sign
+
+
+def test_same_results_as_dict_engine():
+    """Method tests that NumPy and dict engines give the same results for the same shots."""
+    dict_battlefield = BattleField(name="Mike")
+    numpy_battlefield = NumPyBattleField(name="Mike")
+    for coordinates in SHIPS_COORDINATES:
+        dict_battlefield.set_ship_coordinates(coordinates)
+        numpy_battlefield.set_ship_coordinates(coordinates)
+
+    coordinates_for_shooting = [(x, y) for x in range(1, 11) for y in range(1, 11)]
+    random.shuffle(coordinates_for_shooting)
+    for coordinate in coordinates_for_shooting:
+        dict_result, dict_is_killed = dict_battlefield.shoot(coordinate)
+        numpy_result, numpy_is_killed = numpy_battlefield.shoot(coordinate)
+        assert dict_result[coordinate].sign == numpy_result[coordinate].sign
+        assert dict_is_killed == numpy_is_killed
+        assert dict_battlefield.is_game_over == numpy_battlefield.is_game_over
+        assert dict_battlefield.get_fleet_structure() == numpy_battlefield.get_fleet_structure()
+        assert dict_battlefield.get_battlefield() == numpy_battlefield.get_battlefield()
+        assert dict_battlefield.get_rows() == numpy_battlefield.get_rows()
+
+    assert repr(dict_battlefield) == repr(numpy_battlefield)
+    assert numpy_battlefield.is_game_over
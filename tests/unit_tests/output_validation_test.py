@@ -0,0 +1,64 @@
+"""Module with unit tests for output validation policy."""
+from unittest.mock import MagicMock
+
+import pytest
+from marshmallow import ValidationError
+
+from seabattle.listener.output_validation import OutputValidator
+
+
+def _validate(data: dict) -> dict:
+    """Method imitates schema validation, that fails for negative values."""
+    if data["value"] < 0:
+        raise ValidationError({"value": ["Must be greater than or equal to 0."]})
+    return {"value": data["value"], "validated": True}
+
+
+def _serialize(data: dict) -> dict:
+    """Method imitates fast serializer."""
+    return {"value": data["value"], "validated": False}
+
+
+@pytest.mark.parametrize(
+    ("policy", "sample_rate", "validated", "checks"), [
+        ("always", 0, True, 1),
+        ("sampled", 100, True, 1),
+        ("sampled", 0, False, 0),
+        ("off", 100, False, 0),
+    ]
+)
+def test_output_validation_policy(policy, sample_rate, validated, checks):
+    """
+    Method tests that responses are validated according to the policy.
+    Args:
+        policy: Output validation policy.
+        sample_rate: Percent of validated responses.
+        validated: True, if response should be validated.
+        checks: Expected number of checks.
+    """
+    validator = OutputValidator(policy=policy, sample_rate=sample_rate)
+    assert validator.create_response({"value": 1}, _validate, _serialize) == {"value": 1, "validated": validated}
+    assert validator.get_stats() == {"checks": checks, "violations": 0}
+
+
+def test_sampled_violation_is_counted_and_logged():
+    """Method tests that violation in sampled mode is counted and logged, and response is returned anyway."""
+    logger = MagicMock()
+    validator = OutputValidator(policy="sampled", sample_rate=100, logger=logger)
+    assert validator.create_response({"value": -1}, _validate, _serialize) == {"value": -1, "validated": False}
+    assert validator.get_stats() == {"checks": 1, "violations": 1}
+    logger.error.assert_called_once()
+
+
+def test_always_violation_is_raised():
+    """Method tests that violation in 'always' mode is counted and raised."""
+    validator = OutputValidator(policy="always", logger=MagicMock())
+    with pytest.raises(ValidationError):
+        validator.create_response({"value": -1}, _validate, _serialize)
+    assert validator.get_stats() == {"checks": 1, "violations": 1}
+
+
+def test_unknown_policy():
+    """Method tests that unknown policy is rejected."""
+    with pytest.raises(ValueError):
+        OutputValidator(policy="sometimes")
@@ -54,7 +54,7 @@ def test_player_repr(player):
     # Set ship sign on player battlefield. Should be visible.
     player.player_battlefield.battlefield[(1, 1)].sign = SignObjects.ship_sign.sign
     # Set ship sign on enemy battlefield. Shouldn't be visible.
-    player.enemy_battlefield.battlefield[(1, 1)].sign = SignObjects.ship_sign.sign
+    player.enemy_battlefield.source.battlefield[(1, 1)].sign = SignObjects.ship_sign.sign
     # Set miss sign on player battlefield. Should be visible.
     player.player_battlefield.battlefield[(1, 2)].sign = SignObjects.miss_sign.sign
     # Set hit sign on player battlefield. Should be visible.
@@ -96,7 +96,7 @@ def test_player_repr(player):
 @patch("seabattle.game_objects.player.Player.clear_coordinates_for_shooting")
 def test_shoot(clear_func, define_func, player, shooting_results, is_killed):
     """
-    Method checks if shoot player's method correctly set new signs for cells.
+    Method checks if shoot player's method correctly processes shooting results.
     Args:
         clear_func: Mock the call clear_coordinates_for_shooting function.
         define_func: Mock the call define_top_target_coordinates function.
@@ -113,9 +113,9 @@ def test_shoot(clear_func, define_func, player, shooting_results, is_killed):
     for coordinate in shooting_results.keys():
         assert player.enemy_battlefield.battlefield[coordinate].sign == SignObjects.empty_sign.sign
     player.shoot(shooting_results, is_killed)
-    # Check that all cells from shooting_results were updated.
+    # Enemy view is read from enemy battlefield, so shooting results are not copied into it.
     for coordinate, cell in shooting_results.items():
-        assert player.enemy_battlefield.battlefield[coordinate] == cell
+        assert player.enemy_battlefield.battlefield[coordinate].sign == SignObjects.empty_sign.sign
         if cell.sign == SignObjects.hit_sign.sign:
             assert player.demaged_ships_coordinates == [coordinate]
 
@@ -260,3 +260,20 @@ def test_set_sings_for_lucky_shoot(get_func, player, get_mock, coordinate, is_ki
     # hit_sign tested in shoot function.
     for x, y in get_mock:
         assert player.player_battlefield.battlefield[(x, y)].sign == SignObjects.miss_sign.sign
+
+
+def test_auto_place_fleet(player):
+    """
+    Method tests that player fleet is completed automatically (the same way as bot fleet).
+    Args:
+        player: Player object.
+    """
+    player.set_ship_coordinates([(1, 1), (1, 2)])
+
+    ship_cells = player.auto_place_fleet()
+
+    assert len(ship_cells) == 18
+    assert player.is_all_ships_added()
+    assert player.player_battlefield.get_fleet_structure() == {
+        "patrol_boat": 4, "submarine": 3, "destroyer": 2, "battleship": 1
+    }
@@ -0,0 +1,42 @@
+"""Module with unit tests for fast serializers."""
+import json
+
+from seabattle.helpers.constants import SHIPS_COORDINATES
+from seabattle.game import Game
+from seabattle.listener.serializers import serialize_game_info, serialize_new_ship_info
+from seabattle.listener.validators import validate_create_game_info_response, validate_create_new_ship_response
+
+
+def test_serialize_game_info(game):
+    """
+    Method tests that fast serializer returns the same JSON as schema validation for full and delta game state.
+    Args:
+        game: Game object with ships.
+    """
+    game.start_game()
+    version = game.version
+    game.is_player_move = True
+    game.player_shoot((10, 1))
+    for state in (game.return_game_state(), game.return_game_state(version)):
+        assert json.dumps(serialize_game_info(state)) == json.dumps(validate_create_game_info_response(state))
+
+
+def test_serialize_game_info_with_enemy_shots(game):
+    """
+    Method tests that fast serializer adds not required fields only if they are in game state.
+    Args:
+        game: Game object with ships.
+    """
+    game.start_game()
+    game.is_player_move = False
+    state = {**game.enemy_shoot(), "enemy_shots": [{"x": "3", "y": "3", "sign": "x"}]}
+    assert json.dumps(serialize_game_info(state)) == json.dumps(validate_create_game_info_response(state))
+    assert serialize_game_info(state)["enemyShots"] == [{"x": 3, "y": 3, "sign": "x"}]
+
+
+def test_serialize_new_ship_info():
+    """Method tests that fast serializer returns the same JSON as schema validation for added ship."""
+    game = Game()
+    for coordinates in SHIPS_COORDINATES:
+        data = {**game.player_set_ship(coordinates), "game_id": game.id, "player_id": game.player.id}
+        assert json.dumps(serialize_new_ship_info(data)) == json.dumps(validate_create_new_ship_response(data))
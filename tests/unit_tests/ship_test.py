@@ -53,3 +53,24 @@ def test_is_ship_alive(hit_cells, result):
         ship.ship[coordinate].sign = SignObjects.hit_sign.sign
 
     assert ship.is_ship_alive() == result
+
+
+@pytest.mark.parametrize(
+    ("hits", "result"), [
+        (1, True),
+        (2, False)
+    ]
+)
+def test_register_hit(hits, result):
+    """
+    Method checks if register_hit counts hits and returns correct information about unsunk ship.
+    Args:
+        hits: Number of hits in the ship.
+        result: Expected is_alive value.
+    """
+    ship = Ship({(1, 2): Cell(x=1, y=2), (1, 3): Cell(x=1, y=3)})
+    for _ in range(hits):
+        is_alive = ship.register_hit()
+
+    assert ship.hits == hits
+    assert is_alive == ship.is_alive == result
@@ -0,0 +1,42 @@
+"""Module with unit tests for cache of serialized game states."""
+from seabattle.listener.state_cache import GameStateCache
+
+
+def test_state_is_serialized_once_per_revision(game):
+    """
+    Method tests that game state is serialized only once until game is changed.
+    Args:
+        game: Game object with ships.
+    """
+    cache = GameStateCache()
+    calls = []
+
+    def serialize(cached_game):
+        calls.append(cached_game.version)
+        return str(cached_game.version).encode()
+
+    revision, data = cache.get(game, "json", serialize)
+    assert cache.get(game, "json", serialize) == (revision, data)
+    assert len(calls) == 1
+
+    game.start_game()
+    new_revision, _ = cache.get(game, "json", serialize)
+    assert new_revision != revision
+    assert len(calls) == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_representations_and_discard(game):
+    """
+    Method tests that every representation is cached separately, and discard removes states of the game.
+    Args:
+        game: Game object with ships.
+    """
+    cache = GameStateCache()
+    assert cache.get(game, "json", lambda _: b"json")[1] == b"json"
+    assert cache.get(game, "cbor", lambda _: b"cbor")[1] == b"cbor"
+    assert cache.get(game, "json", lambda _: b"other")[1] == b"json"
+    assert len(cache) == 1
+
+    cache.discard(game.id)
+    assert len(cache) == 0
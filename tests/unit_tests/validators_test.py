@@ -0,0 +1,38 @@
+"""Module with unit tests for request validators."""
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from marshmallow import ValidationError
+
+from seabattle.listener.validators import validate_player_shoot_request
+
+
+def _validate(coordinate: list) -> dict:
+    """
+    Method validates player shoot request and returns loaded data or validation errors.
+    Args:
+        coordinate: Coordinate for shooting.
+
+    Returns:
+        dict: Loaded data or validation errors.
+    """
+    try:
+        return validate_player_shoot_request(
+            {"gameId": str(uuid.UUID(int=1)), "playerId": str(uuid.UUID(int=2)), "coordinate": coordinate}
+        )
+    except ValidationError as ex:
+        return ex.messages  # type: ignore[return-value]
+
+
+@pytest.mark.parametrize("coordinate", [[1, 2], [0, 2]])
+def test_shared_validator_is_thread_safe(coordinate):
+    """
+    Method tests that validator, which is shared between requests, returns the same results from many threads.
+    Args:
+        coordinate: Coordinate for shooting.
+    """
+    expected = _validate(coordinate)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(_validate, [coordinate] * 200))
+    assert all(result == expected for result in results)